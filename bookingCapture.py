@@ -0,0 +1,207 @@
+import os
+import re
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+
+import log
+
+load_dotenv()
+
+CAPTURE_MODE_DOM = "dom"
+CAPTURE_MODE_NETWORK = "network"
+
+captureMode = os.environ.get("BOOKING_CAPTURE_MODE", CAPTURE_MODE_DOM).strip().lower()
+# Booking list XHRs issued by the partner SPA. Override when Naver moves the API.
+bookingApiUrlPattern = os.environ.get(
+    "BOOKING_API_URL_PATTERN", r"partner\.booking\.naver\.com/api/.*booking"
+)
+# Only the booking-list endpoint may supply a month's list; other booking APIs
+# caught by the broad capture pattern (counts, settings) are ignored.
+bookingListApiUrlPattern = re.compile(
+    os.environ.get(
+        "BOOKING_LIST_API_URL_PATTERN",
+        r"partner\.booking\.naver\.com/api/(?:.*/)?bookings/?(?:\?|$)",
+    )
+)
+captureTimeout = float(os.environ.get("BOOKING_CAPTURE_TIMEOUT", "10"))
+
+# The API schema is not documented, so each booking field accepts several
+# candidate keys. The first non-empty one wins.
+API_FIELD_ALIASES = {
+    "name": ("name", "userName", "bookerName", "customerName"),
+    "phone": ("phone", "phoneNumber", "userPhone", "bookerPhone"),
+    "reservationNumber": ("bookingId", "bookingNo", "bookingNumber", "id"),
+    "startDate": ("startDate", "startDateTime", "checkInDate", "useStartDate"),
+    "endDate": ("endDate", "endDateTime", "checkOutDate", "useEndDate"),
+    "room": ("bizItemName", "itemName", "roomName"),
+    "option": ("optionName", "options"),
+    "comment": ("requestMessage", "comment", "memo"),
+    "price": ("totalPrice", "price", "payAmount"),
+    "status": ("bookingStatusName", "statusName", "bookingStatusCode", "status"),
+}
+API_LIST_KEYS = ("bookings", "bookingList", "items", "content", "list", "data", "result")
+# Paging fields next to the list. Any of them saying more pages exist means the
+# captured response is only part of the month.
+API_TOTAL_KEYS = ("totalCount", "totalElements")
+API_HAS_NEXT_KEYS = ("hasNext", "hasMore", "hasNextPage")
+CANCELLED_STATUS_CODES = {"RC04", "CANCELLED", "CANCELED", "CANCEL"}
+CANCELLED_STATUS_TEXT = "취소"
+
+_DATE_PATTERN = re.compile(r"(\d{4})-?(\d{2})-?(\d{2})")
+
+
+def isEnabled() -> bool:
+    return captureMode == CAPTURE_MODE_NETWORK
+
+
+def extractBookingListFromResponses(responses: Iterable[dict]) -> Optional[list]:
+    """
+    Map captured booking-list API responses to the bookingListExtractor dict schema.
+    Returns None when no booking-list endpoint response is usable, so the
+    caller can fall back to DOM parsing. Paginated responses with more pages
+    also return None because only the first page was captured.
+    """
+    # The SPA may fire several matching requests; the latest list wins.
+    for response in reversed(list(responses or [])):
+        if (response.get("status") or 200) >= 400:
+            continue
+        if not bookingListApiUrlPattern.search(response.get("url") or ""):
+            continue
+        found = _findBookingRecords(response.get("body"))
+        if found is None:
+            continue
+        records, container = found
+        if _hasMorePages(container, len(records)) or _hasMorePages(
+            response.get("body"), len(records)
+        ):
+            log.info(
+                f"Captured booking response has more pages; falling back to DOM: {response.get('url')}"
+            )
+            return None
+        bookingList = [mapApiBooking(record) for record in records]
+        if any(
+            not booking["reservationNumber"] or not booking["startDate"]
+            for booking in bookingList
+        ):
+            log.info(
+                f"Captured booking response is missing required fields: {response.get('url')}"
+            )
+            return None
+        return bookingList
+    return None
+
+
+def mapApiBooking(record: dict) -> dict:
+    bookingInfo = {}
+    for field in (
+        "name",
+        "phone",
+        "reservationNumber",
+        "startDate",
+        "endDate",
+        "room",
+        "option",
+        "comment",
+        "price",
+        "status",
+    ):
+        value = _pickField(record, API_FIELD_ALIASES[field])
+        if field in ("startDate", "endDate"):
+            value = _normalizeDate(value)
+        elif field == "option":
+            value = _normalizeOption(value)
+        elif field == "price":
+            value = _normalizePrice(value)
+        elif field == "status":
+            value = _normalizeStatus(value)
+        elif value is not None:
+            value = str(value).strip()
+        bookingInfo[field] = value
+    return bookingInfo
+
+
+def _findBookingRecords(payload, depth: int = 0, container=None) -> Optional[tuple]:
+    """(records, dict holding them) for the first list whose records all look like bookings."""
+    if depth > 4:
+        return None
+    if isinstance(payload, list):
+        if all(isinstance(item, dict) and _looksLikeBooking(item) for item in payload):
+            return payload, container
+        return None
+    if not isinstance(payload, dict):
+        return None
+    for key in API_LIST_KEYS:
+        if key in payload:
+            found = _findBookingRecords(payload[key], depth + 1, payload)
+            if found is not None:
+                return found
+    return None
+
+
+def _hasMorePages(container, recordCount: int) -> bool:
+    if not isinstance(container, dict):
+        return False
+    for key in API_HAS_NEXT_KEYS:
+        if container.get(key) is True:
+            return True
+    if container.get("last") is False:
+        return True
+    for key in API_TOTAL_KEYS:
+        total = container.get(key)
+        if isinstance(total, int) and total > recordCount:
+            return True
+    # Only one response is used, so any multi-page month is incomplete.
+    totalPages = container.get("totalPages")
+    return isinstance(totalPages, int) and totalPages > 1
+
+
+def _looksLikeBooking(record: dict) -> bool:
+    return (
+        _pickField(record, API_FIELD_ALIASES["reservationNumber"]) is not None
+        and _pickField(record, API_FIELD_ALIASES["startDate"]) is not None
+    )
+
+
+def _pickField(record: dict, aliases: tuple):
+    for alias in aliases:
+        value = record.get(alias)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _normalizeDate(value) -> Optional[str]:
+    if value is None:
+        return None
+    match = _DATE_PATTERN.search(str(value))
+    if match is None:
+        return None
+    return "".join(match.groups())
+
+
+def _normalizeOption(value) -> Optional[str]:
+    if isinstance(value, list):
+        names = [
+            str(item.get("name") or item.get("optionName") or "").strip()
+            if isinstance(item, dict)
+            else str(item).strip()
+            for item in value
+        ]
+        return ", ".join(name for name in names if name) or None
+    return str(value).strip() if value is not None else None
+
+
+def _normalizePrice(value) -> Optional[str]:
+    if isinstance(value, (int, float)):
+        return f"{int(value):,}원"
+    return str(value).strip() if value is not None else None
+
+
+def _normalizeStatus(value) -> Optional[str]:
+    if value is None:
+        return None
+    status = str(value).strip()
+    if status.upper() in CANCELLED_STATUS_CODES:
+        return CANCELLED_STATUS_TEXT
+    return status
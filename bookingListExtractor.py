@@ -1,5 +1,22 @@
+import hashlib
+import os
+import re
+
 from bs4 import BeautifulSoup as bs
 
+import log
+
+# Optional C-backed parsers; bs4 + html.parser stays the fallback.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # type: ignore
+
+try:
+    import lxml.html as lxmlHtml
+except ImportError:
+    lxmlHtml = None  # type: ignore
+
 EMPTY_BOOKING_LIST_MARKERS = (
     "조회된 예약내역이 없습니다.",
     "조회된 예약 내역이 없습니다.",
@@ -7,23 +24,196 @@ EMPTY_BOOKING_LIST_MARKERS = (
     "기간과 기준, 필터를 확인한 후 다시 조회해 주세요.",
 )
 
+BOOKING_CARD_SELECTOR = 'a[class^="BookingListView__contents-user"]'
+BOOKING_CARD_CLASS_PREFIX = "BookingListView__contents-user"
+# (field, class marker) pairs matched against each div inside a booking card,
+# same `[class*=...]` semantics as the bs4 selectors in extractBookingInfo.
+BOOKING_FIELD_CLASS_MARKERS = (
+    ("name", "BookingListView__name"),
+    ("phone", "BookingListView__phone"),
+    ("reservationNumber", "BookingListView__book-number"),
+    ("dateInfo", "BookingListView__book-date"),
+    ("room", "BookingListView__host"),
+    ("option", "BookingListView__option"),
+    ("comment", "BookingListView__comment"),
+    ("price", "BookingListView__total-price"),
+    ("status", "BookingListView__state"),
+)
+SPAN_TEXT_FIELDS = ("name", "phone", "status")
+# Booking cards are <a> elements, which cannot nest, so a lazy match is exact.
+BOOKING_CARD_PATTERN = re.compile(
+    r'<a\b[^>]*class="' + BOOKING_CARD_CLASS_PREFIX + r'[^"]*"[^>]*>.*?</a>', re.DOTALL
+)
+
+PARSER_BACKEND_AUTO = "auto"
+PARSER_BACKEND_SELECTOLAX = "selectolax"
+PARSER_BACKEND_LXML = "lxml"
+PARSER_BACKEND_BS4 = "bs4"
+parserBackend = os.environ.get("BOOKING_LIST_PARSER", PARSER_BACKEND_AUTO).strip().lower()
+
+
+def resolveParserBackend(requested: str = None) -> str:
+    requested = (requested or parserBackend or PARSER_BACKEND_AUTO).lower()
+    available = {
+        PARSER_BACKEND_SELECTOLAX: LexborHTMLParser is not None,
+        PARSER_BACKEND_LXML: lxmlHtml is not None,
+        PARSER_BACKEND_BS4: True,
+    }
+    if requested == PARSER_BACKEND_AUTO:
+        for backend in (PARSER_BACKEND_SELECTOLAX, PARSER_BACKEND_LXML):
+            if available[backend]:
+                return backend
+        return PARSER_BACKEND_BS4
+    if available.get(requested):
+        return requested
+    log.info(f"Booking list parser '{requested}' unavailable; falling back to bs4")
+    return PARSER_BACKEND_BS4
+
+
+def parseBookingListPage(html: str, backend: str = None) -> tuple:
+    """
+    Parse a booking list page once.
+    Returns (bookingInfoList, hasEmptyState).
+    """
+    resolvedBackend = resolveParserBackend(backend)
+    if resolvedBackend == PARSER_BACKEND_SELECTOLAX:
+        return _parseWithSelectolax(html)
+    if resolvedBackend == PARSER_BACKEND_LXML:
+        try:
+            return _parseWithLxml(html)
+        except (ValueError, lxmlHtml.etree.ParserError):
+            # lxml rejects empty/fragmentary documents that html.parser accepts.
+            return _parseWithBs4(html)
+    return _parseWithBs4(html)
+
 
 def extractBookingList(html: str) -> list:
-    soup = bs(html, "html.parser")
-    bookingList = soup.select('a[class^="BookingListView__contents-user"]')
-    bookingInfoList = list(map(extractBookingInfo, bookingList))
+    bookingInfoList, _ = parseBookingListPage(html)
     return bookingInfoList
 
 
+def fingerprintBookingCards(html: str) -> str:
+    """
+    Hash of the raw booking card markup, computed without parsing the page.
+    Returns "" when the page has no cards.
+    """
+    cards = BOOKING_CARD_PATTERN.findall(html or "")
+    if not cards:
+        return ""
+    digest = hashlib.sha256()
+    for card in cards:
+        digest.update(card.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def hasBookingListEmptyText(text: str) -> bool:
     normalizedText = " ".join((text or "").split())
     return any(marker in normalizedText for marker in EMPTY_BOOKING_LIST_MARKERS)
 
 
 def hasBookingListEmptyState(html: str) -> bool:
+    bookingInfoList, hasEmptyState = parseBookingListPage(html)
+    return len(bookingInfoList) == 0 and hasEmptyState
+
+
+def _parseWithBs4(html: str) -> tuple:
     soup = bs(html, "html.parser")
-    bodyText = soup.get_text(" ", strip=True)
-    return hasBookingListEmptyText(bodyText)
+    bookingList = soup.select(BOOKING_CARD_SELECTOR)
+    bookingInfoList = list(map(extractBookingInfo, bookingList))
+    if bookingInfoList:
+        return bookingInfoList, False
+    return bookingInfoList, hasBookingListEmptyText(soup.get_text(" ", strip=True))
+
+
+def _parseWithLxml(html: str) -> tuple:
+    root = lxmlHtml.fromstring(html)
+    bookingInfoList = []
+    for card in root.iter("a"):
+        if not (card.get("class") or "").startswith(BOOKING_CARD_CLASS_PREFIX):
+            continue
+        fields = _classifyCardFields(
+            (div, div.get("class") or "") for div in card.iter("div")
+        )
+        bookingInfoList.append(
+            _buildBookingInfo(fields, _lxmlText, _lxmlSpanText)
+        )
+    if bookingInfoList:
+        return bookingInfoList, False
+    return bookingInfoList, hasBookingListEmptyText(" ".join(root.itertext()))
+
+
+def _lxmlText(element) -> str:
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _lxmlSpanText(element):
+    span = next(element.iter("span"), None)
+    return _lxmlText(span) if span is not None else None
+
+
+def _parseWithSelectolax(html: str) -> tuple:
+    tree = LexborHTMLParser(html)
+    bookingInfoList = []
+    for card in tree.css(BOOKING_CARD_SELECTOR):
+        fields = _classifyCardFields(
+            (node, node.attributes.get("class") or "")
+            for node in card.traverse()
+            if node.tag == "div"
+        )
+        bookingInfoList.append(
+            _buildBookingInfo(fields, _selectolaxText, _selectolaxSpanText)
+        )
+    if bookingInfoList:
+        return bookingInfoList, False
+    body = tree.body if tree.body is not None else tree.root
+    bodyText = body.text(separator=" ") if body is not None else ""
+    return bookingInfoList, hasBookingListEmptyText(bodyText)
+
+
+def _selectolaxText(node) -> str:
+    return node.text(deep=True, strip=True)
+
+
+def _selectolaxSpanText(node):
+    span = node.css_first("span")
+    return _selectolaxText(span) if span is not None else None
+
+
+def _classifyCardFields(divs) -> dict:
+    # Single pass over the card's divs in document order; the first div
+    # matching a marker wins, as select_one would.
+    fields = {}
+    for div, classAttr in divs:
+        if not classAttr:
+            continue
+        for field, marker in BOOKING_FIELD_CLASS_MARKERS:
+            if field not in fields and marker in classAttr:
+                fields[field] = div
+        if len(fields) == len(BOOKING_FIELD_CLASS_MARKERS):
+            break
+    return fields
+
+
+def _buildBookingInfo(fields: dict, getText, getSpanText) -> dict:
+    dateInfo = fields.get("dateInfo")
+    startDate, endDate = (
+        getStartEndDate(getText(dateInfo)) if dateInfo is not None else (None, None)
+    )
+    bookingInfo = {}
+    for field, _ in BOOKING_FIELD_CLASS_MARKERS:
+        if field == "dateInfo":
+            bookingInfo["startDate"] = startDate
+            bookingInfo["endDate"] = endDate
+            continue
+        element = fields.get(field)
+        if element is None:
+            bookingInfo[field] = None
+        elif field in SPAN_TEXT_FIELDS:
+            bookingInfo[field] = getSpanText(element)
+        else:
+            bookingInfo[field] = getText(element)
+    return bookingInfo
 
 
 def extractBookingInfo(booking: bs) -> dict:
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+
+import log
+
+load_dotenv()
+
+# Empty path disables the store; /sync/out then behaves exactly as before.
+SNAPSHOT_DB_PATH = os.getenv("BOOKING_SNAPSHOT_DB", "").strip()
+
+CHANGE_ADDED = "added"
+CHANGE_MODIFIED = "modified"
+CHANGE_CANCELLED = "cancelled"
+CANCELLED_STATUS = "취소"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookings (
+    reservationNumber TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    cancelled INTEGER NOT NULL,
+    updatedAt REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    reservationNumber TEXT NOT NULL,
+    changeType TEXT NOT NULL,
+    createdAt REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS month_fingerprints (
+    monthKey TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updatedAt REAL NOT NULL
+);
+"""
+
+
+def fingerprintBooking(booking: dict) -> str:
+    payload = json.dumps(booking, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _isCancelled(booking: dict) -> bool:
+    return str(booking.get("status") or "").strip() == CANCELLED_STATUS
+
+
+class BookingSnapshotStore:
+    """
+    SQLite snapshot of scraped bookings keyed by reservationNumber.
+
+    Every observed difference is appended to `changes`, whose autoincrement
+    `seq` doubles as the cursor handed to /sync/out callers. Month
+    fingerprints let unchanged booking-list pages reuse the stored dicts
+    instead of being parsed again.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def isEnabled(self) -> bool:
+        return bool(self.path)
+
+    def recordBookings(self, bookingList: Iterable[dict]) -> dict:
+        now = time.time()
+        counts = {CHANGE_ADDED: 0, CHANGE_MODIFIED: 0, CHANGE_CANCELLED: 0}
+        with self._connect() as connection:
+            for booking in bookingList:
+                reservationNumber = booking.get("reservationNumber")
+                if not reservationNumber:
+                    continue
+                fingerprint = fingerprintBooking(booking)
+                cancelled = _isCancelled(booking)
+                row = connection.execute(
+                    "SELECT fingerprint, cancelled FROM bookings WHERE reservationNumber = ?",
+                    (reservationNumber,),
+                ).fetchone()
+                if row is not None and row[0] == fingerprint:
+                    continue
+
+                if cancelled and (row is None or not row[1]):
+                    changeType = CHANGE_CANCELLED
+                elif row is None:
+                    changeType = CHANGE_ADDED
+                else:
+                    changeType = CHANGE_MODIFIED
+                connection.execute(
+                    "INSERT OR REPLACE INTO bookings "
+                    "(reservationNumber, payload, fingerprint, cancelled, updatedAt) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        reservationNumber,
+                        json.dumps(booking, ensure_ascii=False, default=str),
+                        fingerprint,
+                        int(cancelled),
+                        now,
+                    ),
+                )
+                connection.execute(
+                    "INSERT INTO changes (reservationNumber, changeType, createdAt) "
+                    "VALUES (?, ?, ?)",
+                    (reservationNumber, changeType, now),
+                )
+                counts[changeType] += 1
+            cursor = self._latestCursor(connection)
+
+        log.info(f"Booking snapshot updated: cursor={cursor}, changes={counts}")
+        return {"cursor": cursor, "changes": counts}
+
+    def getChangesSince(self, cursor: Optional[int] = None) -> dict:
+        """
+        Collapse changes after `cursor` into one entry per booking.
+        A booking added and then modified after the cursor is still reported as added.
+        """
+        cursor = int(cursor or 0)
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT c.reservationNumber, c.changeType, b.payload "
+                "FROM changes c JOIN bookings b ON b.reservationNumber = c.reservationNumber "
+                "WHERE c.seq > ? ORDER BY c.seq",
+                (cursor,),
+            ).fetchall()
+            latestCursor = self._latestCursor(connection)
+
+        changeTypes = {}
+        payloads = {}
+        for reservationNumber, changeType, payload in rows:
+            previous = changeTypes.get(reservationNumber)
+            if changeType == CHANGE_CANCELLED or previous is None:
+                changeTypes[reservationNumber] = changeType
+            elif previous != CHANGE_ADDED:
+                changeTypes[reservationNumber] = changeType
+            payloads[reservationNumber] = payload
+
+        result = {
+            "cursor": latestCursor,
+            CHANGE_ADDED: [],
+            CHANGE_MODIFIED: [],
+            CHANGE_CANCELLED: [],
+        }
+        for reservationNumber, changeType in changeTypes.items():
+            result[changeType].append(json.loads(payloads[reservationNumber]))
+        return result
+
+    def getCursor(self) -> int:
+        with self._connect() as connection:
+            return self._latestCursor(connection)
+
+    def getMonthBookings(self, monthKey: str, fingerprint: str) -> Optional[list]:
+        """Parsed bookings for a month whose card fingerprint is unchanged, else None."""
+        if not monthKey or not fingerprint:
+            return None
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT fingerprint, payload FROM month_fingerprints WHERE monthKey = ?",
+                (monthKey,),
+            ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        return json.loads(row[1])
+
+    def saveMonthFingerprint(self, monthKey: str, fingerprint: str, bookingList: list):
+        if not monthKey or not fingerprint:
+            return
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO month_fingerprints "
+                "(monthKey, fingerprint, payload, updatedAt) VALUES (?, ?, ?, ?)",
+                (
+                    monthKey,
+                    fingerprint,
+                    json.dumps(bookingList, ensure_ascii=False, default=str),
+                    time.time(),
+                ),
+            )
+
+    def _latestCursor(self, connection) -> int:
+        row = connection.execute("SELECT MAX(seq) FROM changes").fetchone()
+        return int(row[0] or 0)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per call, serialised in-process.
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10)
+            try:
+                if not self._initialized:
+                    connection.executescript(_SCHEMA)
+                    self._initialized = True
+                yield connection
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                connection.close()
+
+
+snapshotStore = BookingSnapshotStore()
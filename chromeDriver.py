@@ -1,8 +1,14 @@
 import atexit
+import cookieStore
 import driver
+import hashlib
+import json
 import logging
+import metrics
 import os
 import platform
+import re
+import select
 import shutil
 import signal
 import subprocess
@@ -22,6 +28,7 @@ else:
 import pyperclip
 import undetected_chromedriver as uc
 from dotenv import load_dotenv
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -37,13 +44,117 @@ FORCE_KILL_SIGNAL = getattr(signal, "SIGKILL", signal.SIGTERM)
 # FD monitoring thresholds
 FD_WARNING_THRESHOLD = int(os.getenv("FD_WARNING_THRESHOLD", "800"))
 FD_CRITICAL_THRESHOLD = int(os.getenv("FD_CRITICAL_THRESHOLD", "950"))
+# Seconds between background /proc/self/fd samples; 0 lists the directory on every call.
+FD_MONITOR_INTERVAL = float(os.getenv("FD_MONITOR_INTERVAL", "2.0"))
 MAX_CONCURRENT_BROWSERS = int(os.getenv("MAX_CONCURRENT_BROWSERS", "3"))
 
+# Memory admission: BROWSER_MEMORY_BUDGET_MB > 0 caps the summed PSS of all
+# live browser process trees. A new browser is admitted only if the budget
+# and the host's MemAvailable (minus HOST_MEMORY_RESERVE_MB) still fit one
+# more browser, sized by the average live browser or BROWSER_MEMORY_ESTIMATE_MB.
+BROWSER_MEMORY_BUDGET_MB = int(os.getenv("BROWSER_MEMORY_BUDGET_MB", "0"))
+BROWSER_MEMORY_ESTIMATE_MB = int(os.getenv("BROWSER_MEMORY_ESTIMATE_MB", "400"))
+HOST_MEMORY_RESERVE_MB = int(os.getenv("HOST_MEMORY_RESERVE_MB", "256"))
+# Queued admits wake when a browser closes; this only bounds the wait for
+# memory freed outside this process.
+MEMORY_ADMISSION_RECHECK_INTERVAL = 5.0
+
 # Timeout configurations (seconds)
 BROWSER_STARTUP_TIMEOUT = int(os.getenv("BROWSER_STARTUP_TIMEOUT", "60"))
 BROWSER_CLEANUP_TIMEOUT = int(os.getenv("BROWSER_CLEANUP_TIMEOUT", "10"))
 PROCESS_KILL_TIMEOUT = int(os.getenv("PROCESS_KILL_TIMEOUT", "5"))
 PROFILE_LOCK_TIMEOUT = int(os.getenv("PROFILE_LOCK_TIMEOUT", "30"))
+# Liveness poll interval for processes that cannot be waited on through a pidfd.
+PID_POLL_INTERVAL = 0.1
+
+# CHROME_PROCESS_ISOLATION contains each browser so teardown is one kill:
+# "session" signals the browser's own process group (uc starts Chrome with
+# setsid unless UC_USE_SUBPROCESS is set), "cgroup" moves driver and browser
+# into "<CHROME_CGROUP_ROOT>/chrome-<pid>-<n>" (a delegated, writable cgroup v2
+# directory) with optional memory.max / cpu.max limits and tears it down with
+# cgroup.kill. "cgroup" falls back to "session" when the cgroup cannot be used.
+CHROME_PROCESS_ISOLATION = os.getenv("CHROME_PROCESS_ISOLATION", "none").strip().lower()
+CHROME_CGROUP_ROOT = os.getenv("CHROME_CGROUP_ROOT", "").strip()
+CHROME_CGROUP_MEMORY_MAX = os.getenv("CHROME_CGROUP_MEMORY_MAX", "").strip()  # e.g. "1536M"
+CHROME_CGROUP_CPU_MAX = os.getenv("CHROME_CGROUP_CPU_MAX", "").strip()  # e.g. "100000 100000"
+CONTAINER_TERM_GRACE = 0.5
+
+# CHROME_PROFILE_SLOTS > 1 gives every concurrent browser its own profile
+# directory under "{CHROME_PROFILE_PATH}-slots/profile-<i>" instead of
+# serializing all of them on CHROME_PROFILE_PATH.
+CHROME_PROFILE_SLOTS = int(os.getenv("CHROME_PROFILE_SLOTS", "0"))
+PROFILE_SLOT_RETRY_INTERVAL = 1.0
+
+# Warm browser pool configuration
+BROWSER_POOL_ENABLED = os.getenv("BROWSER_POOL_ENABLED", "").strip().lower() in (
+    "1", "true", "yes", "on"
+)
+BROWSER_POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES", "20"))
+BROWSER_POOL_IDLE_TTL = float(os.getenv("BROWSER_POOL_IDLE_TTL", "300"))
+
+# ASYNC_BROWSER_TEARDOWN closes finished browsers on a background thread, so
+# responses go out before Chrome is reaped. The browser slot is released
+# only after close() has finished.
+ASYNC_BROWSER_TEARDOWN = os.getenv("ASYNC_BROWSER_TEARDOWN", "").strip().lower() in (
+    "1", "true", "yes", "on"
+)
+
+# goTo() wait strategy: "fixed" sleeps 3s after every navigation, "ready" only
+# waits for document.readyState and leaves pacing to the caller.
+NAVIGATION_WAIT_MODE = os.getenv("NAVIGATION_WAIT_MODE", "fixed").strip().lower()
+NAVIGATION_READY_TIMEOUT = float(os.getenv("NAVIGATION_READY_TIMEOUT", "15"))
+
+# BOOKING_CAPTURE_MODE=network turns on the Chrome performance log so CDP
+# Network events (and response bodies) can be read back after navigation.
+NETWORK_CAPTURE_ENABLED = (
+    os.getenv("BOOKING_CAPTURE_MODE", "dom").strip().lower() == "network"
+)
+NETWORK_CAPTURE_POLL_INTERVAL = 0.2
+
+# CHROME_LAUNCH_PROFILE picks the launch flag set:
+# - "default": the flags used so far
+# - "minimal": no images/media/fonts, no background services or extensions,
+#   at most CHROME_RENDERER_PROCESS_LIMIT renderers
+# - "diagnostic": full rendering with a fixed device scale factor for screenshots
+# "minimal" is switched to "diagnostic" while ENABLE_DOM_DIAGNOSTICS is on,
+# so diagnostic screenshots keep images and fonts.
+LAUNCH_PROFILE_DEFAULT = "default"
+LAUNCH_PROFILE_MINIMAL = "minimal"
+LAUNCH_PROFILE_DIAGNOSTIC = "diagnostic"
+CHROME_LAUNCH_PROFILE = os.getenv("CHROME_LAUNCH_PROFILE", LAUNCH_PROFILE_DEFAULT).strip().lower()
+CHROME_RENDERER_PROCESS_LIMIT = int(os.getenv("CHROME_RENDERER_PROCESS_LIMIT", "2"))
+DOM_DIAGNOSTICS_ENABLED = os.getenv("ENABLE_DOM_DIAGNOSTICS", "").strip().lower() in (
+    "1", "true", "yes", "on"
+)
+MINIMAL_PROFILE_ARGUMENTS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+)
+DIAGNOSTIC_PROFILE_ARGUMENTS = (
+    "--force-device-scale-factor=1",
+)
+# Applied per session through CDP rather than prefs, so nothing is
+# persisted into a profile that a later diagnostic session may reuse.
+MINIMAL_PROFILE_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+]
+
+# Patched chromedriver binaries are cached per Chrome major version as
+# "<dir>/<version>/chromedriver" next to a ".sha256" checksum, and every
+# browser launches that file directly. An empty dir disables the cache.
+CHROMEDRIVER_VERSION_MAIN = int(os.getenv("CHROMEDRIVER_VERSION_MAIN", "146"))
+CHROMEDRIVER_CACHE_DIR = os.getenv(
+    "CHROMEDRIVER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "yeoyeo-scraper", "chromedriver"),
+).strip()
 
 # Global browser semaphore for concurrency control
 _browser_semaphore = threading.Semaphore(MAX_CONCURRENT_BROWSERS)
@@ -53,20 +164,173 @@ _profile_locks: dict = {}  # profile_path -> (lock_file_handle, lock_file_path)
 _profile_locks_mutex = threading.Lock()
 
 
+# =============================================================================
+# File Descriptor Monitoring
+# =============================================================================
+
+def _classify_fd_target(target: str) -> str:
+    if target.startswith("socket:"):
+        return "socket"
+    if target.startswith("pipe:"):
+        return "pipe"
+    if target.startswith("anon_inode:"):
+        return "anon_inode"
+    return "file"
+
+
+class FDMonitor:
+    """
+    Background sampler for the process FD count.
+
+    Listing /proc/self/fd allocates one entry per open descriptor, which gets
+    expensive exactly when FD usage is high, and the hot path used to do it
+    several times per request. The sampler lists the directory every
+    `interval` seconds, keeping the latest count, a high-water mark and a
+    breakdown by FD type (socket, pipe, anon_inode, file) for leak hunting;
+    `count()` only reads the cached value. With `interval <= 0` the sampler
+    is disabled and `count()` lists the directory on every call as before.
+    """
+
+    FD_DIR = "/proc/self/fd"
+
+    def __init__(self, interval: float = FD_MONITOR_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._count = -1
+        self._high_water_mark = -1
+        self._breakdown: dict = {}
+        self._sampled_at: Optional[float] = None
+
+    def is_enabled(self) -> bool:
+        return self.interval > 0
+
+    def count(self) -> int:
+        if not self.is_enabled():
+            return self._sample_count()
+        self.start()
+        with self._lock:
+            return self._count
+
+    def high_water_mark(self) -> int:
+        with self._lock:
+            return self._high_water_mark
+
+    def breakdown(self) -> dict:
+        with self._lock:
+            return dict(self._breakdown)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "count": self._count,
+                "highWaterMark": self._high_water_mark,
+                "byType": dict(self._breakdown),
+                "sampledAt": self._sampled_at,
+            }
+
+    def start(self):
+        """Take a first sample synchronously and start the sampler thread (idempotent)."""
+        if not self.is_enabled():
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Sampled before the thread is published, so a concurrent count()
+            # that sees a started monitor never reads the -1 placeholder.
+            count, breakdown = self._sample_breakdown()
+            self._store_sample(count, breakdown)
+            self._stop_event.clear()
+            thread = threading.Thread(
+                target=self._run, name="fd-monitor", daemon=True
+            )
+            thread.start()
+            self._thread = thread
+        self._publish_breakdown(breakdown)
+
+    def stop(self, timeout: float = 1.0):
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        self._stop_event.set()
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=timeout)
+
+    def sample(self) -> int:
+        """List the FD directory once and refresh count, high-water mark and breakdown."""
+        count, breakdown = self._sample_breakdown()
+        with self._lock:
+            self._store_sample(count, breakdown)
+        self._publish_breakdown(breakdown)
+        return count
+
+    def _store_sample(self, count: int, breakdown: dict):
+        """Record a sample; the caller holds `_lock`."""
+        self._count = count
+        if count > self._high_water_mark:
+            self._high_water_mark = count
+        self._breakdown = breakdown
+        self._sampled_at = time.perf_counter()
+
+    @staticmethod
+    def _publish_breakdown(breakdown: dict):
+        for fd_type, fd_type_count in breakdown.items():
+            _open_fds_by_type.set(fd_type_count, type=fd_type)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("FD monitor sample failed")
+
+    def _sample_count(self) -> int:
+        if platform.system() == "Windows":
+            return -1
+        try:
+            if os.path.isdir(self.FD_DIR):
+                return len(os.listdir(self.FD_DIR))
+            # macOS fallback
+            import resource
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            return soft  # Return limit as approximation
+        except Exception:
+            return -1
+
+    def _sample_breakdown(self):
+        if platform.system() == "Windows" or not os.path.isdir(self.FD_DIR):
+            return self._sample_count(), {}
+        try:
+            fds = os.listdir(self.FD_DIR)
+        except OSError:
+            return -1, {}
+        breakdown = {"socket": 0, "pipe": 0, "anon_inode": 0, "file": 0}
+        for fd in fds:
+            try:
+                target = os.readlink(os.path.join(self.FD_DIR, fd))
+            except OSError:
+                # Closed between listdir and readlink (including the listdir FD itself)
+                continue
+            breakdown[_classify_fd_target(target)] += 1
+        return len(fds), breakdown
+
+
+_open_fds_by_type = metrics.registry.gauge(
+    "scraper_open_fds_by_type", "Open file descriptors by type at the last FD monitor sample.",
+    ("type",),
+)
+_fd_monitor = FDMonitor()
+
+
 def get_fd_count() -> int:
-    """Get current process file descriptor count (Linux/macOS only)."""
-    if platform.system() == "Windows":
-        return -1
-    try:
-        fd_dir = "/proc/self/fd"
-        if os.path.isdir(fd_dir):
-            return len(os.listdir(fd_dir))
-        # macOS fallback
-        import resource
-        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
-        return soft  # Return limit as approximation
-    except Exception:
-        return -1
+    """Get current process file descriptor count from the FD monitor (Linux/macOS only)."""
+    return _fd_monitor.count()
+
+
+def get_fd_high_water_mark() -> int:
+    """Get the highest FD count the monitor has sampled (-1 before the first sample)."""
+    return _fd_monitor.high_water_mark()
 
 
 def get_fd_limit() -> int:
@@ -99,13 +363,13 @@ def log_fd_status(context: str = ""):
     
     if fd_count >= FD_CRITICAL_THRESHOLD:
         logger.critical(
-            "%sFD CRITICAL: %d/%d (%.1f%%) - Risk of 'Too many open files' error",
-            prefix, fd_count, fd_limit, fd_percentage
+            "%sFD CRITICAL: %d/%d (%.1f%%) by type %s - Risk of 'Too many open files' error",
+            prefix, fd_count, fd_limit, fd_percentage, _fd_monitor.breakdown()
         )
     elif fd_count >= FD_WARNING_THRESHOLD:
         logger.warning(
-            "%sFD WARNING: %d/%d (%.1f%%) - Consider reducing concurrent browsers",
-            prefix, fd_count, fd_limit, fd_percentage
+            "%sFD WARNING: %d/%d (%.1f%%) by type %s - Consider reducing concurrent browsers",
+            prefix, fd_count, fd_limit, fd_percentage, _fd_monitor.breakdown()
         )
     else:
         logger.info(
@@ -120,6 +384,19 @@ def get_active_driver_count() -> int:
         return len(_active_drivers)
 
 
+def resolve_launch_profile(
+    requested: str = CHROME_LAUNCH_PROFILE,
+    diagnostics_enabled: bool = DOM_DIAGNOSTICS_ENABLED,
+) -> str:
+    """Launch profile to use, falling back to full rendering for diagnostics."""
+    if requested not in (LAUNCH_PROFILE_DEFAULT, LAUNCH_PROFILE_MINIMAL, LAUNCH_PROFILE_DIAGNOSTIC):
+        logger.warning("Unknown CHROME_LAUNCH_PROFILE=%r, using default", requested)
+        return LAUNCH_PROFILE_DEFAULT
+    if requested == LAUNCH_PROFILE_MINIMAL and diagnostics_enabled:
+        return LAUNCH_PROFILE_DIAGNOSTIC
+    return requested
+
+
 def cleanup_all_drivers():
     """Emergency cleanup of all tracked drivers."""
     with _driver_lock:
@@ -145,12 +422,80 @@ atexit.register(cleanup_all_drivers)
 
 _patcher_lock = threading.Lock()
 _patcher_initialized = False
+_cached_chromedriver_paths: dict = {}  # version_main -> verified cached binary path
 
 
-def ensure_chromedriver_patched(version_main: int = 146, timeout: float = 120.0) -> bool:
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _chromedriver_cache_path(version_main: int) -> str:
+    exe_name = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+    return os.path.join(CHROMEDRIVER_CACHE_DIR, str(version_main), exe_name)
+
+
+def _verify_cached_chromedriver(path: str) -> bool:
+    """Cached binary exists and still matches the checksum recorded when it was stored."""
+    try:
+        with open(f"{path}.sha256", "r") as f:
+            expected = f.read().strip()
+        return bool(expected) and _file_sha256(path) == expected
+    except OSError:
+        return False
+
+
+def _store_cached_chromedriver(source_path: str, version_main: int) -> Optional[str]:
+    """Copy a freshly patched binary into the cache atomically and record its checksum."""
+    target_path = _chromedriver_cache_path(version_main)
+    temp_path = f"{target_path}.{os.getpid()}.tmp"
+    checksum_temp_path = f"{target_path}.sha256.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        shutil.copy2(source_path, temp_path)
+        os.chmod(temp_path, 0o755)
+        checksum = _file_sha256(temp_path)
+        with open(checksum_temp_path, "w") as f:
+            f.write(checksum)
+        os.replace(temp_path, target_path)
+        os.replace(checksum_temp_path, f"{target_path}.sha256")
+    except OSError:
+        logger.exception("Failed to cache patched chromedriver: %s", target_path)
+        return None
+    logger.info("Cached patched chromedriver: %s (sha256=%s)", target_path, checksum[:12])
+    return target_path
+
+
+def get_cached_chromedriver_path(version_main: int = CHROMEDRIVER_VERSION_MAIN) -> Optional[str]:
+    """
+    Path of the verified patched chromedriver for `version_main`, or None.
+    The checksum is verified once per process; later calls only check the file exists.
+    """
+    if not CHROMEDRIVER_CACHE_DIR:
+        return None
+    cached_path = _cached_chromedriver_paths.get(version_main)
+    if cached_path and os.path.isfile(cached_path):
+        return cached_path
+
+    path = _chromedriver_cache_path(version_main)
+    if not _verify_cached_chromedriver(path):
+        return None
+    _cached_chromedriver_paths[version_main] = path
+    return path
+
+
+def ensure_chromedriver_patched(
+    version_main: int = CHROMEDRIVER_VERSION_MAIN, timeout: float = 120.0
+) -> bool:
     """
     Ensure chromedriver is patched before any browser instances are created.
     Call this once at server startup to avoid patching race conditions.
+
+    A verified binary already in the chromedriver cache is reused as-is;
+    otherwise the freshly patched binary is copied into the cache.
     
     Returns:
         True if patching succeeded or was already done, False otherwise
@@ -161,15 +506,22 @@ def ensure_chromedriver_patched(version_main: int = 146, timeout: float = 120.0)
         if _patcher_initialized:
             logger.debug("Chromedriver already patched, skipping")
             return True
+
+        cached_path = get_cached_chromedriver_path(version_main)
+        if cached_path:
+            logger.info("Using cached patched chromedriver: %s", cached_path)
+            _patcher_initialized = True
+            return True
         
         logger.info("Pre-patching chromedriver for version %d (timeout=%.0fs)...", version_main, timeout)
         
-        patch_result = {"success": False, "error": None}
+        patch_result = {"success": False, "error": None, "executable_path": None}
         
         def do_patch():
             try:
                 patcher = uc.Patcher(version_main=version_main)
                 patcher.auto()
+                patch_result["executable_path"] = patcher.executable_path
                 patch_result["success"] = True
                 logger.info("Chromedriver patched successfully: %s", patcher.executable_path)
             except Exception as e:
@@ -185,6 +537,12 @@ def ensure_chromedriver_patched(version_main: int = 146, timeout: float = 120.0)
             return False
         
         if patch_result["success"]:
+            if CHROMEDRIVER_CACHE_DIR and patch_result["executable_path"]:
+                cached_path = _store_cached_chromedriver(
+                    patch_result["executable_path"], version_main
+                )
+                if cached_path:
+                    _cached_chromedriver_paths[version_main] = cached_path
             _patcher_initialized = True
             return True
         
@@ -329,6 +687,106 @@ def _release_profile_lock(profile_path: str):
         logger.exception("Failed to release profile lock: %s", profile_path)
 
 
+class ProfileSlotAllocator:
+    """
+    Hands each concurrent browser its own profile directory from a fixed set.
+
+    Ownership inside this process is tracked in memory, so callers wait on a
+    condition instead of polling a file lock. Each handed-out slot is still
+    flock'ed (non-blocking) so another server process never shares it; only
+    when every in-process-free slot is held by another process does acquire()
+    fall back to retrying every PROFILE_SLOT_RETRY_INTERVAL seconds.
+
+    Slots start as empty profiles, so they are only used together with the
+    shared cookie store; otherwise every slot would log in to Naver on its own.
+    """
+
+    def __init__(self, base_path: Optional[str], slot_count: int = CHROME_PROFILE_SLOTS):
+        self.base_path = base_path
+        self.slot_count = slot_count
+        self._in_use: set = set()
+        self._condition = threading.Condition()
+        self._missing_cookie_store_logged = False
+
+    def is_enabled(self) -> bool:
+        if not self.base_path or self.slot_count <= 1:
+            return False
+        if not cookieStore.cookieStore.isEnabled():
+            if not self._missing_cookie_store_logged:
+                self._missing_cookie_store_logged = True
+                logger.error(
+                    "CHROME_PROFILE_SLOTS=%d requires COOKIE_STORE_PATH and COOKIE_STORE_KEY; "
+                    "using the single CHROME_PROFILE_PATH instead",
+                    self.slot_count,
+                )
+            return False
+        return True
+
+    def slot_path(self, index: int) -> str:
+        return os.path.join(f"{self.base_path}-slots", f"profile-{index}")
+
+    def in_use_count(self) -> int:
+        with self._condition:
+            return len(self._in_use)
+
+    def acquire(self, timeout: float = PROFILE_LOCK_TIMEOUT) -> Optional[str]:
+        """Return a locked slot directory, or None if none freed up within timeout."""
+        deadline = time.time() + timeout
+        while True:
+            with self._condition:
+                while len(self._in_use) >= self.slot_count:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    self._condition.wait(remaining)
+                candidates = [
+                    index for index in range(self.slot_count) if index not in self._in_use
+                ]
+                # Reserve every free slot while probing the file locks so a
+                # concurrent acquire() does not probe the same directories.
+                self._in_use.update(candidates)
+
+            claimed = None
+            for index in candidates:
+                path = self.slot_path(index)
+                if claimed is None:
+                    os.makedirs(path, exist_ok=True)
+                    if _acquire_profile_lock(path, timeout=0):
+                        claimed = index
+                        continue
+                    logger.info("Profile slot held by another process: %s", path)
+
+            with self._condition:
+                self._in_use.difference_update(
+                    index for index in candidates if index != claimed
+                )
+                self._condition.notify_all()
+
+            if claimed is not None:
+                logger.info(
+                    "Profile slot acquired: %s (in use=%d/%d)",
+                    self.slot_path(claimed), self.in_use_count(), self.slot_count
+                )
+                return self.slot_path(claimed)
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            time.sleep(min(PROFILE_SLOT_RETRY_INTERVAL, remaining))
+
+    def release(self, path: str):
+        _release_profile_lock(path)
+        with self._condition:
+            for index in range(self.slot_count):
+                if self.slot_path(index) == path:
+                    self._in_use.discard(index)
+            self._condition.notify_all()
+        logger.info("Profile slot released: %s", path)
+
+
+_profile_slot_allocator = ProfileSlotAllocator(os.getenv("CHROME_PROFILE_PATH"))
+
+
 # =============================================================================
 # Process Detection and Management
 # =============================================================================
@@ -399,7 +857,101 @@ def _get_process_state(pid: int) -> str:
     return ""
 
 
-def _find_processes_using_profile(profile_path: str) -> List[dict]:
+class ProcessTable:
+    """
+    One-shot snapshot of /proc used for descendant and profile lookups.
+
+    Reads every /proc/<pid>/stat and /proc/<pid>/cmdline once and indexes
+    parent -> children and --user-data-dir -> pids, so teardown answers all
+    of its process queries without forking pgrep/pkill per lookup.
+    """
+
+    PROC_DIR = "/proc"
+
+    def __init__(self, processes: dict):
+        # pid -> {"ppid": int, "argv": List[str]}
+        self.processes = processes
+        self._children: dict = {}
+        self._profile_index: dict = {}
+        for pid, info in processes.items():
+            self._children.setdefault(info["ppid"], []).append(pid)
+            for arg in info["argv"]:
+                if arg.startswith("--user-data-dir="):
+                    profile = arg[len("--user-data-dir="):]
+                    self._profile_index.setdefault(profile, []).append(pid)
+
+    @classmethod
+    def read(cls, proc_dir: str = PROC_DIR) -> Optional["ProcessTable"]:
+        """Snapshot the process table, or None when /proc is unavailable."""
+        if platform.system() != "Linux":
+            return None
+        try:
+            entries = os.listdir(proc_dir)
+        except OSError:
+            return None
+
+        processes = {}
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            try:
+                with open(os.path.join(proc_dir, entry, "stat"), "r") as f:
+                    stat = f.read()
+                with open(os.path.join(proc_dir, entry, "cmdline"), "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # exited while scanning
+            # "pid (comm) state ppid ..." - comm may itself contain spaces and parens
+            fields = stat[stat.rfind(")") + 2:].split()
+            if len(fields) < 2:
+                continue
+            try:
+                ppid = int(fields[1])
+            except ValueError:
+                continue
+            argv = [
+                arg.decode("utf-8", "replace")
+                for arg in cmdline.rstrip(b"\0").split(b"\0")
+                if arg
+            ]
+            processes[pid] = {"ppid": ppid, "argv": argv}
+        return cls(processes)
+
+    def children(self, pid: int) -> List[int]:
+        return list(self._children.get(pid, []))
+
+    def descendants(self, pid: int) -> List[int]:
+        """All descendants of pid at any depth, parents before children."""
+        result = []
+        seen = {pid}
+        queue = [pid]
+        while queue:
+            for child in self._children.get(queue.pop(0), []):
+                if child not in seen:
+                    seen.add(child)
+                    result.append(child)
+                    queue.append(child)
+        return result
+
+    def pids_with_arg(self, arg: str) -> List[int]:
+        return [pid for pid, info in self.processes.items() if arg in info["argv"]]
+
+    def processes_using_profile(self, profile_path: str) -> List[dict]:
+        processes = []
+        for pid in self._profile_index.get(profile_path, []):
+            cmdline = " ".join(self.processes[pid]["argv"])
+            processes.append({
+                "pid": pid,
+                "cmdline": cmdline,
+                "name": "chrome" if "chrome" in cmdline.lower() else "unknown"
+            })
+        return processes
+
+
+def _find_processes_using_profile(
+    profile_path: str, table: Optional[ProcessTable] = None
+) -> List[dict]:
     """
     Find Chrome/ChromeDriver processes using the given profile path.
     Returns list of dicts with 'pid', 'cmdline', 'name'.
@@ -410,11 +962,28 @@ def _find_processes_using_profile(profile_path: str) -> List[dict]:
     if not profile_path:
         return []
     
+    table = table or ProcessTable.read()
+    if table is None:
+        processes = _pgrep_processes_using_profile(profile_path)
+    else:
+        processes = table.processes_using_profile(profile_path)
+    
+    # Note: We intentionally do NOT search for all chromedriver processes here.
+    # Matching every chromedriver would include those from other sessions/profiles,
+    # which could lead to unintended termination of unrelated browser sessions.
+    # Chrome processes with --user-data-dir are sufficient for profile-based cleanup.
+    
+    logger.debug("Found %d processes using profile %s: %s", 
+                 len(processes), profile_path, [p["pid"] for p in processes])
+    return processes
+
+
+def _pgrep_processes_using_profile(profile_path: str) -> List[dict]:
+    """pgrep fallback for _find_processes_using_profile when /proc cannot be read."""
     processes = []
     pattern = f"--user-data-dir={profile_path}"
     
     try:
-        # Use pgrep to find matching processes
         result = subprocess.run(
             ["pgrep", "-af", pattern],
             capture_output=True,
@@ -442,23 +1011,18 @@ def _find_processes_using_profile(profile_path: str) -> List[dict]:
         logger.debug("pgrep not available")
     except Exception:
         logger.exception("Failed to find processes using profile")
-    
-    # Note: We intentionally do NOT search for all chromedriver processes here.
-    # Searching "pgrep -af chromedriver" would return ALL chromedriver instances,
-    # including those from other sessions/profiles, which could lead to
-    # unintended termination of unrelated browser sessions.
-    # Chrome processes with --user-data-dir are sufficient for profile-based cleanup.
-    
-    logger.debug("Found %d processes using profile %s: %s", 
-                 len(processes), profile_path, [p["pid"] for p in processes])
     return processes
 
 
-def _get_child_pids(parent_pid: int) -> List[int]:
+def _get_child_pids(parent_pid: int, table: Optional[ProcessTable] = None) -> List[int]:
     """Get all child PIDs of a process (Linux only)."""
     if platform.system() != "Linux":
         return []
     
+    table = table or ProcessTable.read()
+    if table is not None:
+        return table.children(parent_pid)
+    
     children = []
     try:
         result = subprocess.run(
@@ -479,21 +1043,81 @@ def _get_child_pids(parent_pid: int) -> List[int]:
     return children
 
 
+def _get_descendant_pids(pid: int, table: Optional[ProcessTable] = None) -> List[int]:
+    """All descendants of pid from one /proc snapshot; children and grandchildren via pgrep otherwise."""
+    table = table or ProcessTable.read()
+    if table is not None:
+        return table.descendants(pid)
+    children = _get_child_pids(pid)
+    descendants = list(children)
+    for child in children:
+        descendants.extend(_get_child_pids(child))
+    return descendants
+
+
+def _pidfd_supported() -> bool:
+    return hasattr(os, "pidfd_open") and hasattr(select, "poll")
+
+
+def _wait_for_pids_exit(pids, timeout: float) -> List[int]:
+    """
+    Wait until every process in `pids` has exited or `timeout` passes.
+    Returns the pids still alive at the deadline.
+
+    Each process gets a pidfd (Linux 5.3+), which becomes readable the
+    moment the process exits, so the wait ends as soon as the last one dies.
+    Processes without a pidfd are polled every PID_POLL_INTERVAL instead.
+    """
+    pending = [pid for pid in dict.fromkeys(pids) if _is_pid_alive(pid)]
+    if not pending:
+        return []
+
+    deadline = time.monotonic() + max(0.0, timeout)
+    poller = select.poll() if _pidfd_supported() else None
+    pidfds = {}  # fd -> pid
+    polled = []
+    try:
+        for pid in pending:
+            if poller is None:
+                polled.append(pid)
+                continue
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue  # exited since the liveness check
+            except OSError:
+                polled.append(pid)  # e.g. ENOSYS on kernels before 5.3
+                continue
+            pidfds[fd] = pid
+            poller.register(fd, select.POLLIN)
+
+        while pidfds or polled:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = min(remaining, PID_POLL_INTERVAL) if polled else remaining
+            if pidfds:
+                for fd, _ in poller.poll(max(1, int(wait * 1000))):
+                    poller.unregister(fd)
+                    os.close(fd)
+                    del pidfds[fd]
+            else:
+                time.sleep(wait)
+            if polled:
+                polled = [pid for pid in polled if _is_pid_alive(pid)]
+
+        return list(pidfds.values()) + polled
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+
+
 def _wait_for_pid_exit(pid: int, timeout: float = PROCESS_KILL_TIMEOUT) -> bool:
     """
     Wait for a process to exit.
     Returns True if process exited, False if timeout.
     """
-    if not _is_pid_alive(pid):
-        return True
-    
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if not _is_pid_alive(pid):
-            return True
-        time.sleep(0.1)
-    
-    return not _is_pid_alive(pid)
+    return not _wait_for_pids_exit([pid], timeout)
 
 
 def _reap_zombie(pid: int) -> bool:
@@ -529,25 +1153,28 @@ def _reap_zombie(pid: int) -> bool:
     return False
 
 
-def _terminate_process_tree(pid: int, timeout: float = PROCESS_KILL_TIMEOUT) -> bool:
+def _terminate_process_tree(
+    pid: int, timeout: float = PROCESS_KILL_TIMEOUT, table: Optional[ProcessTable] = None
+) -> bool:
     """
     Terminate a process and all its children.
     First tries SIGTERM, then SIGKILL if needed.
     Also handles zombie processes by attempting to reap them.
+    `table` lets callers that already took a /proc snapshot reuse it.
     Returns True if all processes terminated.
     """
+    with metrics.timePhase("terminate_process_tree"):
+        return _terminate_process_tree_steps(pid, timeout, table)
+
+
+def _terminate_process_tree_steps(pid: int, timeout: float, table: Optional[ProcessTable]) -> bool:
     if not _is_pid_alive(pid):
         logger.debug("Process already dead: pid=%d", pid)
         return True
     
     # Collect all PIDs in the tree
     all_pids = [pid]
-    children = _get_child_pids(pid)
-    all_pids.extend(children)
-    
-    # Recursively get grandchildren
-    for child in children:
-        all_pids.extend(_get_child_pids(child))
+    all_pids.extend(_get_descendant_pids(pid, table))
     
     all_pids = list(set(all_pids))  # Remove duplicates
     logger.info("Terminating process tree: root=%d, all_pids=%s", pid, all_pids)
@@ -564,17 +1191,7 @@ def _terminate_process_tree(pid: int, timeout: float = PROCESS_KILL_TIMEOUT) ->
     
     # Wait for graceful termination using actual timeout
     term_timeout = min(timeout / 2, 3.0)  # Cap at 3 seconds for SIGTERM phase
-    wait_interval = 0.2
-    elapsed = 0.0
-    
-    while elapsed < term_timeout:
-        still_alive = [p for p in all_pids if _is_pid_alive(p)]
-        if not still_alive:
-            break
-        time.sleep(wait_interval)
-        elapsed += wait_interval
-    
-    still_alive = [p for p in all_pids if _is_pid_alive(p)]
+    still_alive = _wait_for_pids_exit(all_pids, term_timeout)
     
     if not still_alive:
         logger.info("All processes terminated gracefully: %s", all_pids)
@@ -591,19 +1208,13 @@ def _terminate_process_tree(pid: int, timeout: float = PROCESS_KILL_TIMEOUT) ->
         except Exception:
             logger.debug("Failed to send SIGKILL to pid=%d", p)
     
-    # Final wait with polling for actual termination
+    # Final wait for actual termination
     # Use longer timeout for SIGKILL - kernel may need time to clean up
     kill_wait_timeout = min(timeout / 2, 5.0)
-    kill_wait_start = time.time()
-    
-    while time.time() - kill_wait_start < kill_wait_timeout:
-        final_alive = [p for p in still_alive if _is_pid_alive(p)]
-        if not final_alive:
-            logger.info("All processes terminated after SIGKILL: %s", all_pids)
-            return True
-        time.sleep(0.3)
-    
-    final_alive = [p for p in still_alive if _is_pid_alive(p)]
+    final_alive = _wait_for_pids_exit(still_alive, kill_wait_timeout)
+    if not final_alive:
+        logger.info("All processes terminated after SIGKILL: %s", all_pids)
+        return True
     
     # Check for D-state (uninterruptible sleep) processes
     for p in final_alive:
@@ -622,8 +1233,7 @@ def _terminate_process_tree(pid: int, timeout: float = PROCESS_KILL_TIMEOUT) ->
             _reap_zombie(p)
         
         # Re-check after reaping attempt
-        time.sleep(0.1)
-        final_alive = [p for p in final_alive if _is_pid_alive(p)]
+        final_alive = _wait_for_pids_exit(final_alive, 0.1)
     
     if final_alive:
         # Log detailed process state for debugging
@@ -656,7 +1266,8 @@ def _cleanup_orphan_processes_for_profile(profile_path: str) -> bool:
     if not profile_path:
         return False
     
-    processes = _find_processes_using_profile(profile_path)
+    table = ProcessTable.read()
+    processes = _find_processes_using_profile(profile_path, table)
     
     if not processes:
         logger.debug("No orphan processes found for profile: %s", profile_path)
@@ -670,7 +1281,7 @@ def _cleanup_orphan_processes_for_profile(profile_path: str) -> bool:
     all_terminated = True
     for proc in processes:
         pid = proc["pid"]
-        if not _terminate_process_tree(pid):
+        if not _terminate_process_tree(pid, table=table):
             all_terminated = False
     
     if all_terminated:
@@ -715,52 +1326,823 @@ def _cleanup_profile_artifacts_if_safe(profile_path: str, stale_files: tuple) ->
     return cleaned
 
 
+# =============================================================================
+# Process Containment
+# =============================================================================
+
+class ProcessGroupContainer:
+    """
+    A browser running in its own process group (session).
+
+    Every Chrome helper stays in the group even after its parent died, so
+    one killpg reaches processes that a parent/child walk would miss.
+    """
+
+    mode = "session"
+
+    def __init__(self, pgid: int):
+        self.pgid = pgid
+
+    def is_populated(self) -> bool:
+        try:
+            os.killpg(self.pgid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+    def signal_all(self, sig) -> None:
+        try:
+            os.killpg(self.pgid, sig)
+        except ProcessLookupError:
+            pass
+
+    def kill(self) -> None:
+        self.signal_all(FORCE_KILL_SIGNAL)
+
+    def release(self) -> None:
+        pass
+
+    def terminate(self, grace: float = CONTAINER_TERM_GRACE, timeout: float = PROCESS_KILL_TIMEOUT) -> bool:
+        """SIGTERM everything, SIGKILL what is left after `grace`. Returns True once empty."""
+        if not self.is_populated():
+            return True
+        self.signal_all(signal.SIGTERM)
+        if self._wait_until_empty(grace):
+            return True
+        logger.warning("Contained processes survived SIGTERM, killing %s", self.describe())
+        self.kill()
+        return self._wait_until_empty(timeout)
+
+    def describe(self) -> str:
+        return f"process group {self.pgid}"
+
+    def _wait_until_empty(self, timeout: float) -> bool:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            if self.pgid > 0:
+                # A zombie group leader that is our own child keeps the group alive
+                _reap_zombie(self.pgid)
+            if not self.is_populated():
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, PID_POLL_INTERVAL))
+        return True
+
+
+class CgroupContainer(ProcessGroupContainer):
+    """
+    A cgroup v2 directory holding one driver and its browser.
+
+    Children inherit the cgroup, so every renderer forked after attach() is
+    covered, memory.max / cpu.max bound the whole browser, and cgroup.kill
+    ends all of it at once. Needs a delegated cgroup writable by this process.
+    """
+
+    mode = "cgroup"
+
+    def __init__(self, path: str, memory_max: str = "", cpu_max: str = ""):
+        super().__init__(pgid=-1)
+        self.path = path
+        self.memory_max = memory_max
+        self.cpu_max = cpu_max
+
+    def create(self) -> None:
+        os.mkdir(self.path)
+        for file_name, value in (("memory.max", self.memory_max), ("cpu.max", self.cpu_max)):
+            if not value:
+                continue
+            try:
+                self._write(file_name, value)
+            except OSError as e:
+                # The controller may not be enabled in the parent's cgroup.subtree_control
+                logger.warning("Could not set %s=%s on %s: %s", file_name, value, self.path, e)
+
+    def attach(self, pids) -> None:
+        for pid in pids:
+            try:
+                self._write("cgroup.procs", str(pid))
+            except ProcessLookupError:
+                continue  # already exited
+
+    def pids(self) -> List[int]:
+        try:
+            with open(os.path.join(self.path, "cgroup.procs"), "r") as f:
+                return [int(line) for line in f.read().split() if line.isdigit()]
+        except FileNotFoundError:
+            return []
+
+    def is_populated(self) -> bool:
+        try:
+            with open(os.path.join(self.path, "cgroup.events"), "r") as f:
+                for line in f:
+                    key, _, value = line.partition(" ")
+                    if key == "populated":
+                        return value.strip() != "0"
+        except FileNotFoundError:
+            pass
+        return bool(self.pids())
+
+    def signal_all(self, sig) -> None:
+        for pid in self.pids():
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def kill(self) -> None:
+        # cgroup.kill (Linux 5.14+) kills the whole sub-tree atomically,
+        # including processes forking while we signal.
+        if os.path.exists(os.path.join(self.path, "cgroup.kill")):
+            self._write("cgroup.kill", "1")
+        else:
+            self.signal_all(FORCE_KILL_SIGNAL)
+
+    def release(self) -> None:
+        try:
+            os.rmdir(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove cgroup %s: %s", self.path, e)
+
+    def describe(self) -> str:
+        return f"cgroup {self.path}"
+
+    def _write(self, file_name: str, value: str) -> None:
+        with open(os.path.join(self.path, file_name), "w") as f:
+            f.write(value)
+
+
+_cgroup_sequence = 0
+_cgroup_sequence_lock = threading.Lock()
+
+
+def _next_cgroup_path(root: str) -> str:
+    global _cgroup_sequence
+    with _cgroup_sequence_lock:
+        _cgroup_sequence += 1
+        return os.path.join(root, f"chrome-{os.getpid()}-{_cgroup_sequence}")
+
+
+def create_process_container(
+    browser_pid: Optional[int],
+    service_pid: Optional[int],
+    mode: str = CHROME_PROCESS_ISOLATION,
+):
+    """
+    Contain a freshly started browser according to `mode`.
+    Returns a container, or None when isolation is off or unavailable.
+    """
+    if mode not in ("session", "cgroup") or platform.system() != "Linux" or not browser_pid:
+        return None
+
+    if mode == "cgroup":
+        container = _create_cgroup_container(browser_pid, service_pid)
+        if container is not None:
+            return container
+        logger.warning("cgroup isolation unavailable, falling back to process group isolation")
+
+    try:
+        pgid = os.getpgid(browser_pid)
+    except ProcessLookupError:
+        return None
+    if pgid == os.getpgrp():
+        # Launched in the server's own group (UC_USE_SUBPROCESS); a group
+        # signal would hit the server itself.
+        logger.warning("Browser pid=%d shares the server's process group; isolation disabled", browser_pid)
+        return None
+    logger.info("Browser contained in process group %d", pgid)
+    return ProcessGroupContainer(pgid)
+
+
+def _create_cgroup_container(browser_pid: int, service_pid: Optional[int]) -> Optional[CgroupContainer]:
+    if not CHROME_CGROUP_ROOT or not os.path.isdir(CHROME_CGROUP_ROOT):
+        logger.warning("CHROME_CGROUP_ROOT is not a directory: %r", CHROME_CGROUP_ROOT)
+        return None
+
+    container = CgroupContainer(
+        _next_cgroup_path(CHROME_CGROUP_ROOT),
+        memory_max=CHROME_CGROUP_MEMORY_MAX,
+        cpu_max=CHROME_CGROUP_CPU_MAX,
+    )
+    roots = [pid for pid in (service_pid, browser_pid) if pid]
+    try:
+        container.create()
+        # Chrome forks its helpers before uc.Chrome() returns, so move the
+        # existing tree as well; a second pass picks up anything forked by a
+        # not-yet-moved parent during the first one.
+        for _ in range(2):
+            table = ProcessTable.read()
+            pids = list(roots)
+            for root in roots:
+                pids.extend(table.descendants(root) if table is not None else [])
+            container.attach(pids)
+    except OSError as e:
+        logger.warning("Could not move browser into cgroup %s: %s", container.path, e)
+        container.release()
+        return None
+
+    logger.info(
+        "Browser contained in %s (memory.max=%s, cpu.max=%s)",
+        container.path, CHROME_CGROUP_MEMORY_MAX or "-", CHROME_CGROUP_CPU_MAX or "-"
+    )
+    return container
+
+
+# =============================================================================
+# Memory Admission Control
+# =============================================================================
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _read_process_memory(pid: int) -> int:
+    """PSS of a process in bytes (RSS when smaps_rollup is unreadable), 0 if gone."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _read_host_available_memory() -> Optional[int]:
+    """MemAvailable from /proc/meminfo in bytes, or None when unavailable."""
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class MemoryAdmissionController:
+    """
+    Admits new browsers only while their memory fits.
+
+    Usage is the summed PSS of every live browser's process tree (browser
+    and chromedriver PIDs from `_cleanup_metadata` plus descendants). One
+    more browser is assumed to cost as much as the average live browser,
+    so the effective concurrency limit follows what the booking SPA really
+    uses on this host. admit() queues until the browser fits or raises
+    MemoryExhaustedError with the reason when `timeout` passes.
+
+    Admitted browsers that are still launching have no process tree to
+    measure yet, so each admission reserves its expected cost until
+    release() is called once the driver is registered or failed to start.
+    Checks and reservations happen under one lock so concurrent admits
+    cannot all pass against the same measurement. Queued admits sleep on a
+    condition that release() and notify_released() wake, instead of polling.
+    """
+
+    def __init__(
+        self,
+        budget_mb: int = BROWSER_MEMORY_BUDGET_MB,
+        estimate_mb: int = BROWSER_MEMORY_ESTIMATE_MB,
+        reserve_mb: int = HOST_MEMORY_RESERVE_MB,
+    ):
+        self.budget_bytes = max(0, budget_mb) * 1024 * 1024
+        self.estimate_bytes = max(1, estimate_mb) * 1024 * 1024
+        self.reserve_bytes = max(0, reserve_mb) * 1024 * 1024
+        self._condition = threading.Condition()
+        self._reservations: List[int] = []
+        self._release_generation = 0
+
+    def is_enabled(self) -> bool:
+        return self.budget_bytes > 0
+
+    def measure_browsers(self) -> List[int]:
+        """Memory in bytes of each live browser's process tree."""
+        with _driver_lock:
+            drivers = list(_active_drivers)
+        roots_per_driver = []
+        for driver_instance in drivers:
+            metadata = getattr(driver_instance, "_cleanup_metadata", None) or {}
+            roots = [
+                pid for pid in (
+                    _normalize_pid(metadata.get("browserPid")),
+                    _normalize_pid(metadata.get("servicePid")),
+                ) if pid
+            ]
+            if roots:
+                roots_per_driver.append(roots)
+        if not roots_per_driver:
+            return []
+
+        table = ProcessTable.read()
+        usages = []
+        for roots in roots_per_driver:
+            pids = set(roots)
+            if table is not None:
+                for root in roots:
+                    pids.update(table.descendants(root))
+            usages.append(sum(_read_process_memory(pid) for pid in pids))
+        return usages
+
+    def browser_cost(self, usages: List[int]) -> int:
+        measured = [usage for usage in usages if usage > 0]
+        if not measured:
+            return self.estimate_bytes
+        return max(1, sum(measured) // len(measured))
+
+    def effective_limit(self, usages: Optional[List[int]] = None) -> int:
+        """Browsers the budget holds at the current per-browser cost."""
+        if not self.is_enabled():
+            return MAX_CONCURRENT_BROWSERS
+        usages = self.measure_browsers() if usages is None else usages
+        return max(1, min(MAX_CONCURRENT_BROWSERS, self.budget_bytes // self.browser_cost(usages)))
+
+    def reserved_bytes(self) -> int:
+        """Memory reserved for admitted browsers that are still launching."""
+        return sum(self._reservations)
+
+    def check(self) -> Optional[str]:
+        """None when one more browser fits, otherwise the reason it does not."""
+        if not self.is_enabled():
+            return None
+        with self._condition:
+            return self._check_locked()[0]
+
+    def _check_locked(self):
+        usages = self.measure_browsers()
+        reserved = self.reserved_bytes()
+        used = sum(usages) + reserved
+        cost = self.browser_cost(usages)
+        _browser_memory_bytes.set(used)
+        _browser_memory_limit.set(self.effective_limit(usages))
+
+        # The first browser is always admitted against the budget, so an
+        # undersized budget degrades to serial scraping instead of a hard stop.
+        browsers = len(usages) + len(self._reservations)
+        if browsers and used + cost > self.budget_bytes:
+            return (
+                f"browser memory budget exhausted: {browsers} live or launching browsers use "
+                f"{used // 2**20}MB, one more needs ~{cost // 2**20}MB "
+                f"of BROWSER_MEMORY_BUDGET_MB={self.budget_bytes // 2**20}"
+            ), cost
+        available = _read_host_available_memory()
+        if available is not None and available - reserved - self.reserve_bytes < cost:
+            return (
+                f"host memory saturated: MemAvailable={available // 2**20}MB, "
+                f"one more browser needs ~{cost // 2**20}MB plus "
+                f"HOST_MEMORY_RESERVE_MB={self.reserve_bytes // 2**20}"
+            ), cost
+        return None, cost
+
+    def _try_reserve(self) -> tuple:
+        """Check and, when the browser fits, reserve its cost atomically."""
+        with self._condition:
+            reason, cost = self._check_locked()
+            if reason is None:
+                self._reservations.append(cost)
+                return None, cost, self._release_generation
+            return reason, 0, self._release_generation
+
+    def release(self, reservation: int) -> None:
+        """Drop a reservation returned by admit()."""
+        if not reservation:
+            return
+        with self._condition:
+            try:
+                self._reservations.remove(reservation)
+            except ValueError:
+                pass
+            self._notify_locked()
+
+    def notify_released(self) -> None:
+        """Wake queued admits after a browser closed."""
+        with self._condition:
+            self._notify_locked()
+
+    def _notify_locked(self):
+        self._release_generation += 1
+        self._condition.notify_all()
+
+    def _wait_for_release(self, generation: int, timeout: float):
+        # The generation catches releases between the failed check and the wait.
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._release_generation != generation, timeout
+            )
+
+    @contextmanager
+    def reserve(self, timeout: float):
+        """admit() for the duration of a browser launch."""
+        reservation = self.admit(timeout)
+        try:
+            yield
+        finally:
+            self.release(reservation)
+
+    def admit(self, timeout: float) -> int:
+        """
+        Wait until one more browser fits and reserve its memory.
+
+        Returns:
+            The reservation to pass to release() once the browser is
+            registered or failed to start (0 when admission is disabled)
+
+        Raises:
+            MemoryExhaustedError: If it still does not fit after timeout
+        """
+        if not self.is_enabled():
+            return 0
+        deadline = time.monotonic() + max(0.0, timeout)
+        reason, reservation, generation = self._try_reserve()
+        if reason is None:
+            return reservation
+        logger.warning("Browser admission queued: %s", reason)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.browserAdmissionRejectionsTotal.inc(reason=reason.split(":", 1)[0])
+                raise MemoryExhaustedError(f"Cannot start new browser: {reason}")
+            self._wait_for_release(generation, min(remaining, MEMORY_ADMISSION_RECHECK_INTERVAL))
+            reason, reservation, generation = self._try_reserve()
+            if reason is None:
+                logger.info("Browser admitted after memory wait")
+                return reservation
+
+
+_browser_memory_bytes = metrics.registry.gauge(
+    "scraper_browser_memory_bytes", "Summed PSS of live browser process trees at the last admission check.",
+)
+_browser_memory_limit = metrics.registry.gauge(
+    "scraper_browser_memory_effective_limit", "Concurrent browsers that fit the memory budget at the last admission check.",
+)
+_memory_admission = MemoryAdmissionController()
+
+
+# =============================================================================
+# Background Teardown
+# =============================================================================
+
+class BrowserReaper:
+    """
+    Takes ownership of finished drivers and closes them.
+
+    When enabled, every close() (quit, process-tree termination, pipe
+    cleanup and profile lock release) runs on its own background thread, and
+    `on_done` - which releases the browser slot - runs only after close()
+    returned, so a new browser never races the old one's processes or
+    profile lock. When disabled, submit() closes inline as before.
+    """
+
+    def __init__(self, enabled: bool = ASYNC_BROWSER_TEARDOWN):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._threads: set = set()
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._threads)
+
+    def submit(self, driver_instance: "ChromeDriver", on_done=None):
+        if not self.enabled:
+            self._teardown(driver_instance, on_done)
+            return
+
+        thread = threading.Thread(
+            target=self._run, args=(driver_instance, on_done),
+            name="browser-reaper", daemon=True,
+        )
+        # Started under the lock so drain() never sees an unstarted thread.
+        with self._lock:
+            try:
+                thread.start()
+            except RuntimeError:
+                logger.exception("Failed to start browser reaper thread; closing inline")
+                thread = None
+            else:
+                self._threads.add(thread)
+        if thread is None:
+            self._teardown(driver_instance, on_done)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending teardowns. Returns True if none are left."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Teardowns submitted while draining are waited for as well.
+            with self._lock:
+                threads = list(self._threads)
+            if not threads:
+                return True
+            for thread in threads:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return self.pending_count() == 0
+                thread.join(remaining)
+
+    def _run(self, driver_instance: "ChromeDriver", on_done):
+        try:
+            self._teardown(driver_instance, on_done)
+        finally:
+            with self._lock:
+                self._threads.discard(threading.current_thread())
+
+    def _teardown(self, driver_instance: "ChromeDriver", on_done):
+        try:
+            driver_instance.close()
+        except Exception:
+            logger.exception("Failed to close browser during teardown")
+        finally:
+            if on_done is not None:
+                on_done()
+
+
+_browser_reaper = BrowserReaper()
+# Registered after cleanup_all_drivers, so it runs first at exit (LIFO).
+atexit.register(_browser_reaper.drain, BROWSER_CLEANUP_TIMEOUT)
+
+
+# =============================================================================
+# Warm Browser Pool
+# =============================================================================
+
+class BrowserPool:
+    """
+    Bounded pool of started, health-checked ChromeDriver instances.
+
+    Idle drivers stay warm between requests and are handed out by lease().
+    A driver is recycled (closed) instead of returned to the pool when it
+    reached `max_uses`, sat idle longer than `idle_ttl`, failed the lease
+    health check, or its lease ended with an error.
+
+    An idle pooled driver keeps holding its profile lock. With a single
+    CHROME_PROFILE_PATH only one live driver is allowed - a second one would
+    just block on the profile lock - while CHROME_PROFILE_SLOTS allows one
+    live driver per slot.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MAX_CONCURRENT_BROWSERS,
+        max_uses: int = BROWSER_POOL_MAX_USES,
+        idle_ttl: float = BROWSER_POOL_IDLE_TTL,
+    ):
+        self.max_size = max(1, max_size)
+        self.max_uses = max(1, max_uses)
+        self.idle_ttl = idle_ttl
+        self._idle: list = []  # [(driver_instance, returned_at)], most recent last
+        self._live_count = 0
+        self._condition = threading.Condition()
+
+    def _effective_max_size(self) -> int:
+        if _profile_slot_allocator.is_enabled():
+            return min(self.max_size, _profile_slot_allocator.slot_count)
+        if os.getenv("CHROME_PROFILE_PATH"):
+            return 1
+        return self.max_size
+
+    def idle_count(self) -> int:
+        with self._condition:
+            return len(self._idle)
+
+    def live_count(self) -> int:
+        with self._condition:
+            return self._live_count
+
+    def lease(self, timeout: float = 30.0, skip_fd_check: bool = False) -> "ChromeDriver":
+        """
+        Lease a warm driver, starting a new one only when no idle driver
+        is available and the pool has room.
+
+        Raises:
+            TimeoutError: If no driver became available within timeout
+        """
+        deadline = time.time() + timeout
+        self._evict_expired()
+
+        while True:
+            candidate = None
+            with self._condition:
+                while not self._idle and self._live_count >= self._effective_max_size():
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Could not lease pooled browser within {timeout}s. "
+                            f"Live pooled browsers: {self._live_count}/{self._effective_max_size()}"
+                        )
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    candidate, _ = self._idle.pop()
+                else:
+                    self._live_count += 1
+
+            if candidate is None:
+                break
+
+            if candidate.isHealthy():
+                candidate._pool_use_count = getattr(candidate, "_pool_use_count", 0) + 1
+                logger.info(
+                    "Leased pooled browser (uses=%d/%d)",
+                    candidate._pool_use_count, self.max_uses
+                )
+                return candidate
+
+            self._recycle(candidate, "health check failed")
+
+        try:
+            with _memory_admission.reserve(timeout=max(0.0, deadline - time.time())):
+                driver_instance = ChromeDriver(skip_fd_check=skip_fd_check)
+        except Exception:
+            self._forget_live_driver()
+            raise
+
+        driver_instance._pool_use_count = 1
+        logger.info("Started new pooled browser (live=%d)", self.live_count())
+        return driver_instance
+
+    def release(self, driver_instance: "ChromeDriver", reusable: bool = True):
+        """Return a leased driver to the pool or recycle it."""
+        if not reusable:
+            self._recycle(driver_instance, "lease ended with error")
+            return
+
+        if getattr(driver_instance, "_closed", False) or getattr(driver_instance, "driver", None) is None:
+            self._recycle(driver_instance, "driver already closed")
+            return
+
+        if getattr(driver_instance, "_pool_use_count", 0) >= self.max_uses:
+            self._recycle(driver_instance, f"reached max uses ({self.max_uses})")
+            return
+
+        try:
+            # Leave the partner SPA so an idle browser does not keep polling
+            # Naver in the background between leases.
+            driver_instance.driver.get("about:blank")
+            driver_instance.resetLeaseState()
+        except Exception as e:
+            self._recycle(driver_instance, f"reset failed: {e}")
+            return
+
+        # Without traffic no lease() runs, so expired drivers are evicted here too.
+        self._evict_expired()
+        with self._condition:
+            self._idle.append((driver_instance, time.time()))
+            self._condition.notify()
+        logger.info("Returned browser to pool (idle=%d)", self.idle_count())
+
+    def shutdown(self):
+        """Close every idle driver."""
+        with self._condition:
+            idle = [driver_instance for driver_instance, _ in self._idle]
+            self._idle = []
+        for driver_instance in idle:
+            self._recycle(driver_instance, "pool shutdown")
+
+    def _evict_expired(self):
+        now = time.time()
+        with self._condition:
+            expired = [
+                driver_instance
+                for driver_instance, returned_at in self._idle
+                if now - returned_at >= self.idle_ttl
+            ]
+            self._idle = [
+                entry for entry in self._idle if now - entry[1] < self.idle_ttl
+            ]
+        for driver_instance in expired:
+            self._recycle(driver_instance, f"idle longer than {self.idle_ttl:.0f}s")
+
+    def _recycle(self, driver_instance: "ChromeDriver", reason: str):
+        logger.info("Recycling pooled browser: %s", reason)
+        # The live slot frees up only once the browser is actually closed.
+        _browser_reaper.submit(driver_instance, on_done=self._forget_live_driver)
+
+    def _forget_live_driver(self):
+        with self._condition:
+            self._live_count = max(0, self._live_count - 1)
+            self._condition.notify()
+
+
+_browser_pool = BrowserPool()
+# Registered after the reaper drain, so idle browsers are handed to the
+# reaper before it drains at exit (LIFO).
+atexit.register(_browser_pool.shutdown)
+
+
+def get_pooled_driver_count() -> int:
+    """Get count of idle drivers waiting in the warm browser pool."""
+    return _browser_pool.idle_count()
+
+
+metrics.registry.gauge(
+    "scraper_active_browsers", "Started ChromeDriver instances not yet closed.",
+    callback=get_active_driver_count,
+)
+metrics.registry.gauge(
+    "scraper_pooled_browsers", "Idle warm browsers waiting in the pool.",
+    callback=get_pooled_driver_count,
+)
+metrics.registry.gauge(
+    "scraper_pending_browser_teardowns", "Finished browsers still being closed in the background.",
+    callback=_browser_reaper.pending_count,
+)
+metrics.registry.gauge(
+    "scraper_open_fds", "Open file descriptors of the server process.",
+    callback=get_fd_count,
+)
+metrics.registry.gauge(
+    "scraper_fd_high_water_mark", "Highest open file descriptor count seen by the FD monitor.",
+    callback=get_fd_high_water_mark,
+)
+metrics.registry.gauge(
+    "scraper_fd_limit", "Soft file descriptor limit of the server process.",
+    callback=get_fd_limit,
+)
+
+
 @contextmanager
 def create_browser(timeout: float = 30.0, skip_fd_check: bool = False):
     """
     Context manager for safe browser lifecycle management.
-    
+
     Features:
     - Concurrency control via semaphore
-    - Guaranteed cleanup on exit
+    - Guaranteed cleanup on exit (in the background with ASYNC_BROWSER_TEARDOWN;
+      the slot is released once the browser is closed)
     - FD monitoring
     - Timeout for acquiring browser slot
-    
+    - Warm browser reuse when BROWSER_POOL_ENABLED is set
+
     Usage:
         with create_browser() as driver:
             driver.goTo("https://example.com")
-            # driver is automatically closed on exit
-    
+            # driver is automatically closed (or returned to the pool) on exit
+
     Args:
         timeout: Max seconds to wait for browser slot (default 30)
         skip_fd_check: Skip FD availability check (default False)
-    
+
     Raises:
         TimeoutError: If browser slot not available within timeout
         FDExhaustedError: If FD count is critically high
+        MemoryExhaustedError: If a new browser does not fit in memory within timeout
         BrowserStartupError: If browser fails to start
     """
+    slot_wait_start = time.time()
+    slot_wait_started_at = time.perf_counter()
     acquired = _browser_semaphore.acquire(timeout=timeout)
+    metrics.browserSlotWaitSeconds.observe(
+        time.perf_counter() - slot_wait_started_at,
+        outcome="acquired" if acquired else "timeout",
+    )
     if not acquired:
         active_count = get_active_driver_count()
         raise TimeoutError(
             f"Could not acquire browser slot within {timeout}s. "
             f"Active browsers: {active_count}/{MAX_CONCURRENT_BROWSERS}"
         )
-    
+
     driver_instance = None
+    lease_failed = False
+    slot_handed_off = False
     try:
         log_fd_status("create_browser: slot acquired")
-        driver_instance = ChromeDriver(skip_fd_check=skip_fd_check)
-        yield driver_instance
+        if BROWSER_POOL_ENABLED:
+            remaining_timeout = max(0.0, timeout - (time.time() - slot_wait_start))
+            driver_instance = _browser_pool.lease(
+                timeout=remaining_timeout, skip_fd_check=skip_fd_check
+            )
+        else:
+            with _memory_admission.reserve(timeout=max(0.0, timeout - (time.time() - slot_wait_start))):
+                driver_instance = ChromeDriver(skip_fd_check=skip_fd_check)
+        try:
+            yield driver_instance
+        except BaseException:
+            lease_failed = True
+            raise
     finally:
         if driver_instance is not None:
             try:
-                driver_instance.close()
+                if BROWSER_POOL_ENABLED:
+                    _browser_pool.release(driver_instance, reusable=not lease_failed)
+                else:
+                    slot_handed_off = True
+                    _browser_reaper.submit(driver_instance, on_done=_release_browser_slot)
             except Exception:
                 logger.exception("Failed to close browser in context manager")
-        _browser_semaphore.release()
-        log_fd_status("create_browser: slot released")
+        if not slot_handed_off:
+            _release_browser_slot()
+
+
+def _release_browser_slot():
+    _browser_semaphore.release()
+    log_fd_status("create_browser: slot released")
 
 
 class BrowserStartupError(Exception):
@@ -773,6 +2155,11 @@ class FDExhaustedError(Exception):
     pass
 
 
+class MemoryExhaustedError(Exception):
+    """Raised when a new browser does not fit the memory budget or host memory."""
+    pass
+
+
 class ChromeDriver(driver.Driver):
     BROWSER_LANGUAGE = "ko-KR"
     ACCEPT_LANGUAGES = "ko-KR,ko,en-US,en"
@@ -799,36 +2186,60 @@ class ChromeDriver(driver.Driver):
         self.has_display_server = self._has_display_server()
         self.run_headless = self._should_run_headless()
         self.user_multi_procs = self._should_enable_uc_multi_procs()
+        self.launch_profile = resolve_launch_profile()
         self.active_chrome_profile_path = None
         self.driver = None
         self._closed = False
+        self._close_lock = threading.Lock()
         self._cleanup_metadata = {}
+        self._process_container = None
         self._partial_browser = None  # Track partially started browser for cleanup
         self._profile_lock_acquired = False  # Track if we hold the profile lock
+        self._profile_slot_acquired = False  # Lock is owned by _profile_slot_allocator
+        use_profile_slot = bool(self.chrome_profile_path) and _profile_slot_allocator.is_enabled()
+        if use_profile_slot:
+            # Unset until a slot is claimed so a failed claim never cleans up
+            # processes of sibling slots.
+            self.chrome_profile_path = None
         
         log_fd_status("ChromeDriver.__init__ start")
         
         try:
             # Step 1: Acquire profile lock (if using profile)
+            # With profile slots, claim a free slot directory instead of
+            # waiting on the shared profile.
             # If lock acquisition fails, try cleaning orphan processes first and retry
-            if self.chrome_profile_path:
-                if not self._try_acquire_profile_lock_with_orphan_cleanup():
-                    raise ProfileLockError(
-                        f"Could not acquire profile lock within {PROFILE_LOCK_TIMEOUT}s "
-                        f"(even after orphan cleanup): {self.chrome_profile_path}"
-                    )
+            with metrics.timePhase("profile_lock"):
+                if use_profile_slot:
+                    slot_path = _profile_slot_allocator.acquire(timeout=PROFILE_LOCK_TIMEOUT)
+                    if slot_path is None:
+                        raise ProfileLockError(
+                            f"Could not acquire a profile slot within {PROFILE_LOCK_TIMEOUT}s "
+                            f"({_profile_slot_allocator.slot_count} slots)"
+                        )
+                    self.chrome_profile_path = slot_path
+                    self._profile_lock_acquired = True
+                    self._profile_slot_acquired = True
+                elif self.chrome_profile_path:
+                    if not self._try_acquire_profile_lock_with_orphan_cleanup():
+                        raise ProfileLockError(
+                            f"Could not acquire profile lock within {PROFILE_LOCK_TIMEOUT}s "
+                            f"(even after orphan cleanup): {self.chrome_profile_path}"
+                        )
             
             # Step 2: Clean up stale profile artifacts (only if safe)
             # Note: Orphan cleanup is now done in _try_acquire_profile_lock_with_orphan_cleanup
             if self.chrome_profile_path:
-                _cleanup_profile_artifacts_if_safe(
-                    self.chrome_profile_path, 
-                    self.STALE_PROFILE_FILES
-                )
+                with metrics.timePhase("profile_artifact_cleanup"):
+                    _cleanup_profile_artifacts_if_safe(
+                        self.chrome_profile_path, 
+                        self.STALE_PROFILE_FILES
+                    )
             
             # Step 4: Build options and start browser
             self.options = self.getOptions()
-            self.driver = self.getDriver(self.options)
+            with metrics.timePhase("browser_startup"):
+                self.driver = self.getDriver(self.options)
             self.driver.implicitly_wait(0)
             
             # Register this driver for tracking
@@ -965,10 +2376,7 @@ class ChromeDriver(driver.Driver):
                 )
 
         # Release profile lock if held
-        profile_lock_acquired = getattr(self, "_profile_lock_acquired", False)
-        if profile_lock_acquired and chrome_profile_path:
-            _release_profile_lock(chrome_profile_path)
-            self._profile_lock_acquired = False
+        self._release_profile_lock_if_held()
 
     def _get_bool_env(self, name: str, default: bool = False) -> bool:
         value = os.getenv(name)
@@ -1021,11 +2429,24 @@ class ChromeDriver(driver.Driver):
         # 불필요한 에러메시지 노출 방지
         options.add_argument("--log-level=3")
 
+        # 실행 프로필별 추가 플래그 (default 는 추가 없음)
+        launch_profile = getattr(self, "launch_profile", LAUNCH_PROFILE_DEFAULT)
+        if launch_profile == LAUNCH_PROFILE_MINIMAL:
+            for argument in MINIMAL_PROFILE_ARGUMENTS:
+                options.add_argument(argument)
+            options.add_argument(f"--renderer-process-limit={CHROME_RENDERER_PROCESS_LIMIT}")
+        elif launch_profile == LAUNCH_PROFILE_DIAGNOSTIC:
+            for argument in DIAGNOSTIC_PROFILE_ARGUMENTS:
+                options.add_argument(argument)
+
         if profile_path:
             options.add_argument(
                 f"{self.USER_DATA_DIR_ARGUMENT_PREFIX}{profile_path}"
             )
 
+        if NETWORK_CAPTURE_ENABLED:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
         return options
 
     def _resolve_profile_path(self, include_profile: bool):
@@ -1116,7 +2537,8 @@ class ChromeDriver(driver.Driver):
         
         # Attempt 1: With profile (if configured)
         try:
-            browser = self._startBrowserSafe(options, timeout=BROWSER_STARTUP_TIMEOUT)
+            with metrics.timePhase("uc_launch"):
+                browser = self._startBrowserSafe(options, timeout=BROWSER_STARTUP_TIMEOUT)
         except Exception as e:
             last_exception = e
             logger.exception(
@@ -1126,7 +2548,8 @@ class ChromeDriver(driver.Driver):
             self._cleanup_partial_browser()
             if self.chrome_profile_path:
                 try:
-                    _cleanup_orphan_processes_for_profile(self.chrome_profile_path)
+                    with metrics.timePhase("orphan_cleanup"):
+                        _cleanup_orphan_processes_for_profile(self.chrome_profile_path)
                 except Exception:
                     logger.exception(
                         "Failed orphan cleanup after startup failure: %s",
@@ -1156,15 +2579,17 @@ class ChromeDriver(driver.Driver):
                 # Profile is assumed corrupted - reset it in place. The
                 # .profile.lock we hold is preserved so concurrency
                 # guarantees remain intact.
-                self._wipe_profile_directory_preserving_lock(
-                    self.chrome_profile_path
-                )
+                with metrics.timePhase("profile_wipe"):
+                    self._wipe_profile_directory_preserving_lock(
+                        self.chrome_profile_path
+                    )
 
                 retry_options = self._buildOptions(include_profile=True)
                 self.options = retry_options
-                browser = self._startBrowserSafe(
-                    retry_options, timeout=BROWSER_STARTUP_TIMEOUT
-                )
+                with metrics.timePhase("uc_launch_retry"):
+                    browser = self._startBrowserSafe(
+                        retry_options, timeout=BROWSER_STARTUP_TIMEOUT
+                    )
                 logger.info(
                     "Chrome started with wiped profile; successful login will "
                     "persist session to profile for next request: %s",
@@ -1188,6 +2613,10 @@ class ChromeDriver(driver.Driver):
             raise BrowserStartupError("Chrome failed to start: no browser instance created")
 
         self._cleanup_metadata = self._capture_cleanup_metadata(browser)
+        self._process_container = create_process_container(
+            _normalize_pid(self._cleanup_metadata.get("browserPid")),
+            _normalize_pid(self._cleanup_metadata.get("servicePid")),
+        )
         startup_elapsed = time.time() - startup_start_time
         logger.info(
             "Chrome driver started in %.1fs: %s", 
@@ -1195,7 +2624,9 @@ class ChromeDriver(driver.Driver):
         )
         
         # Step 5: Startup health check - verify session is actually working
-        if not self._perform_startup_health_check(browser):
+        with metrics.timePhase("health_check"):
+            healthy = self._perform_startup_health_check(browser)
+        if not healthy:
             logger.error("Startup health check failed, cleaning up browser")
             self._force_kill_browser(browser)
             raise BrowserStartupError(
@@ -1208,13 +2639,24 @@ class ChromeDriver(driver.Driver):
         # nice-to-have for Accept-Language / navigator.language - the browser itself is
         # still fully usable without it, so we must NOT kill a healthy browser here.
         try:
-            self._applyLanguageOverrides(browser)
+            with metrics.timePhase("language_overrides"):
+                self._applyLanguageOverrides(browser)
             logger.debug("Language overrides applied successfully")
         except Exception as e:
             logger.warning(
                 "Language override failed (non-fatal), continuing without overrides: %s", e
             )
         
+        # Step 7: Block heavy resources for the minimal launch profile (non-fatal)
+        if getattr(self, "launch_profile", LAUNCH_PROFILE_DEFAULT) == LAUNCH_PROFILE_MINIMAL:
+            try:
+                browser.execute_cdp_cmd("Network.enable", {})
+                browser.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": MINIMAL_PROFILE_BLOCKED_URLS}
+                )
+            except Exception as e:
+                logger.warning("Resource blocking failed (non-fatal): %s", e)
+        
         return browser
     
     def _perform_startup_health_check(self, browser) -> bool:
@@ -1246,7 +2688,31 @@ class ChromeDriver(driver.Driver):
             else:
                 logger.error("Startup health check failed: %s", e)
             return False
-    
+
+    def isHealthy(self) -> bool:
+        """Cheap liveness probe used before handing out a pooled browser."""
+        browser = getattr(self, "driver", None)
+        if browser is None or getattr(self, "_closed", False):
+            return False
+        try:
+            return browser.execute_script("return 1 + 1") == 2
+        except Exception as e:
+            logger.warning("Browser health check failed: %s", e)
+            return False
+
+    def resetLeaseState(self):
+        """Forget per-request state before a pooled browser is leased again."""
+        self._network_capture_pattern = None
+        self._network_capture_pending = {}
+        self._network_capture_requests = set()
+        self._browser_info_cache = None
+        if NETWORK_CAPTURE_ENABLED and getattr(self, "driver", None) is not None:
+            try:
+                # Buffered events of the previous lease must not reach the next capture.
+                self.driver.get_log("performance")
+            except Exception as e:
+                logger.warning("Failed to drain performance log on release: %s", e)
+
     def _startBrowserSafe(self, options, timeout: float = BROWSER_STARTUP_TIMEOUT) -> uc.Chrome:
         """
         Start browser with tracking for cleanup on failure.
@@ -1319,9 +2785,9 @@ class ChromeDriver(driver.Driver):
         try:
             browser.quit()
             # Wait briefly and check if processes actually terminated
-            time.sleep(0.5)
-            browser_alive = _is_pid_alive(browser_pid) if browser_pid else False
-            service_alive = _is_pid_alive(service_pid) if service_pid else False
+            alive_pids = _wait_for_pids_exit([pid for pid in (browser_pid, service_pid) if pid], 0.5)
+            browser_alive = browser_pid in alive_pids
+            service_alive = service_pid in alive_pids
             
             if not browser_alive and not service_alive:
                 logger.info("Browser quit successfully, all processes terminated")
@@ -1335,6 +2801,9 @@ class ChromeDriver(driver.Driver):
         except Exception as e:
             logger.debug("Graceful quit failed: %s, attempting force kill", e)
         
+        # Contained browsers go down with one group/cgroup kill
+        self._teardown_process_container()
+        
         # Force terminate process trees (including children)
         for name, pid in [("browser", browser_pid), ("service", service_pid)]:
             if pid is not None and _is_pid_alive(pid):
@@ -1352,11 +2821,22 @@ class ChromeDriver(driver.Driver):
                         pass
 
     def _startBrowser(self, options) -> uc.Chrome:
+        driver_path = get_cached_chromedriver_path(CHROMEDRIVER_VERSION_MAIN)
+        if driver_path:
+            # An explicit, already patched binary makes uc skip download and
+            # patching. user_multi_procs would make uc pick "the most recent"
+            # binary from its own data dir instead, so it is not passed here.
+            return uc.Chrome(
+                options=options,
+                driver_executable_path=driver_path,
+                use_subprocess=getattr(self, "use_subprocess", False),
+                version_main=CHROMEDRIVER_VERSION_MAIN,
+            )
         return uc.Chrome(
             options=options,
             use_subprocess=getattr(self, "use_subprocess", False),
             user_multi_procs=getattr(self, "user_multi_procs", False),
-            version_main=146,
+            version_main=CHROMEDRIVER_VERSION_MAIN,
         )
 
     def _capture_cleanup_metadata(self, browser) -> dict:
@@ -1383,6 +2863,7 @@ class ChromeDriver(driver.Driver):
             "headless": self.run_headless,
             "useSubprocess": self.use_subprocess,
             "userMultiProcs": getattr(self, "user_multi_procs", False),
+            "launchProfile": getattr(self, "launch_profile", LAUNCH_PROFILE_DEFAULT),
             "hasDisplayServer": self.has_display_server,
             "configuredChromeProfilePath": self.chrome_profile_path,
             "chromeProfilePath": self.active_chrome_profile_path,
@@ -1424,9 +2905,21 @@ Object.defineProperty(navigator, 'languages', {{
         )
 
     def close(self):
-        if getattr(self, "_closed", False):
-            return
+        # The reaper and the atexit cleanup may close the same driver at
+        # once; the second caller waits here and then sees _closed.
+        with self._get_close_lock():
+            if getattr(self, "_closed", False):
+                return
+            self._close_locked()
 
+    def _get_close_lock(self) -> threading.Lock:
+        lock = getattr(self, "_close_lock", None)
+        if lock is None:
+            with _driver_lock:
+                lock = self.__dict__.setdefault("_close_lock", threading.Lock())
+        return lock
+
+    def _close_locked(self):
         log_fd_status("ChromeDriver.close start")
         browser = getattr(self, "driver", None)
         cleanup_start_time = time.time()
@@ -1449,7 +2942,8 @@ Object.defineProperty(navigator, 'languages', {{
         
         quit_succeeded = False
         try:
-            browser.quit()
+            with metrics.timePhase("quit"):
+                browser.quit()
             quit_succeeded = True
             logger.info("Chrome driver quit() returned successfully")
         except Exception as e:
@@ -1462,10 +2956,14 @@ Object.defineProperty(navigator, 'languages', {{
             else:
                 logger.exception("Chrome driver quit failed; starting fallback cleanup")
         
+        # Step 0: Contained browsers are torn down with one group/cgroup kill
+        self._teardown_process_container()
+        
         # Step 1: Verify actual process termination (regardless of quit success)
-        all_terminated = self._verify_and_force_terminate_processes(
-            browser_pid, service_pid, timeout=BROWSER_CLEANUP_TIMEOUT
-        )
+        with metrics.timePhase("process_verify"):
+            all_terminated = self._verify_and_force_terminate_processes(
+                browser_pid, service_pid, timeout=BROWSER_CLEANUP_TIMEOUT
+            )
         
         if not all_terminated:
             logger.warning(
@@ -1479,6 +2977,7 @@ Object.defineProperty(navigator, 'languages', {{
         
         # Step 3: Final cleanup
         cleanup_elapsed = time.time() - cleanup_start_time
+        metrics.recordPhase("close", cleanup_elapsed)
         logger.info(
             "Chrome driver close completed in %.1fs: quit_succeeded=%s, "
             "browser_pid=%s, service_pid=%s, all_terminated=%s",
@@ -1491,16 +2990,36 @@ Object.defineProperty(navigator, 'languages', {{
         # Unregister from tracking
         with _driver_lock:
             _active_drivers.discard(self)
+        _memory_admission.notify_released()
         
         # Release profile lock
         self._release_profile_lock_if_held()
         
         log_fd_status("ChromeDriver.close complete")
     
+    def _teardown_process_container(self):
+        """Terminate and release this browser's process container, if any."""
+        container = getattr(self, "_process_container", None)
+        if container is None:
+            return
+        self._process_container = None
+        try:
+            with metrics.timePhase("container_teardown"):
+                if not container.terminate(timeout=BROWSER_CLEANUP_TIMEOUT):
+                    logger.error("Contained processes survived teardown: %s", container.describe())
+        except Exception:
+            logger.exception("Failed to tear down %s", container.describe())
+        finally:
+            container.release()
+    
     def _release_profile_lock_if_held(self):
         """Release profile lock if this instance holds it."""
         if getattr(self, "_profile_lock_acquired", False) and getattr(self, "chrome_profile_path", None):
-            _release_profile_lock(self.chrome_profile_path)
+            if getattr(self, "_profile_slot_acquired", False):
+                _profile_slot_allocator.release(self.chrome_profile_path)
+                self._profile_slot_acquired = False
+            else:
+                _release_profile_lock(self.chrome_profile_path)
             self._profile_lock_acquired = False
     
     def _verify_and_force_terminate_processes(
@@ -1525,11 +3044,11 @@ Object.defineProperty(navigator, 'languages', {{
             return True
         
         # First, wait briefly for graceful termination
-        time.sleep(0.5)
+        alive_pids = _wait_for_pids_exit([pid for _, pid in pids_to_check], 0.5)
         
         still_alive = []
         for name, pid in pids_to_check:
-            if _is_pid_alive(pid):
+            if pid in alive_pids:
                 still_alive.append((name, pid))
                 logger.warning("Process still alive after quit: %s (pid=%d)", name, pid)
         
@@ -1621,61 +3140,70 @@ Object.defineProperty(navigator, 'languages', {{
             return False
 
         attempted = False
+
+        # Without known pids, look the processes up in one /proc snapshot;
+        # pkill is only used when /proc cannot be read.
+        match_profile = bool(profile_path) and browser_pid is None
+        match_port = bool(service_port) and service_pid is None
+        table = ProcessTable.read() if match_profile or match_port else None
+        if table is not None:
+            matched_pids = []
+            if match_profile:
+                matched_pids.extend(p["pid"] for p in table.processes_using_profile(profile_path))
+            if match_port:
+                matched_pids.extend(table.pids_with_arg(f"--port={service_port}"))
+            for pid in matched_pids:
+                if pid not in pids_to_kill and pid != os.getpid():
+                    pids_to_kill.append(pid)
+        use_pkill = table is None
         
         # Phase 1: SIGTERM
         for pid in pids_to_kill:
             attempted = self._signal_pid(pid, signal.SIGTERM) or attempted
 
-        if profile_path and browser_pid is None:
+        if match_profile and use_pkill:
             attempted = self._pkill_pattern(
                 "TERM", f"--user-data-dir={profile_path}"
             ) or attempted
 
-        if service_port and service_pid is None:
+        if match_port and use_pkill:
             attempted = self._pkill_pattern(
                 "TERM", f"--port={service_port}"
             ) or attempted
 
-        # Wait for graceful termination with polling
+        # Wait for graceful termination
         if attempted:
-            for _ in range(5):  # 0.5s total
-                time.sleep(0.1)
-                pids_to_kill = [pid for pid in pids_to_kill if _is_pid_alive(pid)]
-                if not pids_to_kill:
-                    logger.info("All processes terminated after SIGTERM in fallback cleanup")
-                    return True
+            pids_to_kill = _wait_for_pids_exit(pids_to_kill, 0.5)
+            if not pids_to_kill:
+                logger.info("All processes terminated after SIGTERM in fallback cleanup")
+                return True
 
         # Phase 2: SIGKILL for remaining
         for pid in pids_to_kill:
             attempted = self._signal_pid(pid, FORCE_KILL_SIGNAL) or attempted
 
-        if profile_path and browser_pid is None:
+        if match_profile and use_pkill:
             attempted = self._pkill_pattern(
                 "KILL", f"--user-data-dir={profile_path}"
             ) or attempted
 
-        if service_port and service_pid is None:
+        if match_port and use_pkill:
             attempted = self._pkill_pattern(
                 "KILL", f"--port={service_port}"
             ) or attempted
 
-        # Final verification with polling (longer wait for SIGKILL)
-        for _ in range(15):  # 3s total
-            time.sleep(0.2)
-            still_alive = [pid for pid in pids_to_kill if _is_pid_alive(pid)]
-            if not still_alive:
-                logger.info("All processes terminated after SIGKILL in fallback cleanup")
-                return True
-        
-        still_alive = [pid for pid in pids_to_kill if _is_pid_alive(pid)]
+        # Final verification (longer wait for SIGKILL)
+        still_alive = _wait_for_pids_exit(pids_to_kill, 3.0)
+        if not still_alive:
+            logger.info("All processes terminated after SIGKILL in fallback cleanup")
+            return True
         
         # Try to reap any zombie processes
         if still_alive:
             logger.info("Attempting to reap zombies in fallback cleanup: %s", still_alive)
             for pid in still_alive:
                 _reap_zombie(pid)
-            time.sleep(0.1)
-            still_alive = [pid for pid in still_alive if _is_pid_alive(pid)]
+            still_alive = _wait_for_pids_exit(still_alive, 0.1)
         
         if still_alive:
             # Log D-state processes for debugging
@@ -1734,6 +3262,12 @@ Object.defineProperty(navigator, 'languages', {{
 
     def goTo(self, url):
         self.driver.get(url)
+        if NAVIGATION_WAIT_MODE == "ready":
+            try:
+                self.waitForDocumentReady(NAVIGATION_READY_TIMEOUT)
+            except TimeoutException:
+                logger.warning("Document not ready after navigation: %s", url)
+            return
         self.wait(3)  # 페이지가 완전히 로딩되도록 3초동안 기다림
 
     def findBySelector(self, value):
@@ -1811,6 +3345,139 @@ Object.defineProperty(navigator, 'languages', {{
 
         return WebDriverWait(self.driver, timeout).until(find_matching_selector)
 
+    def startNetworkCapture(self, url_pattern: str):
+        """
+        Start buffering JSON responses whose URL matches `url_pattern`.
+        Events already in the performance log are discarded so the next
+        collectNetworkResponses() only sees traffic from this point on.
+        Call again before each navigation: responses to requests sent before
+        the call are ignored even if they arrive later.
+        """
+        if not NETWORK_CAPTURE_ENABLED:
+            return False
+        self._network_capture_pattern = re.compile(url_pattern)
+        self._network_capture_pending = {}
+        self._network_capture_requests = set()
+        try:
+            self.driver.get_log("performance")
+        except Exception as e:
+            logger.warning("Performance log unavailable; network capture disabled: %s", e)
+            self._network_capture_pattern = None
+            return False
+        return True
+
+    def collectNetworkResponses(self, timeout: float = 10, min_count: int = 1) -> list:
+        """
+        Drain the performance log and return captured responses as
+        [{"url", "status", "body"}], waiting up to `timeout` for `min_count`.
+        """
+        pattern = getattr(self, "_network_capture_pattern", None)
+        if pattern is None:
+            return []
+        pending = self._network_capture_pending
+        requests = self._network_capture_requests
+        responses = []
+        deadline = time.time() + timeout
+        while True:
+            try:
+                entries = self.driver.get_log("performance")
+            except Exception as e:
+                logger.warning("Failed to read performance log: %s", e)
+                return responses
+
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, TypeError, ValueError):
+                    continue
+                method = message.get("method")
+                params = message.get("params") or {}
+                request_id = params.get("requestId")
+                if method == "Network.requestWillBeSent":
+                    request = params.get("request") or {}
+                    if pattern.search(request.get("url", "")):
+                        requests.add(request_id)
+                elif method == "Network.responseReceived":
+                    response = params.get("response") or {}
+                    url = response.get("url", "")
+                    # A late response to a request from the previous page
+                    # must not be credited to this one.
+                    if request_id in requests and pattern.search(url):
+                        pending[request_id] = {
+                            "url": url,
+                            "status": response.get("status"),
+                        }
+                elif method == "Network.loadingFinished" and request_id in pending:
+                    metadata = pending.pop(request_id)
+                    body = self._read_response_body(request_id)
+                    if body is not None:
+                        responses.append({**metadata, "body": body})
+                elif method == "Network.loadingFailed":
+                    pending.pop(request_id, None)
+
+            if len(responses) >= min_count or time.time() >= deadline:
+                return responses
+            time.sleep(NETWORK_CAPTURE_POLL_INTERVAL)
+
+    def _read_response_body(self, request_id: str):
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+        except Exception as e:
+            logger.warning("Network.getResponseBody failed for %s: %s", request_id, e)
+            return None
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def getCookies(self, urls: list):
+        """
+        Read cookies for `urls` through CDP without navigating.
+        Returns None when CDP is unavailable so callers can fall back.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": list(urls)})
+        except Exception as e:
+            logger.warning("Network.getCookies failed: %s", e)
+            return None
+        return result.get("cookies", [])
+
+    def exportCookies(self):
+        """All cookies of the browser (every domain) through CDP, or None on failure."""
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getAllCookies", {})
+        except Exception as e:
+            logger.warning("Network.getAllCookies failed: %s", e)
+            return None
+        return result.get("cookies", [])
+
+    def importCookies(self, cookies: list) -> bool:
+        """Install cookies exported by exportCookies() into this browser's profile."""
+        params = []
+        for cookie in cookies:
+            param = {
+                key: cookie[key]
+                for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+                if cookie.get(key) is not None
+            }
+            # Session cookies come back with expires == -1; omit it to keep them session-scoped.
+            if (cookie.get("expires") or -1) > 0:
+                param["expires"] = cookie["expires"]
+            params.append(param)
+        if not params:
+            return False
+        try:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        except Exception as e:
+            logger.warning("Network.setCookies failed: %s", e)
+            return False
+        return True
+
     def getCurrentUrl(self):
         return self.driver.current_url
 
@@ -1842,12 +3509,27 @@ Object.defineProperty(navigator, 'languages', {{
             self.driver.set_window_size(originalSize['width'], originalSize['height'])
 
     def getBrowserInfo(self):
+        # Capabilities and navigator locale do not change for the lifetime of a
+        # browser, so pooled drivers only pay for this once.
+        cached_info = getattr(self, "_browser_info_cache", None)
+        if cached_info is not None:
+            return dict(cached_info)
+
         capabilities = self.driver.capabilities
         chrome_info = capabilities.get("chrome", {})
         chromedriver_version = chrome_info.get("chromedriverVersion", "")
         if chromedriver_version:
             chromedriver_version = chromedriver_version.split(" ")[0]
-        return {
+        navigator_info = self.executeScript(
+            "return {"
+            "language: navigator.language, "
+            "languages: navigator.languages, "
+            "intlLocale: Intl.DateTimeFormat().resolvedOptions().locale"
+            "};"
+        )
+        if not isinstance(navigator_info, dict):
+            navigator_info = {}
+        browser_info = {
             "browserName": capabilities.get("browserName"),
             "browserVersion": capabilities.get("browserVersion"),
             "chromedriverVersion": chromedriver_version,
@@ -1856,12 +3538,12 @@ Object.defineProperty(navigator, 'languages', {{
             "headless": any(
                 argument.startswith("--headless") for argument in self.options.arguments
             ),
-            "language": self.executeScript("return navigator.language;"),
-            "languages": self.executeScript("return navigator.languages;"),
-            "intlLocale": self.executeScript(
-                "return Intl.DateTimeFormat().resolvedOptions().locale;"
-            ),
+            "language": navigator_info.get("language"),
+            "languages": navigator_info.get("languages"),
+            "intlLocale": navigator_info.get("intlLocale"),
         }
+        self._browser_info_cache = browser_info
+        return dict(browser_info)
 
     def executeScript(self, script, *args):
         return self.driver.execute_script(script, *args)
@@ -0,0 +1,115 @@
+import json
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+
+import log
+
+# Optional dependency; without it the shared cookie store stays disabled.
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None  # type: ignore
+    InvalidToken = ValueError  # type: ignore
+
+load_dotenv()
+
+# Both must be set to enable the store. The key is a Fernet key
+# (python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())").
+COOKIE_STORE_PATH = os.getenv("COOKIE_STORE_PATH", "").strip()
+COOKIE_STORE_KEY = os.getenv("COOKIE_STORE_KEY", "").strip()
+NAVER_COOKIE_DOMAIN = "naver.com"
+
+
+def isNaverCookie(cookie: dict) -> bool:
+    domain = str(cookie.get("domain") or "").lstrip(".")
+    return domain == NAVER_COOKIE_DOMAIN or domain.endswith("." + NAVER_COOKIE_DOMAIN)
+
+
+def isCookieAlive(cookie: dict, now: Optional[float] = None) -> bool:
+    now = time.time() if now is None else now
+    expires = cookie.get("expires", -1)
+    return expires is None or expires < 0 or expires > now
+
+
+class CookieStore:
+    """
+    Encrypted on-disk copy of the authenticated Naver cookies.
+
+    Written after every successful login and replayed into browsers whose
+    profile has no session, so several profiles share one login instead of
+    each logging in on its own. Cookies are never written in plaintext: the
+    store is disabled unless `cryptography` is installed and a key is set.
+    """
+
+    def __init__(self, path: str = COOKIE_STORE_PATH, key: str = COOKIE_STORE_KEY):
+        self.path = path
+        self._lock = threading.Lock()
+        self._fernet = None
+        if path and key:
+            if Fernet is None:
+                log.info("COOKIE_STORE_PATH is set but cryptography is not installed; cookie store disabled")
+            else:
+                try:
+                    self._fernet = Fernet(key.encode("utf-8"))
+                except ValueError as e:
+                    log.error("Invalid COOKIE_STORE_KEY; cookie store disabled", e)
+        elif path:
+            log.info("COOKIE_STORE_PATH is set without COOKIE_STORE_KEY; refusing to store plaintext cookies")
+
+    def isEnabled(self) -> bool:
+        return self._fernet is not None
+
+    def save(self, cookies: Iterable[dict]) -> int:
+        naverCookies = [cookie for cookie in cookies if isNaverCookie(cookie)]
+        if not self.isEnabled() or not naverCookies:
+            return 0
+        payload = json.dumps(
+            {"savedAt": time.time(), "cookies": naverCookies}, ensure_ascii=False
+        ).encode("utf-8")
+        token = self._fernet.encrypt(payload)
+
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tempPath = f"{self.path}.{os.getpid()}.tmp"
+            fd = os.open(tempPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as file:
+                file.write(token)
+            os.replace(tempPath, self.path)
+        log.info(f"Shared cookie store updated: {len(naverCookies)} cookies")
+        return len(naverCookies)
+
+    def load(self) -> Optional[list]:
+        """Unexpired cookies from the store, or None when nothing usable is stored."""
+        if not self.isEnabled():
+            return None
+        with self._lock:
+            try:
+                with open(self.path, "rb") as file:
+                    token = file.read()
+            except FileNotFoundError:
+                return None
+        try:
+            payload = json.loads(self._fernet.decrypt(token))
+        except (InvalidToken, ValueError) as e:
+            log.error("Shared cookie store could not be decrypted", e)
+            return None
+
+        now = time.time()
+        cookies = [cookie for cookie in payload.get("cookies", []) if isCookieAlive(cookie, now)]
+        return cookies or None
+
+    def clear(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+cookieStore = CookieStore()
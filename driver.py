@@ -1,5 +1,121 @@
 from abc import *
 
+from selenium.common.exceptions import TimeoutException
+
+# execute_async_script bodies shared by the Selenium drivers. Both resolve as
+# soon as a MutationObserver sees the awaited DOM state instead of waiting for
+# the next poll tick.
+
+# arguments: [selectors, texts, timeoutMs, callback]
+# resolves: {"selector", "count"} | {"text"} | {"timedOut": true}
+DOM_MATCH_OBSERVER_SCRIPT = """
+const selectors = arguments[0] || [];
+const texts = arguments[1] || [];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const check = () => {
+    for (const selector of selectors) {
+        let count = 0;
+        try {
+            count = document.querySelectorAll(selector).length;
+        } catch (e) {
+            count = 0;
+        }
+        if (count > 0) {
+            return {selector: selector, count: count};
+        }
+    }
+    if (texts.length && document.body) {
+        const normalizedText = (document.body.innerText || '').split(/\\s+/).filter(Boolean).join(' ');
+        for (const text of texts) {
+            if (normalizedText.includes(text)) {
+                return {text: text};
+            }
+        }
+    }
+    return null;
+};
+let finished = false;
+let observer = null;
+let timer = null;
+const finish = (result) => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    if (timer) {
+        clearTimeout(timer);
+    }
+    done(result);
+};
+const initial = check();
+if (initial) {
+    finish(initial);
+    return;
+}
+observer = new MutationObserver(() => {
+    const result = check();
+    if (result) {
+        finish(result);
+    }
+});
+observer.observe(document.documentElement || document, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+});
+timer = setTimeout(() => finish({timedOut: true}), timeoutMs);
+"""
+
+# arguments: [selector, previousText, timeoutMs, callback]
+# resolves: {"text"} once the element text differs from previousText | {"timedOut": true}
+TEXT_CHANGE_OBSERVER_SCRIPT = """
+const selector = arguments[0];
+const previousText = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const readText = () => {
+    const element = document.querySelector(selector);
+    return element ? (element.textContent || '').trim() : null;
+};
+let finished = false;
+let observer = null;
+let timer = null;
+const finish = (result) => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    if (timer) {
+        clearTimeout(timer);
+    }
+    done(result);
+};
+const check = () => {
+    const text = readText();
+    if (text !== null && text !== previousText) {
+        finish({text: text});
+    }
+};
+check();
+if (finished) {
+    return;
+}
+observer = new MutationObserver(check);
+observer.observe(document.documentElement || document, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+});
+timer = setTimeout(() => finish({timedOut: true}), timeoutMs);
+"""
+
 
 class Driver(metaclass=ABCMeta):
 
@@ -47,6 +163,22 @@ class Driver(metaclass=ABCMeta):
     def executeScript(self, script):
         pass
 
+    def executeAsyncScript(self, script, *args, timeout=10):
+        # Leave headroom over the in-page timer so the JS side resolves first.
+        try:
+            previousTimeout = self.driver.timeouts.script
+        except Exception:
+            previousTimeout = None
+        self.driver.set_script_timeout(timeout + 5)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        except TimeoutException:
+            return {"timedOut": True}
+        finally:
+            # Later execute_async_script calls keep the session's own timeout.
+            if previousTimeout is not None:
+                self.driver.set_script_timeout(previousTimeout)
+
     @abstractmethod
     def findChildElementsByXpath(self):
         pass
@@ -67,6 +199,44 @@ class Driver(metaclass=ABCMeta):
     def waitForAnySelector(self):
         pass
 
+    def waitForDomMatch(self, selectors, texts=(), timeout=10):
+        return self.executeAsyncScript(
+            DOM_MATCH_OBSERVER_SCRIPT,
+            list(selectors),
+            list(texts),
+            int(timeout * 1000),
+            timeout=timeout,
+        )
+
+    def waitForTextChange(self, selector, previousText, timeout=10):
+        return self.executeAsyncScript(
+            TEXT_CHANGE_OBSERVER_SCRIPT,
+            selector,
+            previousText,
+            int(timeout * 1000),
+            timeout=timeout,
+        )
+
+    @abstractmethod
+    def startNetworkCapture(self):
+        pass
+
+    @abstractmethod
+    def collectNetworkResponses(self):
+        pass
+
+    @abstractmethod
+    def getCookies(self):
+        pass
+
+    @abstractmethod
+    def exportCookies(self):
+        pass
+
+    @abstractmethod
+    def importCookies(self):
+        pass
+
     @abstractmethod
     def getCurrentUrl(self):
         pass
@@ -130,6 +130,23 @@ class FirefoxDriver(driver.Driver):
 
         return WebDriverWait(self.driver, timeout).until(find_matching_selector)
 
+    def startNetworkCapture(self, url_pattern):
+        # CDP network events are Chrome-only; callers fall back to DOM parsing.
+        return False
+
+    def collectNetworkResponses(self, timeout=10, min_count=1):
+        return []
+
+    def getCookies(self, urls):
+        # WebDriver only exposes cookies of the current page; callers fall back.
+        return None
+
+    def exportCookies(self):
+        return None
+
+    def importCookies(self, cookies):
+        return False
+
     def getCurrentUrl(self):
         return self.driver.current_url
 
@@ -1,15 +1,20 @@
 # -*- coding:utf-8 -*-
 
-from flask import Flask, request, send_from_directory, render_template
+from flask import Flask, Response, g, request, send_from_directory, render_template
 from flask_restx import Api, Resource, fields, Namespace
 import syncManager
 import chromeDriver
+import metrics
 from chromeDriver import (
     create_browser,
     BrowserStartupError,
     FDExhaustedError,
+    MemoryExhaustedError,
     ensure_chromedriver_patched,
 )
+from jobQueue import JobQueue, JobQueueFullError
+from bookingSnapshotStore import snapshotStore
+from requestCoalescer import SyncOutCoalescer
 
 from dotenv import load_dotenv
 import datetime
@@ -18,6 +23,7 @@ import os
 import logging
 import mimetypes
 import shutil
+import time
 import log
 
 load_dotenv()
@@ -31,10 +37,33 @@ if not os.path.isdir("logs"):
 logger: logging.Logger = log.getLogger("logs/server.log")
 logger.setLevel(logging.INFO)
 
+syncJobQueue = JobQueue()
+syncOutCoalescer = SyncOutCoalescer(syncManager.trimBookingsToMonthSize)
+
 app = Flask(__name__)
 app.config["JSON_AS_ASCII"] = False
 app.config["RESTX_MASK_SWAGGER"] = False
 
+
+@app.before_request
+def startRequestTimer():
+    g.requestStartedAt = time.perf_counter()
+
+
+@app.after_request
+def recordRequestMetrics(response):
+    startedAt = g.pop("requestStartedAt", None)
+    # url_rule 은 "/debug/diagnostics/<string:session_id>" 형태라 라벨 수가 늘지 않음
+    endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    metrics.httpRequestsTotal.inc(
+        endpoint=endpoint, method=request.method, status=response.status_code
+    )
+    if startedAt is not None:
+        metrics.httpRequestSeconds.observe(
+            time.perf_counter() - startedAt, endpoint=endpoint, method=request.method
+        )
+    return response
+
 api = Api(
     app,
     version='1.0',
@@ -78,27 +107,90 @@ def debug_diagnostic_view():
     return render_template("debug_diagnostics.html")
 
 
+@app.get("/metrics")
+def prometheus_metrics():
+    if not checkActivationKeyFromRequest():
+        return {"message": "Invalid Access Key"}, 401
+    return Response(metrics.registry.render(), mimetype="text/plain; version=0.0.4")
+
+
+sync_job_queue_model = api.model('SyncJobQueue', {
+    'workers': fields.Integer(description='작업 워커 수'),
+    'maxPending': fields.Integer(description='최대 대기 작업 수'),
+    'queued': fields.Integer(description='대기 중인 작업 수'),
+    'running': fields.Integer(description='실행 중인 작업 수'),
+    'completed': fields.Integer(description='완료된 작업 수'),
+    'avgWaitSeconds': fields.Float(description='평균 대기 시간(초)'),
+    'avgRunSeconds': fields.Float(description='평균 실행 시간(초)')
+})
+
+sync_job_model = api.model('SyncJob', {
+    'jobId': fields.String(description='작업 ID'),
+    'kind': fields.String(description='작업 종류 ("sync_in" 또는 "sync_out")'),
+    'status': fields.String(description='작업 상태 (queued, running, succeeded, failed)'),
+    'queuePosition': fields.Integer(description='대기열 순번', allow_null=True),
+    'submittedAt': fields.String(description='접수 시각'),
+    'startedAt': fields.String(description='시작 시각', allow_null=True),
+    'finishedAt': fields.String(description='종료 시각', allow_null=True),
+    'waitSeconds': fields.Float(description='대기 시간(초)'),
+    'runSeconds': fields.Float(description='실행 시간(초)', allow_null=True),
+    'statusCode': fields.Integer(description='동기 호출 시의 HTTP 상태 코드', allow_null=True),
+    'result': fields.Raw(description='동기 호출 시의 응답 본문', allow_null=True)
+})
+
+sync_job_accepted_response_model = api.model('SyncJobAcceptedResponse', {
+    'message': fields.String(description='응답 메시지'),
+    'jobId': fields.String(description='작업 ID'),
+    'statusUrl': fields.String(description='작업 상태 조회 URL'),
+    'job': fields.Nested(sync_job_model, description='작업 상태'),
+    'queue': fields.Nested(sync_job_queue_model, description='작업 큐 상태')
+})
+
+sync_job_response_model = api.model('SyncJobResponse', {
+    'message': fields.String(description='응답 메시지'),
+    'job': fields.Nested(sync_job_model, description='작업 상태'),
+    'queue': fields.Nested(sync_job_queue_model, description='작업 큐 상태')
+})
+
+sync_job_queue_response_model = api.model('SyncJobQueueResponse', {
+    'message': fields.String(description='응답 메시지'),
+    'queue': fields.Nested(sync_job_queue_model, description='작업 큐 상태')
+})
+
+sync_job_error_response_model = api.model('SyncJobErrorResponse', {
+    'message': fields.String(description='에러 메시지')
+})
+
+timing_model = api.model('Timing', {
+    'totalSeconds': fields.Float(description='요청 처리 시간(초)'),
+    'phases': fields.Raw(description='브라우저 단계별 소요 시간(초) (예: uc_launch, health_check, quit)')
+})
+
 sync_in_request_model = api.model('SyncInRequest', {
     'activationKey': fields.String(required=True, description='인증 키'),
     'targetDatesStr': fields.String(required=True, description='날짜 문자열 (예: "2024-09-02,2024-09-03")', example='2024-09-02,2024-09-03'),
-    'targetRoom': fields.String(required=True, description='방 타입 ("Yeoyu" 또는 "Yeohang")', enum=['Yeoyu', 'Yeohang'])
+    'targetRoom': fields.String(required=True, description='방 타입 ("Yeoyu" 또는 "Yeohang")', enum=['Yeoyu', 'Yeohang']),
+    'async': fields.Boolean(required=False, default=False, description='true 이면 작업 ID 를 즉시 반환하고 백그라운드에서 실행')
 })
 
 sync_in_success_response_model = api.model('SyncInSuccessResponse', {
     'message': fields.String(description='응답 메시지'),
     'successDates': fields.List(fields.String, description='성공한 날짜 리스트'),
-    'data': fields.Raw(description='요청 데이터')
+    'data': fields.Raw(description='요청 데이터'),
+    'timing': fields.Nested(timing_model, description='단계별 소요 시간', required=False)
 })
 
 sync_in_error_response_model = api.model('SyncInErrorResponse', {
     'message': fields.String(description='에러 메시지'),
-    'data': fields.Raw(description='요청 데이터', required=False)
+    'data': fields.Raw(description='요청 데이터', required=False),
+    'timing': fields.Nested(timing_model, description='단계별 소요 시간', required=False)
 })
 
 @sync_ns.route('/in')
 class SyncNaverReservation(Resource):
     @sync_ns.expect(sync_in_request_model, validate=True)
     @sync_ns.response(200, 'Success', sync_in_success_response_model)
+    @sync_ns.response(202, 'Accepted', sync_job_accepted_response_model)
     @sync_ns.response(401, 'Unauthorized', sync_in_error_response_model)
     @sync_ns.response(500, 'Internal Server Error', sync_in_error_response_model)
     @sync_ns.response(503, 'Service Unavailable', sync_in_error_response_model)
@@ -109,40 +201,9 @@ class SyncNaverReservation(Resource):
         if checkActivationKey(req) == False:
             return {"message": "Invalid Access Key", "data": req}, 401
         
-        targetDatesStr = req.get("targetDatesStr")
-        targetRoom = req["targetRoom"]
-        
-        try:
-            # Use context manager for guaranteed cleanup
-            with create_browser() as driver:
-                log.info(f"targetDatesStr: {targetDatesStr}, targetRoom: {targetRoom}")
-                successDates = syncManager.SyncNaver(driver, targetDatesStr, targetRoom)
-                return {
-                    "message": "Sync Naver Reservation",
-                    "successDates": successDates,
-                    "data": req
-                }, 200
-        except FDExhaustedError as e:
-            log.error("FD exhausted - cannot start browser", e)
-            return {
-                "message": f"Server resource exhausted: {str(e)}",
-                "data": req
-            }, 503
-        except TimeoutError as e:
-            log.error("Browser slot timeout", e)
-            return {
-                "message": f"Server busy: {str(e)}",
-                "data": req
-            }, 503
-        except BrowserStartupError as e:
-            log.error("Browser startup failed", e)
-            return {
-                "message": f"Browser startup failed: {str(e)}",
-                "data": req
-            }, 500
-        except Exception as e:
-            log.error("네이버 예약 정보 변경 실패", e)
-            return {"message": "Sync Naver Reservation Failed"}, 500
+        if req.get("async"):
+            return submitSyncJob("sync_in", lambda: runSyncIn(req), req)
+        return runSyncIn(req)
 
 
 booking_model = api.model('Booking', {
@@ -160,18 +221,33 @@ booking_model = api.model('Booking', {
 
 sync_out_request_model = api.model('SyncOutRequest', {
     'activationKey': fields.String(required=True, description='인증 키'),
-    'monthSize': fields.Integer(required=False, default=1, description='조회할 월 개수')
+    'monthSize': fields.Integer(required=False, default=1, description='조회할 월 개수'),
+    'async': fields.Boolean(required=False, default=False, description='true 이면 작업 ID 를 즉시 반환하고 백그라운드에서 실행'),
+    'delta': fields.Boolean(required=False, default=False, description='true 이면 cursor 이후 변경된 예약만 반환 (BOOKING_SNAPSHOT_DB 필요)'),
+    'cursor': fields.Integer(required=False, description='이전 응답의 cursor. 없으면 저장된 전체 예약을 added 로 반환')
 })
 
 sync_out_success_response_model = api.model('SyncOutSuccessResponse', {
     'message': fields.String(description='응답 메시지'),
     'notCanceledBookingList': fields.List(fields.Nested(booking_model), description='취소 미포함 예약 리스트'),
-    'allBookingList': fields.List(fields.Nested(booking_model), description='전체 예약 리스트')
+    'allBookingList': fields.List(fields.Nested(booking_model), description='전체 예약 리스트'),
+    'cursor': fields.Integer(description='스냅샷 변경 커서 (BOOKING_SNAPSHOT_DB 설정 시)', required=False),
+    'timing': fields.Nested(timing_model, description='단계별 소요 시간', required=False)
+})
+
+sync_out_delta_response_model = api.model('SyncOutDeltaResponse', {
+    'message': fields.String(description='응답 메시지'),
+    'cursor': fields.Integer(description='다음 delta 요청에 사용할 커서'),
+    'added': fields.List(fields.Nested(booking_model), description='새로 발견된 예약'),
+    'modified': fields.List(fields.Nested(booking_model), description='내용이 바뀐 예약'),
+    'cancelled': fields.List(fields.Nested(booking_model), description='취소된 예약'),
+    'timing': fields.Nested(timing_model, description='단계별 소요 시간', required=False)
 })
 
 sync_out_error_response_model = api.model('SyncOutErrorResponse', {
     'message': fields.String(description='에러 메시지'),
-    'data': fields.Raw(description='요청 데이터', required=False)
+    'data': fields.Raw(description='요청 데이터', required=False),
+    'timing': fields.Nested(timing_model, description='단계별 소요 시간', required=False)
 })
 
 diagnostic_file_model = api.model('DiagnosticFile', {
@@ -223,6 +299,8 @@ diagnostic_bulk_delete_response_model = api.model('DiagnosticBulkDeleteResponse'
 class GetNaverReservation(Resource):
     @sync_ns.expect(sync_out_request_model, validate=True)
     @sync_ns.response(200, 'Success', sync_out_success_response_model)
+    @sync_ns.response(202, 'Accepted', sync_job_accepted_response_model)
+    @sync_ns.response(400, 'Bad Request', sync_out_error_response_model)
     @sync_ns.response(401, 'Unauthorized', sync_out_error_response_model)
     @sync_ns.response(500, 'Internal Server Error', sync_out_error_response_model)
     @sync_ns.response(503, 'Service Unavailable', sync_out_error_response_model)
@@ -232,44 +310,16 @@ class GetNaverReservation(Resource):
         
         if checkActivationKey(req) == False:
             return {"message": "Invalid Access Key", "data": {}}, 401
-        
-        monthSize = req.get("monthSize", 1)
-        if monthSize is None:
-            monthSize = 1
-        
-        try:
-            # Use context manager for guaranteed cleanup
-            with create_browser() as driver:
-                log.info(f"monthSize: {monthSize}")
-                notCanceledBookingList, allBookingList = syncManager.getNaverReservation(
-                    driver, monthSize
-                )
-                log.info(
-                    f"네이버 예약 정보 가져오기 성공(notCanceledBookingList): {notCanceledBookingList}"
-                )
-                return {
-                    "message": "Sync Naver Reservation",
-                    "notCanceledBookingList": notCanceledBookingList,
-                    "allBookingList": allBookingList,
-                }, 200
-        except FDExhaustedError as e:
-            log.error("FD exhausted - cannot start browser", e)
-            return {
-                "message": f"Server resource exhausted: {str(e)}"
-            }, 503
-        except TimeoutError as e:
-            log.error("Browser slot timeout", e)
-            return {
-                "message": f"Server busy: {str(e)}"
-            }, 503
-        except BrowserStartupError as e:
-            log.error("Browser startup failed", e)
+
+        if req.get("delta") and not snapshotStore.isEnabled():
             return {
-                "message": f"Browser startup failed: {str(e)}"
-            }, 500
-        except Exception as e:
-            log.error("네이버 예약 정보 가져오기 실패", e)
-            return {"message": f"Get Naver Reservation Failed: {str(e)}"}, 500
+                "message": "Delta mode requires BOOKING_SNAPSHOT_DB to be configured",
+                "data": {},
+            }, 400
+
+        if req.get("async"):
+            return submitSyncJob("sync_out", lambda: runSyncOut(req), req)
+        return runSyncOut(req)
 
 
 @debug_ns.route('/diagnostics')
@@ -346,6 +396,168 @@ class DiagnosticSession(Resource):
         return {"message": "Diagnostic Session Deleted", "sessionId": session_id}, 200
 
 
+@sync_ns.route('/jobs')
+class SyncJobQueueStatus(Resource):
+    @sync_ns.response(200, 'Success', sync_job_queue_response_model)
+    @sync_ns.response(401, 'Unauthorized', sync_job_error_response_model)
+    def get(self):
+        """비동기 동기화 작업 큐 상태 조회"""
+        if not checkActivationKeyFromRequest():
+            return {"message": "Invalid Access Key"}, 401
+
+        return {"message": "Sync Job Queue", "queue": syncJobQueue.getStats()}, 200
+
+
+@sync_ns.route('/jobs/<string:job_id>')
+class SyncJobStatus(Resource):
+    @sync_ns.response(200, 'Success', sync_job_response_model)
+    @sync_ns.response(401, 'Unauthorized', sync_job_error_response_model)
+    @sync_ns.response(404, 'Not Found', sync_job_error_response_model)
+    def get(self, job_id: str):
+        """비동기 동기화 작업 상태 및 결과 조회"""
+        if not checkActivationKeyFromRequest():
+            return {"message": "Invalid Access Key"}, 401
+
+        job = syncJobQueue.get(job_id)
+        if job is None:
+            return {"message": "Sync Job Not Found"}, 404
+        return {"message": "Sync Job", "job": job, "queue": syncJobQueue.getStats()}, 200
+
+
+def runSyncIn(req):
+    return runWithTiming(_runSyncIn, req)
+
+
+def runSyncOut(req):
+    return runWithTiming(_runSyncOut, req)
+
+
+def runWithTiming(func, req):
+    with metrics.collectTimings() as timing:
+        body, statusCode = func(req)
+    body["timing"] = timing.toDict()
+    return body, statusCode
+
+
+def _runSyncIn(req):
+    targetDatesStr = req.get("targetDatesStr")
+    targetRoom = req["targetRoom"]
+
+    try:
+        # Use context manager for guaranteed cleanup
+        with create_browser() as driver:
+            log.info(f"targetDatesStr: {targetDatesStr}, targetRoom: {targetRoom}")
+            successDates = syncManager.SyncNaver(driver, targetDatesStr, targetRoom)
+            return {
+                "message": "Sync Naver Reservation",
+                "successDates": successDates,
+                "data": req
+            }, 200
+    except FDExhaustedError as e:
+        log.error("FD exhausted - cannot start browser", e)
+        return {
+            "message": f"Server resource exhausted: {str(e)}",
+            "data": req
+        }, 503
+    except MemoryExhaustedError as e:
+        log.error("Memory exhausted - cannot start browser", e)
+        return {
+            "message": f"Server memory exhausted: {str(e)}",
+            "data": req
+        }, 503
+    except TimeoutError as e:
+        log.error("Browser slot timeout", e)
+        return {
+            "message": f"Server busy: {str(e)}",
+            "data": req
+        }, 503
+    except BrowserStartupError as e:
+        log.error("Browser startup failed", e)
+        return {
+            "message": f"Browser startup failed: {str(e)}",
+            "data": req
+        }, 500
+    except Exception as e:
+        log.error("네이버 예약 정보 변경 실패", e)
+        return {"message": "Sync Naver Reservation Failed"}, 500
+    finally:
+        # 예약 가능 여부가 바뀌었을 수 있으므로 /sync/out 결과를 재사용하지 않음
+        syncOutCoalescer.invalidate()
+
+
+def _runSyncOut(req):
+    monthSize = req.get("monthSize", 1)
+    if monthSize is None:
+        monthSize = 1
+
+    def scrape():
+        # Use context manager for guaranteed cleanup
+        with create_browser() as driver:
+            log.info(f"monthSize: {monthSize}")
+            return syncManager.getNaverReservation(driver, monthSize)
+
+    try:
+        (notCanceledBookingList, allBookingList), source = syncOutCoalescer.run(
+            monthSize, scrape
+        )
+        log.info(
+            f"네이버 예약 정보 가져오기 성공(notCanceledBookingList, source={source}): {notCanceledBookingList}"
+        )
+        if req.get("delta"):
+            changes = snapshotStore.getChangesSince(req.get("cursor"))
+            return {"message": "Sync Naver Reservation Changes", **changes}, 200
+        response = {
+            "message": "Sync Naver Reservation",
+            "notCanceledBookingList": notCanceledBookingList,
+            "allBookingList": allBookingList,
+        }
+        if snapshotStore.isEnabled():
+            response["cursor"] = snapshotStore.getCursor()
+        return response, 200
+    except FDExhaustedError as e:
+        log.error("FD exhausted - cannot start browser", e)
+        return {
+            "message": f"Server resource exhausted: {str(e)}"
+        }, 503
+    except MemoryExhaustedError as e:
+        log.error("Memory exhausted - cannot start browser", e)
+        return {
+            "message": f"Server memory exhausted: {str(e)}"
+        }, 503
+    except TimeoutError as e:
+        log.error("Browser slot timeout", e)
+        return {
+            "message": f"Server busy: {str(e)}"
+        }, 503
+    except BrowserStartupError as e:
+        log.error("Browser startup failed", e)
+        return {
+            "message": f"Browser startup failed: {str(e)}"
+        }, 500
+    except syncManager.ReservationLookupError as e:
+        log.error("네이버 예약 정보 가져오기 실패", e)
+        metrics.reservationLookupErrorsTotal.inc(reason=e.errorType)
+        return {"message": f"Get Naver Reservation Failed: {str(e)}"}, 500
+    except Exception as e:
+        log.error("네이버 예약 정보 가져오기 실패", e)
+        return {"message": f"Get Naver Reservation Failed: {str(e)}"}, 500
+
+
+def submitSyncJob(kind: str, func, req):
+    try:
+        job = syncJobQueue.submit(kind, func)
+    except JobQueueFullError as e:
+        log.error("Sync job queue full", e)
+        return {"message": f"Server busy: {str(e)}", "queue": syncJobQueue.getStats()}, 503
+    return {
+        "message": "Sync Job Accepted",
+        "jobId": job["jobId"],
+        "statusUrl": f"/sync/jobs/{job['jobId']}",
+        "job": job,
+        "queue": syncJobQueue.getStats(),
+    }, 202
+
+
 def checkActivationKey(req):
     if "activationKey" not in req:
         return False
@@ -0,0 +1,186 @@
+import datetime
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+import log
+
+load_dotenv()
+
+JOB_WORKERS = int(
+    os.getenv("SYNC_JOB_WORKERS", os.getenv("MAX_CONCURRENT_BROWSERS", "3"))
+)
+JOB_MAX_PENDING = int(os.getenv("SYNC_JOB_MAX_PENDING", "20"))
+JOB_RESULT_TTL = int(os.getenv("SYNC_JOB_RESULT_TTL", "3600"))
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the queue already holds JOB_MAX_PENDING waiting jobs."""
+    pass
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(
+        timestamp, tz=datetime.timezone.utc
+    ).isoformat()
+
+
+class JobQueue:
+    """
+    Bounded worker pool for /sync/* scrapes.
+
+    A job wraps a callable returning `(responseBody, statusCode)` - the same
+    tuple the synchronous Flask handlers return - so the caller can poll
+    for exactly the response it would have received synchronously.
+    """
+
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        maxPending: int = JOB_MAX_PENDING,
+        resultTtl: int = JOB_RESULT_TTL,
+    ):
+        self.workers = max(1, workers)
+        self.maxPending = max(1, maxPending)
+        self.resultTtl = resultTtl
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="sync-job"
+        )
+        self._jobs: dict = {}
+        self._lock = threading.Lock()
+        self._completedCount = 0
+        self._totalWaitSeconds = 0.0
+        self._totalRunSeconds = 0.0
+
+    def submit(self, kind: str, func: Callable[[], Tuple[dict, int]]) -> dict:
+        self._pruneExpired()
+        with self._lock:
+            queuedCount = self._countByStatus(JOB_STATUS_QUEUED)
+            if queuedCount >= self.maxPending:
+                raise JobQueueFullError(
+                    f"Sync job queue is full ({queuedCount}/{self.maxPending} queued)"
+                )
+            jobId = uuid.uuid4().hex
+            job = {
+                "jobId": jobId,
+                "kind": kind,
+                "status": JOB_STATUS_QUEUED,
+                "submittedAt": time.time(),
+                "startedAt": None,
+                "finishedAt": None,
+                "statusCode": None,
+                "result": None,
+            }
+            self._jobs[jobId] = job
+
+        log.info(f"Sync job queued: jobId={jobId}, kind={kind}")
+        self._executor.submit(self._run, jobId, func)
+        return self.get(jobId)
+
+    def get(self, jobId: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(jobId)
+            if job is None:
+                return None
+            return self._describe(job)
+
+    def getStats(self) -> dict:
+        with self._lock:
+            completed = self._completedCount
+            return {
+                "workers": self.workers,
+                "maxPending": self.maxPending,
+                "queued": self._countByStatus(JOB_STATUS_QUEUED),
+                "running": self._countByStatus(JOB_STATUS_RUNNING),
+                "completed": completed,
+                "avgWaitSeconds": round(self._totalWaitSeconds / completed, 3)
+                if completed
+                else 0.0,
+                "avgRunSeconds": round(self._totalRunSeconds / completed, 3)
+                if completed
+                else 0.0,
+            }
+
+    def _run(self, jobId: str, func: Callable[[], Tuple[dict, int]]):
+        with self._lock:
+            job = self._jobs[jobId]
+            job["status"] = JOB_STATUS_RUNNING
+            job["startedAt"] = time.time()
+        log.info(
+            f"Sync job started: jobId={jobId}, waitSeconds={job['startedAt'] - job['submittedAt']:.1f}"
+        )
+
+        try:
+            result, statusCode = func()
+        except Exception as e:
+            log.error(f"Sync job crashed: jobId={jobId}", e)
+            result, statusCode = {"message": f"Sync job failed: {str(e)}"}, 500
+
+        with self._lock:
+            job["finishedAt"] = time.time()
+            job["result"] = result
+            job["statusCode"] = statusCode
+            job["status"] = (
+                JOB_STATUS_SUCCEEDED if statusCode < 400 else JOB_STATUS_FAILED
+            )
+            self._completedCount += 1
+            self._totalWaitSeconds += job["startedAt"] - job["submittedAt"]
+            self._totalRunSeconds += job["finishedAt"] - job["startedAt"]
+        log.info(
+            f"Sync job finished: jobId={jobId}, status={job['status']}, "
+            f"runSeconds={job['finishedAt'] - job['startedAt']:.1f}"
+        )
+
+    def _describe(self, job: dict) -> dict:
+        now = time.time()
+        startedAt = job["startedAt"]
+        finishedAt = job["finishedAt"]
+        queuePosition = None
+        if job["status"] == JOB_STATUS_QUEUED:
+            queuePosition = 1 + sum(
+                1
+                for other in self._jobs.values()
+                if other["status"] == JOB_STATUS_QUEUED
+                and other["submittedAt"] < job["submittedAt"]
+            )
+        return {
+            "jobId": job["jobId"],
+            "kind": job["kind"],
+            "status": job["status"],
+            "queuePosition": queuePosition,
+            "submittedAt": _isoformat(job["submittedAt"]),
+            "startedAt": _isoformat(startedAt),
+            "finishedAt": _isoformat(finishedAt),
+            "waitSeconds": round((startedAt or now) - job["submittedAt"], 3),
+            "runSeconds": round((finishedAt or now) - startedAt, 3)
+            if startedAt
+            else None,
+            "statusCode": job["statusCode"],
+            "result": job["result"],
+        }
+
+    def _countByStatus(self, status: str) -> int:
+        return sum(1 for job in self._jobs.values() if job["status"] == status)
+
+    def _pruneExpired(self):
+        cutoff = time.time() - self.resultTtl
+        with self._lock:
+            expiredIds = [
+                jobId
+                for jobId, job in self._jobs.items()
+                if job["finishedAt"] is not None and job["finishedAt"] < cutoff
+            ]
+            for jobId in expiredIds:
+                del self._jobs[jobId]
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+import log
+
+load_dotenv()
+
+NAVER_AUTH_COOKIES = ("NID_AUT", "NID_SES")
+NAVER_COOKIE_URLS = ["https://nid.naver.com", "https://www.naver.com"]
+NAVER_LOGIN_HOST = "nid.naver.com"
+LOGIN_SESSION_TTL = float(os.getenv("LOGIN_SESSION_TTL", "600"))
+
+_DRIVER_VERIFIED_AT_ATTR = "_naverLoginVerifiedAt"
+
+
+def isLoginRedirect(url) -> bool:
+    if not isinstance(url, str) or not url:
+        return False
+    return urlparse(url).netloc == NAVER_LOGIN_HOST
+
+
+def hasValidAuthCookies(cookies: list, now: Optional[float] = None) -> bool:
+    now = time.time() if now is None else now
+    validNames = set()
+    for cookie in cookies:
+        if not isinstance(cookie, dict) or not cookie.get("value"):
+            continue
+        expires = cookie.get("expires", -1)
+        # CDP reports session cookies with expires == -1
+        if expires is None or expires < 0 or expires > now:
+            validNames.add(cookie.get("name"))
+    return all(name in validNames for name in NAVER_AUTH_COOKIES)
+
+
+class LoginSessionManager:
+    """
+    Cheap Naver login-state checks with a short-lived verified cache.
+
+    State is cached per Chrome profile path, because cookies live in the
+    profile and outlast a single browser, or on the driver itself when it
+    has no profile. `check()` returns None when cookies cannot be read, so
+    the caller can fall back to the naver.com page check.
+    """
+
+    def __init__(self, ttl: float = LOGIN_SESSION_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._verifiedAt: dict = {}
+
+    def check(self, driverInstance) -> Optional[bool]:
+        verifiedAt = self._getVerifiedAt(driverInstance)
+        if verifiedAt is not None and time.time() - verifiedAt < self.ttl:
+            log.info("[Session Check] ✓ 캐시된 로그인 세션 사용 - 확인 생략")
+            return True
+
+        try:
+            cookies = driverInstance.getCookies(NAVER_COOKIE_URLS)
+        except Exception as e:
+            log.error("[Session Check] 쿠키 조회 실패", e)
+            return None
+        if not isinstance(cookies, list):
+            return None
+
+        if hasValidAuthCookies(cookies):
+            log.info("[Session Check] ✓ NID 인증 쿠키 확인 - 로그인 스킵")
+            self.markLoggedIn(driverInstance)
+            return True
+        log.info("[Session Check] ✗ NID 인증 쿠키 없음 - 로그인 필요")
+        self.invalidate(driverInstance)
+        return False
+
+    def markLoggedIn(self, driverInstance):
+        self._setVerifiedAt(driverInstance, time.time())
+
+    def invalidate(self, driverInstance):
+        self._setVerifiedAt(driverInstance, None)
+
+    def _profileKey(self, driverInstance) -> Optional[str]:
+        profilePath = getattr(driverInstance, "active_chrome_profile_path", None)
+        return profilePath if isinstance(profilePath, str) and profilePath else None
+
+    def _getVerifiedAt(self, driverInstance) -> Optional[float]:
+        profileKey = self._profileKey(driverInstance)
+        if profileKey is not None:
+            with self._lock:
+                return self._verifiedAt.get(profileKey)
+        verifiedAt = getattr(driverInstance, _DRIVER_VERIFIED_AT_ATTR, None)
+        return verifiedAt if isinstance(verifiedAt, float) else None
+
+    def _setVerifiedAt(self, driverInstance, verifiedAt: Optional[float]):
+        profileKey = self._profileKey(driverInstance)
+        if profileKey is not None:
+            with self._lock:
+                if verifiedAt is None:
+                    self._verifiedAt.pop(profileKey, None)
+                else:
+                    self._verifiedAt[profileKey] = verifiedAt
+            return
+        try:
+            setattr(driverInstance, _DRIVER_VERIFIED_AT_ATTR, verifiedAt)
+        except AttributeError:
+            pass
+
+
+loginSessionManager = LoginSessionManager()
@@ -0,0 +1,288 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional, Sequence
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _formatLabels(labelNames: Sequence[str], labelValues: tuple, extra: str = "") -> str:
+    pairs = [
+        f'{name}="{_escapeLabelValue(value)}"' for name, value in zip(labelNames, labelValues)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escapeLabelValue(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatValue(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram rendered in the Prometheus text format."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.labelNames = tuple(labelNames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: dict = {}  # labelValues -> {"counts", "sum", "count"}
+
+    def observe(self, value: float, **labels):
+        labelValues = tuple(str(labels.get(name, "")) for name in self.labelNames)
+        with self._lock:
+            series = self._series.get(labelValues)
+            if series is None:
+                series = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._series[labelValues] = series
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def getSnapshot(self) -> dict:
+        with self._lock:
+            return {
+                labelValues: {"sum": series["sum"], "count": series["count"]}
+                for labelValues, series in self._series.items()
+            }
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelValues, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series["counts"]):
+                    cumulative += count
+                    labels = _formatLabels(
+                        self.labelNames, labelValues, f'le="{_formatValue(bound)}"'
+                    )
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _formatLabels(self.labelNames, labelValues, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {series['count']}")
+                labels = _formatLabels(self.labelNames, labelValues)
+                lines.append(f"{self.name}_sum{labels} {_formatValue(series['sum'])}")
+                lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter per label set."""
+
+    def __init__(self, name: str, description: str, labelNames: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labelNames = tuple(labelNames)
+        self._lock = threading.Lock()
+        self._values: dict = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        labelValues = tuple(str(labels.get(name, "")) for name in self.labelNames)
+        with self._lock:
+            self._values[labelValues] = self._values.get(labelValues, 0.0) + amount
+
+    def getValue(self, **labels) -> float:
+        labelValues = tuple(str(labels.get(name, "")) for name in self.labelNames)
+        with self._lock:
+            return self._values.get(labelValues, 0.0)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelValues, value in sorted(self._values.items()):
+                labels = _formatLabels(self.labelNames, labelValues)
+                lines.append(f"{self.name}{labels} {_formatValue(value)}")
+        return lines
+
+
+class Gauge:
+    """
+    Point-in-time value. With `callback` the value is read at render time,
+    so gauges over state owned elsewhere (FDs, live browsers) never go stale.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelNames: Sequence[str] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ):
+        self.name = name
+        self.description = description
+        self.labelNames = tuple(labelNames)
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._values: dict = {}
+
+    def set(self, value: float, **labels):
+        labelValues = tuple(str(labels.get(name, "")) for name in self.labelNames)
+        with self._lock:
+            self._values[labelValues] = value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} gauge"]
+        if self.callback is not None:
+            try:
+                value = self.callback()
+            except Exception:
+                return lines
+            lines.append(f"{self.name} {_formatValue(value)}")
+            return lines
+        with self._lock:
+            for labelValues, value in sorted(self._values.items()):
+                labels = _formatLabels(self.labelNames, labelValues)
+                lines.append(f"{self.name}{labels} {_formatValue(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: dict = {}
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(name, lambda: Histogram(name, description, labelNames, buckets))
+
+    def counter(self, name: str, description: str, labelNames: Sequence[str] = ()) -> Counter:
+        return self._register(name, lambda: Counter(name, description, labelNames))
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labelNames: Sequence[str] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ) -> Gauge:
+        return self._register(name, lambda: Gauge(name, description, labelNames, callback))
+
+    def _register(self, name: str, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+browserPhaseSeconds = registry.histogram(
+    "scraper_browser_phase_seconds",
+    "Time spent in each browser startup/teardown phase.",
+    ("phase",),
+)
+httpRequestsTotal = registry.counter(
+    "scraper_http_requests_total",
+    "HTTP requests handled, by endpoint, method and status code.",
+    ("endpoint", "method", "status"),
+)
+httpRequestSeconds = registry.histogram(
+    "scraper_http_request_duration_seconds",
+    "HTTP request latency by endpoint and method.",
+    ("endpoint", "method"),
+)
+browserSlotWaitSeconds = registry.histogram(
+    "scraper_browser_slot_wait_seconds",
+    "Time spent waiting for a browser slot (MAX_CONCURRENT_BROWSERS semaphore).",
+    ("outcome",),
+)
+bookingsPerMonth = registry.histogram(
+    "scraper_bookings_per_month",
+    "Bookings extracted per calendar month page.",
+    ("mode",),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+browserAdmissionRejectionsTotal = registry.counter(
+    "scraper_browser_admission_rejections_total",
+    "New browsers rejected by memory admission control, by reason.",
+    ("reason",),
+)
+reservationLookupErrorsTotal = registry.counter(
+    "scraper_reservation_lookup_errors_total",
+    "Failed /sync/out booking lookups by ReservationLookupError type.",
+    ("reason",),
+)
+
+
+class TimingCollector:
+    """Per-request sum of phase durations, returned as the response timing block."""
+
+    def __init__(self):
+        self.startedAt = time.perf_counter()
+        self.phases: dict = {}
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def toDict(self) -> dict:
+        return {
+            "totalSeconds": round(time.perf_counter() - self.startedAt, 3),
+            "phases": {phase: round(seconds, 3) for phase, seconds in self.phases.items()},
+        }
+
+
+_local = threading.local()
+
+
+def getTimingCollector() -> Optional[TimingCollector]:
+    return getattr(_local, "collector", None)
+
+
+@contextmanager
+def collectTimings():
+    """Collect phases recorded on this thread into a TimingCollector."""
+    previous = getTimingCollector()
+    collector = TimingCollector()
+    _local.collector = collector
+    try:
+        yield collector
+    finally:
+        _local.collector = previous
+
+
+def recordPhase(phase: str, seconds: float):
+    browserPhaseSeconds.observe(seconds, phase=phase)
+    collector = getTimingCollector()
+    if collector is not None:
+        collector.add(phase, seconds)
+
+
+@contextmanager
+def timePhase(phase: str):
+    # perf_counter keeps phase timing independent of wall-clock patches and jumps.
+    startedAt = time.perf_counter()
+    try:
+        yield
+    finally:
+        recordPhase(phase, time.perf_counter() - startedAt)
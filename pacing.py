@@ -0,0 +1,171 @@
+import os
+import random
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from dotenv import load_dotenv
+
+import log
+
+load_dotenv()
+
+PACING_MODE_FIXED = "fixed"
+PACING_MODE_ADAPTIVE = "adaptive"
+
+PACING_MODE = os.getenv("PACING_MODE", PACING_MODE_FIXED).strip().lower()
+PACING_RATE_PER_MINUTE = float(os.getenv("PACING_RATE_PER_MINUTE", "20"))
+PACING_BURST = float(os.getenv("PACING_BURST", "3"))
+PACING_MIN_INTERVAL = float(os.getenv("PACING_MIN_INTERVAL", "0.8"))
+PACING_SLOW_PAGE_SECONDS = float(os.getenv("PACING_SLOW_PAGE_SECONDS", "8"))
+PACING_MAX_PENALTY = float(os.getenv("PACING_MAX_PENALTY", "8"))
+PACING_JITTER = float(os.getenv("PACING_JITTER", "0.25"))
+
+
+class Pacer:
+    """
+    Per-host request budget for browser actions against Naver.
+
+    Each host gets a token bucket refilled at `ratePerMinute` with room for
+    `burst` back-to-back actions, plus a minimum gap between actions. Response
+    signals (security keywords, slow pages) raise a per-host penalty that
+    slows the refill and widens the gap; clean pages decay it back to 1.
+    `pace()` only sleeps when the bucket is empty or the gap is not yet met,
+    and every second spent waiting is recorded.
+    """
+
+    def __init__(
+        self,
+        ratePerMinute: float = PACING_RATE_PER_MINUTE,
+        burst: float = PACING_BURST,
+        minInterval: float = PACING_MIN_INTERVAL,
+        slowPageSeconds: float = PACING_SLOW_PAGE_SECONDS,
+        maxPenalty: float = PACING_MAX_PENALTY,
+        jitter: float = PACING_JITTER,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+    ):
+        self.ratePerSecond = max(ratePerMinute, 0.1) / 60.0
+        self.burst = max(1.0, burst)
+        self.minInterval = max(0.0, minInterval)
+        self.slowPageSeconds = slowPageSeconds
+        self.maxPenalty = max(1.0, maxPenalty)
+        self.jitter = max(0.0, jitter)
+        self._clock = clock
+        self._sleeper = sleeper
+        self._lock = threading.Lock()
+        self._hosts: dict = {}
+        self._totalWaitSeconds = 0.0
+        self._waitCount = 0
+        self._paceCount = 0
+
+    def pace(self, host: str, cost: float = 1.0) -> float:
+        """Reserve `cost` tokens for `host`, sleeping only if the budget requires it."""
+        with self._lock:
+            state = self._getHostState(host)
+            now = self._clock()
+            self._refill(state, now)
+
+            penalty = state["penalty"]
+            waitSeconds = 0.0
+            if state["tokens"] < cost:
+                waitSeconds = (cost - state["tokens"]) / (self.ratePerSecond / penalty)
+            nextAllowedAt = state["lastActionAt"] + self.minInterval * penalty
+            waitSeconds = max(waitSeconds, nextAllowedAt - now)
+            if waitSeconds > 0:
+                waitSeconds *= 1 + random.uniform(0, self.jitter)
+
+            # Reserve the slot before sleeping so concurrent callers queue behind it.
+            state["tokens"] -= cost
+            state["lastActionAt"] = now + max(0.0, waitSeconds)
+            self._paceCount += 1
+            if waitSeconds > 0:
+                self._totalWaitSeconds += waitSeconds
+                self._waitCount += 1
+                state["waitSeconds"] += waitSeconds
+
+        if waitSeconds > 0:
+            log.info(
+                f"Pacing wait: host={host}, seconds={waitSeconds:.2f}, penalty={penalty:.2f}"
+            )
+            self._sleeper(waitSeconds)
+        return max(0.0, waitSeconds)
+
+    def recordWait(self, host: str, seconds: float):
+        """Account for a delay taken outside the budget (fixed pacing mode)."""
+        with self._lock:
+            state = self._getHostState(host)
+            state["lastActionAt"] = self._clock()
+            state["waitSeconds"] += seconds
+            self._totalWaitSeconds += seconds
+            self._waitCount += 1
+            self._paceCount += 1
+
+    def recordSignal(
+        self,
+        host: str,
+        detectedKeywords: Optional[Iterable[str]] = None,
+        loadSeconds: Optional[float] = None,
+    ) -> float:
+        detectedKeywords = list(detectedKeywords or [])
+        with self._lock:
+            state = self._getHostState(host)
+            penalty = state["penalty"]
+            if detectedKeywords:
+                penalty *= 2.0
+            elif loadSeconds is not None and loadSeconds >= self.slowPageSeconds:
+                penalty *= 1.5
+            else:
+                penalty *= 0.8
+            state["penalty"] = min(self.maxPenalty, max(1.0, penalty))
+            penalty = state["penalty"]
+
+        if detectedKeywords or penalty > 1.0:
+            log.info(
+                f"Pacing signal: host={host}, keywords={detectedKeywords}, "
+                f"loadSeconds={loadSeconds}, penalty={penalty:.2f}"
+            )
+        return penalty
+
+    def getStats(self) -> dict:
+        with self._lock:
+            return {
+                "paced": self._paceCount,
+                "waits": self._waitCount,
+                "totalWaitSeconds": round(self._totalWaitSeconds, 3),
+                "hosts": {
+                    host: {
+                        "tokens": round(state["tokens"], 3),
+                        "penalty": round(state["penalty"], 3),
+                        "waitSeconds": round(state["waitSeconds"], 3),
+                    }
+                    for host, state in self._hosts.items()
+                },
+            }
+
+    def _getHostState(self, host: str) -> dict:
+        state = self._hosts.get(host)
+        if state is None:
+            state = {
+                "tokens": self.burst,
+                "updatedAt": self._clock(),
+                "lastActionAt": float("-inf"),
+                "penalty": 1.0,
+                "waitSeconds": 0.0,
+            }
+            self._hosts[host] = state
+        return state
+
+    def _refill(self, state: dict, now: float):
+        elapsed = max(0.0, now - state["updatedAt"])
+        state["tokens"] = min(
+            self.burst, state["tokens"] + elapsed * self.ratePerSecond / state["penalty"]
+        )
+        state["updatedAt"] = now
+
+
+pacer = Pacer()
+
+
+def isAdaptive() -> bool:
+    return PACING_MODE == PACING_MODE_ADAPTIVE
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+import log
+
+load_dotenv()
+
+SYNC_OUT_COALESCE = os.getenv("SYNC_OUT_COALESCE", "true").strip().lower() in (
+    "1", "true", "yes", "on"
+)
+SYNC_OUT_CACHE_TTL = float(os.getenv("SYNC_OUT_CACHE_TTL", "0"))
+
+SOURCE_SCRAPE = "scrape"
+SOURCE_INFLIGHT = "inflight"
+SOURCE_CACHE = "cache"
+
+
+class _Flight:
+    def __init__(self, monthSize: int, generation: int):
+        self.monthSize = monthSize
+        self.generation = generation
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SyncOutCoalescer:
+    """
+    Shares one booking scrape between concurrent /sync/out requests.
+
+    A request attaches to a running scrape whose monthSize is at least its own
+    and trims the result to its window, or reuses a cached result younger
+    than `cacheTtl`. `invalidate()` (called after /sync/in) bumps a
+    generation so later requests never see data from before the change.
+    """
+
+    def __init__(
+        self,
+        trimResult: Callable[[tuple, int], tuple],
+        enabled: bool = SYNC_OUT_COALESCE,
+        cacheTtl: float = SYNC_OUT_CACHE_TTL,
+    ):
+        self.trimResult = trimResult
+        self.enabled = enabled
+        self.cacheTtl = cacheTtl
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._flights: list = []
+        self._cache: dict = {}
+
+    def run(self, monthSize: int, scrape: Callable[[], tuple]) -> Tuple[tuple, str]:
+        """Return ((notCanceledBookingList, allBookingList), source)."""
+        if not self.enabled:
+            return scrape(), SOURCE_SCRAPE
+
+        with self._lock:
+            cached = self._findCached(monthSize)
+            if cached is not None:
+                cachedMonthSize, result = cached
+                log.info(
+                    f"Sync out served from cache: monthSize={monthSize}, cachedMonthSize={cachedMonthSize}"
+                )
+                return self._trim(result, cachedMonthSize, monthSize), SOURCE_CACHE
+
+            flight = self._findFlight(monthSize)
+            if flight is not None:
+                flight.waiters += 1
+                owner = False
+            else:
+                flight = _Flight(monthSize, self._generation)
+                self._flights.append(flight)
+                owner = True
+
+        if not owner:
+            log.info(
+                f"Sync out attached to in-flight scrape: monthSize={monthSize}, "
+                f"flightMonthSize={flight.monthSize}"
+            )
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._trim(flight.result, flight.monthSize, monthSize), SOURCE_INFLIGHT
+
+        try:
+            flight.result = scrape()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.remove(flight)
+                if (
+                    flight.error is None
+                    and self.cacheTtl > 0
+                    and flight.generation == self._generation
+                ):
+                    self._cache[flight.monthSize] = (time.time(), flight.result)
+            flight.done.set()
+            if flight.waiters:
+                log.info(
+                    f"Sync out scrape shared with {flight.waiters} waiting request(s): "
+                    f"monthSize={flight.monthSize}"
+                )
+        return flight.result, SOURCE_SCRAPE
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+        log.info("Sync out cache invalidated")
+
+    def _findCached(self, monthSize: int):
+        now = time.time()
+        best = None
+        for cachedMonthSize, (cachedAt, result) in list(self._cache.items()):
+            if now - cachedAt > self.cacheTtl:
+                del self._cache[cachedMonthSize]
+                continue
+            if cachedMonthSize >= monthSize and (best is None or cachedMonthSize < best[0]):
+                best = (cachedMonthSize, result)
+        return best
+
+    def _findFlight(self, monthSize: int) -> Optional[_Flight]:
+        candidates = [
+            flight
+            for flight in self._flights
+            if flight.generation == self._generation and flight.monthSize >= monthSize
+        ]
+        return min(candidates, key=lambda flight: flight.monthSize, default=None)
+
+    def _trim(self, result: tuple, sourceMonthSize: int, monthSize: int) -> tuple:
+        if sourceMonthSize == monthSize:
+            return result
+        return self.trimResult(result, monthSize)
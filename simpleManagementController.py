@@ -2,24 +2,148 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import NoSuchElementException
 from bs4 import BeautifulSoup as bs
 import re
+import math
 import datetime
 from time import sleep
 import log
 
+DATE_INFO_SELECTOR = 'a[class^="DatePeriodCalendar__date-info"]'
+NEXT_PERIOD_BUTTON_SELECTOR = 'button[class*="DatePeriodCalendar__next"]'
+PREV_PERIOD_BUTTON_SELECTOR = 'button[class*="DatePeriodCalendar__prev"]'
+PERIOD_CHANGE_TIMEOUT = 5
+
+# 기간 이동 버튼을 steps 번 연속 클릭. 매 클릭 후 date-info 텍스트가 바뀔 때까지
+# 기다린 뒤 다음 클릭을 하므로 한 번의 왕복으로 여러 기간을 이동함
+# arguments: [buttonSelector, labelSelector, steps, stepTimeoutMs, callback]
+PERIOD_SEEK_SCRIPT = """
+const buttonSelector = arguments[0];
+const labelSelector = arguments[1];
+const steps = arguments[2];
+const stepTimeoutMs = arguments[3];
+const done = arguments[arguments.length - 1];
+const readLabel = () => {
+    const label = document.querySelector(labelSelector);
+    return label ? (label.textContent || '').trim() : null;
+};
+let clicked = 0;
+const waitForChange = (before) => new Promise((resolve) => {
+    let observer = null;
+    let timer = null;
+    const finish = (changed) => {
+        if (observer) {
+            observer.disconnect();
+        }
+        if (timer) {
+            clearTimeout(timer);
+        }
+        resolve(changed);
+    };
+    if (readLabel() !== before) {
+        finish(true);
+        return;
+    }
+    observer = new MutationObserver(() => {
+        if (readLabel() !== before) {
+            finish(true);
+        }
+    });
+    observer.observe(document.documentElement || document, {
+        childList: true,
+        subtree: true,
+        characterData: true,
+    });
+    timer = setTimeout(() => finish(false), stepTimeoutMs);
+});
+const step = async () => {
+    while (clicked < steps) {
+        const button = document.querySelector(buttonSelector);
+        if (!button || button.disabled) {
+            return {clicked: clicked, label: readLabel(), blocked: true};
+        }
+        const before = readLabel();
+        button.click();
+        clicked += 1;
+        if (!(await waitForChange(before))) {
+            return {clicked: clicked, label: readLabel(), stalled: true};
+        }
+    }
+    return {clicked: clicked, label: readLabel()};
+};
+step().then(done, (error) => done({clicked: clicked, label: readLabel(), error: String(error)}));
+"""
+
+# 관리 테이블 전체를 한 번에 읽어 [room][date] 별 첫 번째 label 을 반환
+MANAGEMENT_GRID_SCRIPT = """
+const tbody = document.querySelector('div[class*="SimpleManagement__management-tbody"]');
+if (!tbody) {
+    return null;
+}
+const directDivs = (element, marker) => Array.from(element.children).filter(
+    (child) => child.tagName === 'DIV' && String(child.className).includes(marker)
+);
+return directDivs(tbody, 'SimpleManagement__management-row').map(
+    (row) => directDivs(row, 'SimpleManagement__content').map(
+        (cell) => cell.querySelector('label')
+    )
+);
+"""
+
 
 class SimpleManagementController:
+    def __init__(self):
+        # 현재 화면에 표시된 기간과 그 기간의 관리 테이블 label 인덱스
+        self.currentPeriod = None
+        self._gridIndex = None
+        self.seekBlocked = False
+
+    def getCurrentPeriod(self):
+        return self.currentPeriod
+
+    def invalidateGrid(self):
+        self._gridIndex = None
+
     def findTargetPage(self, driver, targetDate: datetime.date) -> int:
+        if self.currentPeriod is not None:
+            startDate, endDate = self.currentPeriod
+            if startDate <= targetDate <= endDate:
+                return (targetDate - startDate).days
         html = driver.getPageSource()
         searchLimit = 35
         while searchLimit > 0:
             idx = self.findTargetPeriod(targetDate, html, driver)
             if idx != -1:
                 return idx
+            if self.seekBlocked:
+                log.info(f"{targetDate} 기간으로 이동할 수 없음")
+                return -1
+            self.waitForPeriodChange(driver, self.extractDateInfoText(html))
             html = driver.getPageSource()
             searchLimit -= 1
-            sleep(1)
         return -1
 
+    def waitForPeriodChange(self, driver, previousDateInfo: str):
+        # 다음 기간 버튼 클릭 후 date-info 텍스트가 바뀌는 즉시 깨어남
+        if not previousDateInfo:
+            sleep(1)
+            return
+        try:
+            changed = driver.waitForTextChange(
+                DATE_INFO_SELECTOR, previousDateInfo, PERIOD_CHANGE_TIMEOUT
+            )
+        except Exception as e:
+            log.error("Period change wait failed, falling back to sleep", e)
+            changed = None
+        if not isinstance(changed, dict):
+            sleep(1)
+        elif changed.get("timedOut"):
+            log.info("Period change wait timed out")
+
+    def extractDateInfoText(self, html: str) -> str:
+        match = re.search(
+            r'class="DatePeriodCalendar__date-info[^"]*"[^>]*>([^<]*)<', html or ""
+        )
+        return match.group(1).strip() if match else ""
+
     def findTargetPeriod(self, targetDate: datetime.date, html: str, driver) -> int:
         soup = bs(html, "html.parser")
         dateInfo = soup.select('a[class^="DatePeriodCalendar__date-info"]')
@@ -30,7 +154,13 @@ class SimpleManagementController:
             log.info("NEW " + rawDateData[1])
         startDate: datetime.date = self.parseDateInfo(rawDateData[0])
         endDate: datetime.date = self.parseDateInfo(rawDateData[1])
+        if endDate < startDate:
+            # "25. 12. 29. ~ 1. 4." 처럼 연도를 넘기는 기간은 종료일이 다음 해
+            endDate = endDate.replace(year=endDate.year + 1)
         log.info(f"startDate: {startDate}, endDate: {endDate}")
+        if self.currentPeriod != (startDate, endDate):
+            self.currentPeriod = (startDate, endDate)
+            self._gridIndex = None
 
         if targetDate >= startDate and targetDate <= endDate:
             log.info("Target 범위에 존재")
@@ -39,12 +169,61 @@ class SimpleManagementController:
             return diff.days
         else:
             log.info("Target 범위에 존재하지 않음")
-            btn = driver.findByXpath(
-                '//button[contains(@class, "DatePeriodCalendar__next")]'
-            )
-            driver.executeScript("arguments[0].click();", btn)
+            self.seekPeriod(driver, targetDate, startDate, endDate)
+            self.currentPeriod = None
+            self._gridIndex = None
             return -1
 
+    def seekPeriod(
+        self,
+        driver,
+        targetDate: datetime.date,
+        startDate: datetime.date,
+        endDate: datetime.date,
+    ) -> int:
+        """
+        표시 기간에서 targetDate 까지 필요한 이동 횟수를 계산해 한 번에 이동.
+        이전 기간으로도 이동 가능. 실제 이동 결과는 호출 측이 다시 확인함.
+        이동 버튼이 없거나 비활성화된 경우에만 seekBlocked 를 설정함.
+        """
+        self.seekBlocked = False
+        periodDays = max(1, (endDate - startDate).days + 1)
+        if targetDate > endDate:
+            steps = math.ceil((targetDate - endDate).days / periodDays)
+            buttonSelector, buttonClass = NEXT_PERIOD_BUTTON_SELECTOR, "DatePeriodCalendar__next"
+        else:
+            steps = math.ceil((startDate - targetDate).days / periodDays)
+            buttonSelector, buttonClass = PREV_PERIOD_BUTTON_SELECTOR, "DatePeriodCalendar__prev"
+        steps = max(1, steps)
+        log.info(f"Period seek: steps={steps}, button={buttonClass}")
+
+        try:
+            result = driver.executeAsyncScript(
+                PERIOD_SEEK_SCRIPT,
+                buttonSelector,
+                DATE_INFO_SELECTOR,
+                steps,
+                PERIOD_CHANGE_TIMEOUT * 1000,
+                timeout=PERIOD_CHANGE_TIMEOUT * (steps + 1),
+            )
+        except Exception as e:
+            log.error("Period seek script failed, falling back to single click", e)
+            result = None
+        if isinstance(result, dict) and not result.get("timedOut"):
+            log.info(f"Period seek result: {result}")
+            clicked = int(result.get("clicked") or 0)
+            self.seekBlocked = bool(result.get("blocked")) and clicked == 0
+            return clicked
+
+        try:
+            btn = driver.findByXpath(f'//button[contains(@class, "{buttonClass}")]')
+        except NoSuchElementException:
+            log.info(f"Period button missing: {buttonClass}")
+            self.seekBlocked = True
+            return 0
+        driver.executeScript("arguments[0].click();", btn)
+        return 1
+
     def parseDateInfo(self, dateInfoData: str) -> datetime.date:
         dateInfoList = dateInfoData.split(".")
         dateInfoList = list(map(lambda x: x.strip(), dateInfoList))
@@ -55,7 +234,46 @@ class SimpleManagementController:
             int(dateInfoList[0]), int(dateInfoList[1]), int(dateInfoList[2])
         )
 
+    def readManagementGrid(self, driver):
+        """
+        Read the whole management table in one script call.
+        Returns {(roomIndex, dateIndex): label} or None when the grid is unavailable.
+        """
+        try:
+            grid = driver.executeScript(MANAGEMENT_GRID_SCRIPT)
+        except Exception as e:
+            log.error("Management grid snapshot failed", e)
+            return None
+        if not isinstance(grid, list):
+            return None
+        gridIndex = {}
+        for roomIndex, row in enumerate(grid):
+            if not isinstance(row, list):
+                return None
+            for dateIndex, label in enumerate(row):
+                if label is not None:
+                    gridIndex[(roomIndex, dateIndex)] = label
+        log.info(f"Management grid snapshot: rows={len(grid)}, labels={len(gridIndex)}")
+        return gridIndex
+
     def findTargetBtn(self, driver, idxOfDate: int, targetRoomValue: int) -> WebElement:
+        if idxOfDate < 0:
+            # 음수 인덱스는 리스트 끝에서부터 다른 날짜 칸을 가리키므로 거부
+            raise NoSuchElementException(
+                f"Target date is before the displayed period (dateIndex={idxOfDate})"
+            )
+        if self._gridIndex is None:
+            self._gridIndex = self.readManagementGrid(driver)
+        if self._gridIndex is not None:
+            label = self._gridIndex.get((targetRoomValue, idxOfDate))
+            if label is not None:
+                return label
+            # 스냅샷에 없으면 아래 XPath 탐색으로 확인하고 원인을 로그로 남김
+        return self._findTargetBtnByXpath(driver, idxOfDate, targetRoomValue)
+
+    def _findTargetBtnByXpath(
+        self, driver, idxOfDate: int, targetRoomValue: int
+    ) -> WebElement:
         reservationTable = driver.findByXpath(
             '//div[contains(@class, "SimpleManagement__management-tbody")]'
         )
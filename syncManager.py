@@ -1,17 +1,26 @@
 import datetime
 import json
 import os
+import re
 import shutil
 import time
 from enum import Enum
 from random import randint
 from typing import Optional, Tuple
+from urllib.parse import urlparse
 
 from dotenv import load_dotenv
+from selenium.common.exceptions import StaleElementReferenceException
 
+import bookingCapture
 import bookingListExtractor
+import bookingSnapshotStore
+import cookieStore
 import driver
 import log
+import loginSession
+import metrics
+import pacing
 import simpleManagementController
 
 
@@ -21,6 +30,19 @@ class RoomType(Enum):
 
 
 class ReservationLookupError(RuntimeError):
+    # reason 문구 -> 메트릭 라벨용 오류 유형 (위에서부터 먼저 맞는 것)
+    ERROR_TYPE_PATTERNS = (
+        ("security or verification page", "security_check"),
+        ("did not become ready", "page_not_ready"),
+        ("DOM wait timed out", "dom_timeout"),
+        ("page state is unavailable", "page_state_unavailable"),
+        ("booking list DOM is empty", "empty_dom"),
+        ("no booking cards found", "no_booking_cards"),
+        ("parsing returned no items", "parse_empty"),
+        ("next calendar button", "calendar_button"),
+        ("failed to advance booking calendar", "calendar_advance"),
+    )
+
     def __init__(self, reason: str, sessionId: Optional[str] = None):
         self.reason = reason
         self.sessionId = sessionId
@@ -29,6 +51,13 @@ class ReservationLookupError(RuntimeError):
         else:
             super().__init__(reason)
 
+    @property
+    def errorType(self) -> str:
+        for pattern, errorType in self.ERROR_TYPE_PATTERNS:
+            if pattern in self.reason:
+                return errorType
+        return "other"
+
 
 # Constant
 naverBizUrl = "https://nid.naver.com/nidlogin.login?svctype=1&locale=ko_KR&url=https%3A%2F%2Fnew.smartplace.naver.com%2F%3Fnext%3Dbooking-order-management&area=bbt"
@@ -38,6 +67,18 @@ simpleReservationManagementUrl = (
     "https://partner.booking.naver.com/bizes/899762/simple-management"
 )
 bookingListUrl = "https://partner.booking.naver.com/bizes/899762/booking-list-view"
+# BOOKING_LIST_FETCH_MODE=range loads the whole monthSize window in one view
+# instead of clicking the calendar once per month.
+bookingListFetchMode = os.environ.get("BOOKING_LIST_FETCH_MODE", "monthly").strip().lower()
+bookingListRangeUrlTemplate = os.environ.get(
+    "BOOKING_LIST_RANGE_URL_TEMPLATE",
+    "{baseUrl}?dateDropdownType=DIRECT&dateFilter=USEDATE"
+    "&startDateTime={startDate}&endDateTime={endDate}",
+)
+periodFullDatePattern = re.compile(r"(\d{2,4})\.\s*(\d{1,2})\.\s*(\d{1,2})")
+periodShortDatePattern = re.compile(r"(\d{1,2})\.\s*(\d{1,2})")
+naverLoginHost = urlparse(naverLoginUrl).netloc
+partnerBookingHost = urlparse(bookingListUrl).netloc
 domDiagnosticDir = os.environ.get("DOM_DIAGNOSTIC_DIR", "logs/dom_diagnostics")
 enableDomDiagnostics = os.environ.get("ENABLE_DOM_DIAGNOSTICS", "").lower() in (
     "1",
@@ -65,6 +106,35 @@ securityKeywords = [
     "2단계",
     "본인확인",
 ]
+# Collects the whole page state in one WebDriver round trip.
+# arguments: [pageStateSelectors, securityKeywords, emptyBookingListMarkers]
+pageStateProbeScript = """
+const selectors = arguments[0] || {};
+const keywords = arguments[1] || [];
+const emptyMarkers = arguments[2] || [];
+const bodyText = document.body ? (document.body.innerText || '') : '';
+const selectorCounts = {};
+for (const [key, selector] of Object.entries(selectors)) {
+    try {
+        selectorCounts[key] = document.querySelectorAll(selector).length;
+    } catch (e) {
+        selectorCounts[key] = 0;
+    }
+}
+const lowerBodyText = bodyText.toLowerCase();
+const normalizedText = bodyText.split(/\\s+/).filter(Boolean).join(' ');
+return {
+    currentUrl: window.location.href,
+    title: document.title,
+    readyState: document.readyState,
+    fontStatus: document.fonts ? document.fonts.status : null,
+    userAgent: navigator.userAgent,
+    bodyTextPreview: bodyText.slice(0, 500),
+    hasBookingListEmptyState: emptyMarkers.some((marker) => normalizedText.includes(marker)),
+    selectorCounts: selectorCounts,
+    detectedKeywords: keywords.filter((keyword) => lowerBodyText.includes(keyword.toLowerCase())),
+};
+"""
 
 
 def getDiagnosticRetentionDays() -> int:
@@ -122,20 +192,92 @@ def performLogin(driverInstance: driver.Driver):
     driverInstance.login(id, pw)
     driverInstance.findBySelector("#log\\.login").click()
     log.info("로그인 성공")
-    randomSleep(driverInstance)
-    randomRealSleep()
+    randomSleep(driverInstance, naverLoginHost)
+    randomRealSleep(naverLoginHost)
+    loginSession.loginSessionManager.markLoggedIn(driverInstance)
+    _exportSharedCookies(driverInstance)
+
+
+def ensureLoginSession(driverInstance: driver.Driver):
+    """
+    로그인 세션 확인 후 필요할 때만 로그인
+    NID 쿠키(CDP)와 확인 결과 캐시를 먼저 보고, 쿠키를 읽을 수 없을 때만 네이버 메인 페이지로 확인
+    세션이 없으면 공유 쿠키 저장소의 로그인 쿠키를 먼저 주입해 본다
+    """
+    isLoggedIn = loginSession.loginSessionManager.check(driverInstance)
+    if isLoggedIn is False and _importSharedCookies(driverInstance):
+        isLoggedIn = loginSession.loginSessionManager.check(driverInstance)
+    if isLoggedIn is None:
+        isLoggedIn = checkLoginSession(driverInstance)
+    if not isLoggedIn:
+        performLogin(driverInstance)
+
+
+def _exportSharedCookies(driverInstance: driver.Driver):
+    if not cookieStore.cookieStore.isEnabled():
+        return
+    cookies = _safeDriverCall(driverInstance.exportCookies)
+    if isinstance(cookies, list):
+        try:
+            cookieStore.cookieStore.save(cookies)
+        except OSError as e:
+            log.error("공유 쿠키 저장 실패", e)
 
 
-def randomSleep(dirver: driver.Driver):
+def _importSharedCookies(driverInstance: driver.Driver) -> bool:
+    if not cookieStore.cookieStore.isEnabled():
+        return False
+    cookies = cookieStore.cookieStore.load()
+    if not cookies:
+        return False
+    imported = _safeDriverCall(lambda: driverInstance.importCookies(cookies), False) is True
+    if imported:
+        log.info(f"[Session Check] 공유 쿠키 저장소에서 로그인 쿠키 {len(cookies)}개 주입")
+    return imported
+
+
+def goToPartnerPage(driverInstance: driver.Driver, url: str):
+    """
+    파트너 페이지 이동 - 세션 만료로 nid.naver.com 으로 리다이렉트되면 재로그인 후 다시 이동
+    """
+    driverInstance.goTo(url)
+    currentUrl = _safeDriverCall(driverInstance.getCurrentUrl)
+    if not loginSession.isLoginRedirect(currentUrl):
+        return
+    log.info(f"[Session Check] ✗ 로그인 페이지로 리다이렉트됨 - 재로그인: {currentUrl}")
+    loginSession.loginSessionManager.invalidate(driverInstance)
+    performLogin(driverInstance)
+    driverInstance.goTo(url)
+
+
+def randomSleep(dirver: driver.Driver, host: str = partnerBookingHost):
+    # PACING_MODE=adaptive 이면 호스트별 요청 예산이 허용하는 만큼만 대기
+    if pacing.isAdaptive():
+        pacing.pacer.pace(host)
+        return
     sleepTime = randint(15, 30) / 10
     log.info(f"Random Sleep: {sleepTime}")
     dirver.wait(sleepTime)
+    pacing.pacer.recordWait(host, sleepTime)
 
 
-def randomRealSleep():
+def randomRealSleep(host: str = partnerBookingHost):
+    if pacing.isAdaptive():
+        pacing.pacer.pace(host, cost=2.0)
+        return
     sleepTime = randint(15, 30) / 5
     log.info(f"Long Sleep: {sleepTime}")
     time.sleep(sleepTime)
+    pacing.pacer.recordWait(host, sleepTime)
+
+
+def _recordPacingSignal(pageState: Optional[dict], loadSeconds: Optional[float] = None):
+    pageState = pageState or {}
+    currentUrl = pageState.get("currentUrl")
+    host = partnerBookingHost
+    if isinstance(currentUrl, str) and currentUrl:
+        host = urlparse(currentUrl).netloc or partnerBookingHost
+    pacing.pacer.recordSignal(host, pageState.get("detectedKeywords"), loadSeconds)
 
 
 def _safeDriverCall(callback, default=None):
@@ -178,6 +320,37 @@ def _waitForFontRendering(driverInstance: driver.Driver, timeoutSeconds: float =
 
 
 def _getPageState(driverInstance: driver.Driver) -> dict:
+    probe = _safeDriverCall(
+        lambda: driverInstance.executeScript(
+            pageStateProbeScript,
+            pageStateSelectors,
+            securityKeywords,
+            list(bookingListExtractor.EMPTY_BOOKING_LIST_MARKERS),
+        ),
+        None,
+    )
+    if not isinstance(probe, dict):
+        # Drivers that cannot return a JS object fall back to one call per field.
+        return _getPageStateLegacy(driverInstance)
+
+    selectorCounts = probe.get("selectorCounts") or {}
+    return {
+        "currentUrl": probe.get("currentUrl") or "",
+        "title": probe.get("title") or "",
+        "readyState": probe.get("readyState"),
+        "fontStatus": probe.get("fontStatus"),
+        "userAgent": probe.get("userAgent"),
+        "bodyTextPreview": probe.get("bodyTextPreview") or "",
+        "hasBookingListEmptyState": bool(probe.get("hasBookingListEmptyState")),
+        "selectorCounts": {
+            key: int(selectorCounts.get(key) or 0) for key in pageStateSelectors
+        },
+        "detectedKeywords": list(probe.get("detectedKeywords") or []),
+        "browserInfo": _safeDriverCall(driverInstance.getBrowserInfo, {}),
+    }
+
+
+def _getPageStateLegacy(driverInstance: driver.Driver) -> dict:
     bodyText = _safeDriverCall(
         lambda: driverInstance.executeScript(
             "return document.body ? document.body.innerText : '';"
@@ -291,17 +464,44 @@ def collectPageDiagnostics(
 def waitForBookingListDom(
     driverInstance: driver.Driver, sessionId: str, stage: str, timeout: int = 20
 ):
+    startedAt = time.time()
     _safeDriverCall(lambda: driverInstance.waitForDocumentReady(timeout), None)
-    deadline = time.time() + timeout
+    remaining = max(0.0, timeout - (time.time() - startedAt))
+    matched = _safeDriverCall(
+        lambda: driverInstance.waitForDomMatch(
+            bookingListReadySelectors,
+            list(bookingListExtractor.EMPTY_BOOKING_LIST_MARKERS),
+            remaining,
+        ),
+        None,
+    )
+    if isinstance(matched, dict):
+        if matched.get("selector"):
+            return _logBookingListReady(
+                stage,
+                {"selector": matched["selector"], "count": int(matched.get("count") or 0)},
+            )
+        if matched.get("text"):
+            return _logBookingListReady(stage, {"emptyState": True})
+    else:
+        # Drivers without async script support keep the polling path.
+        matched = _pollBookingListDom(driverInstance, stage, startedAt + timeout)
+        if matched is not None:
+            return matched
+
+    log.error(f"Booking list DOM wait timeout [{stage}]", TimeoutError(stage))
+    collectPageDiagnostics(driverInstance, f"{stage}_timeout", sessionId, forceWrite=True)
+    return None
+
+
+def _pollBookingListDom(driverInstance: driver.Driver, stage: str, deadline: float):
     while time.time() < deadline:
         for selector in bookingListReadySelectors:
             selectorCount = _countSelector(driverInstance, selector)
             if selectorCount > 0:
-                matchedSelector = {"selector": selector, "count": selectorCount}
-                log.info(
-                    f"Booking list DOM ready [{stage}]: {json.dumps(matchedSelector, ensure_ascii=False, default=str)}"
+                return _logBookingListReady(
+                    stage, {"selector": selector, "count": selectorCount}
                 )
-                return matchedSelector
 
         bodyText = _safeDriverCall(
             lambda: driverInstance.executeScript(
@@ -310,19 +510,38 @@ def waitForBookingListDom(
             "",
         )
         if bodyText and bookingListExtractor.hasBookingListEmptyText(str(bodyText)):
-            emptyState = {"emptyState": True}
-            log.info(
-                f"Booking list DOM ready [{stage}]: {json.dumps(emptyState, ensure_ascii=False, default=str)}"
-            )
-            return emptyState
+            return _logBookingListReady(stage, {"emptyState": True})
 
         time.sleep(0.5)
-
-    log.error(f"Booking list DOM wait timeout [{stage}]", TimeoutError(stage))
-    collectPageDiagnostics(driverInstance, f"{stage}_timeout", sessionId, forceWrite=True)
     return None
 
 
+def _logBookingListReady(stage: str, readyState: dict) -> dict:
+    log.info(
+        f"Booking list DOM ready [{stage}]: {json.dumps(readyState, ensure_ascii=False, default=str)}"
+    )
+    return readyState
+
+
+def _collectCapturedBookingList(
+    driverInstance: driver.Driver, stage: str
+) -> Optional[list]:
+    responses = _safeDriverCall(
+        lambda: driverInstance.collectNetworkResponses(bookingCapture.captureTimeout),
+        [],
+    )
+    bookingList = bookingCapture.extractBookingListFromResponses(responses or [])
+    if bookingList is None:
+        log.info(f"Booking API capture unavailable [{stage}]; falling back to DOM parsing")
+    elif not bookingList:
+        # 빈 목록은 DOM의 빈 상태 표시로 확인해야 해당 월을 비었다고 판단함
+        log.info(f"Booking API returned an empty list [{stage}]; confirming with DOM parsing")
+        return None
+    else:
+        log.info(f"Booking list captured from API [{stage}]: {len(bookingList)} items")
+    return bookingList
+
+
 def _isPageStateSuspicious(pageState: Optional[dict]) -> Tuple[bool, Optional[str]]:
     if not pageState:
         return True, "page state is unavailable"
@@ -349,9 +568,9 @@ def _isPageStateSuspicious(pageState: Optional[dict]) -> Tuple[bool, Optional[st
 
 
 def makeTargetDateList(dateListStr: str) -> list:
-    dateList = dateListStr.split(",")
-    dateList.sort()
-    targetDateList = list(map(lambda x: makeTargetDate(x), dateList))
+    # "2024-9-10" 와 "2024-9-2" 처럼 자릿수가 다를 수 있으므로 파싱한 날짜로 정렬
+    targetDateList = list(map(lambda x: makeTargetDate(x), dateListStr.split(",")))
+    targetDateList.sort()
     return targetDateList
 
 
@@ -367,58 +586,109 @@ def SyncNaver(driver: driver.Driver, targetDateStr: str, targetRoom: str) -> lis
     reservationManager = simpleManagementController.SimpleManagementController()
     
     # 세션 확인 후 로그인 스킵 또는 진행
-    if not checkLoginSession(driver):
-        performLogin(driver)
+    ensureLoginSession(driver)
 
     log.info(
         f"Browser runtime info: {json.dumps(driver.getBrowserInfo(), ensure_ascii=False, default=str)}"
     )
 
-    driver.goTo(simpleReservationManagementUrl)
+    navigationStartedAt = time.time()
+    goToPartnerPage(driver, simpleReservationManagementUrl)
     log.info("간단예약관리 페이지 이동")
+    _safeDriverCall(lambda: driver.waitForDocumentReady(10), None)
+    # 예약 조회와 같이 페이지 로드 신호를 pacing 에 반영
+    _recordPacingSignal(_getPageState(driver), time.time() - navigationStartedAt)
     randomSleep(driver)
     randomRealSleep()
 
     targetDateList = makeTargetDateList(targetDateStr)
-    for targetDate in targetDateList:
+    remainingDates = list(targetDateList)
+    while remainingDates:
+        targetDate = remainingDates.pop(0)
         log.info(f"{targetDate} 예약 변경 시작")
+        seekStartedAt = time.time()
         idxOfDate = reservationManager.findTargetPage(driver, targetDate)
+        _recordPacingSignal(_getPageState(driver), time.time() - seekStartedAt)
         if idxOfDate == -1:
             log.info("해당 날짜가 존재하지 않습니다.")
             log.info(f"{targetDate} 예약 변경 종료")
             continue
 
-        targetBtn = reservationManager.findTargetBtn(
-            driver, idxOfDate, targetRoomEnum.value
-        )
-        driver.executeScript("arguments[0].click();", targetBtn)
+        # 정렬된 날짜 중 현재 화면 기간에 속하는 날짜는 페이지 이동 없이 함께 처리
+        pageDates = [(targetDate, idxOfDate)]
+        currentPeriod = reservationManager.getCurrentPeriod()
+        if isinstance(currentPeriod, tuple):
+            periodStart, periodEnd = currentPeriod
+            # 기간 밖의 날짜는 다음 페이지 탐색에서 처리
+            outOfPeriodDates = []
+            for nextDate in remainingDates:
+                if periodStart <= nextDate <= periodEnd:
+                    pageDates.append((nextDate, (nextDate - periodStart).days))
+                else:
+                    outOfPeriodDates.append(nextDate)
+            remainingDates = outOfPeriodDates
+            log.info(
+                f"{periodStart} ~ {periodEnd} 기간 일괄 변경: {[str(date) for date, _ in pageDates]}"
+            )
 
-        randomSleep(driver)
-        successDates.append(str(targetDate))
-        log.info(f"{targetDate}, {targetRoomEnum.name}, 예약 변경 완료")
+        for pageDate, pageIdx in pageDates:
+            _clickReservationToggle(
+                driver, reservationManager, pageIdx, targetRoomEnum.value
+            )
+            randomSleep(driver)
+            successDates.append(str(pageDate))
+            log.info(f"{pageDate}, {targetRoomEnum.name}, 예약 변경 완료")
 
     return successDates
 
 
+def _clickReservationToggle(
+    driver: driver.Driver,
+    reservationManager: simpleManagementController.SimpleManagementController,
+    idxOfDate: int,
+    targetRoomValue: int,
+):
+    targetBtn = reservationManager.findTargetBtn(driver, idxOfDate, targetRoomValue)
+    try:
+        driver.executeScript("arguments[0].click();", targetBtn)
+    except StaleElementReferenceException:
+        # 클릭 후 테이블이 다시 그려졌으면 스냅샷을 새로 읽어 한 번 더 시도
+        reservationManager.invalidateGrid()
+        targetBtn = reservationManager.findTargetBtn(driver, idxOfDate, targetRoomValue)
+        driver.executeScript("arguments[0].click();", targetBtn)
+
+
 def getNaverReservation(driver: driver.Driver, monthSize: int) -> tuple:
     sessionId = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     
     # 세션 확인 후 로그인 스킵 또는 진행
-    if not checkLoginSession(driver):
-        performLogin(driver)
+    ensureLoginSession(driver)
     
     log.info(
         f"Browser runtime info: {json.dumps(driver.getBrowserInfo(), ensure_ascii=False, default=str)}"
     )
     collectPageDiagnostics(driver, "after_login", sessionId)
 
-    driver.goTo(bookingListUrl)
+    if bookingListFetchMode == "range" and monthSize > 1:
+        rangeBookingList = fetchBookingListRange(driver, sessionId, monthSize)
+        if rangeBookingList is not None:
+            return _completeReservationLookup(rangeBookingList)
+
+    captureEnabled = bookingCapture.isEnabled() and bool(
+        _safeDriverCall(
+            lambda: driver.startNetworkCapture(bookingCapture.bookingApiUrlPattern),
+            False,
+        )
+    )
+    navigationStartedAt = time.time()
+    goToPartnerPage(driver, bookingListUrl)
     log.info("예약자관리 페이지 이동")
     randomSleep(driver)
     randomRealSleep()
     if waitForBookingListDom(driver, sessionId, "booking_list_initial") is None:
         raise ReservationLookupError("booking list page did not become ready", sessionId)
     initialPageState = collectPageDiagnostics(driver, "booking_list_loaded", sessionId)
+    _recordPacingSignal(initialPageState, time.time() - navigationStartedAt)
     isSuspicious, suspiciousReason = _isPageStateSuspicious(initialPageState)
     if isSuspicious:
         raise ReservationLookupError(suspiciousReason, sessionId)
@@ -428,24 +698,38 @@ def getNaverReservation(driver: driver.Driver, monthSize: int) -> tuple:
         monthIndex = i + 1
         stageBase = f"booking_list_month_{monthIndex}"
         log.info(f"{monthIndex}번째 월 예약자 정보 가져오기 시작")
-        if waitForBookingListDom(driver, sessionId, stageBase) is None:
+        monthStartedAt = time.time()
+        capturedBookingList = (
+            _collectCapturedBookingList(driver, stageBase) if captureEnabled else None
+        )
+        if (
+            capturedBookingList is None
+            and waitForBookingListDom(driver, sessionId, stageBase) is None
+        ):
             raise ReservationLookupError(
                 f"booking list DOM wait timed out at {stageBase}", sessionId
             )
+        monthLoadSeconds = time.time() - monthStartedAt
         randomRealSleep()
         pageState = collectPageDiagnostics(driver, stageBase, sessionId)
+        _recordPacingSignal(pageState, monthLoadSeconds)
         isSuspicious, suspiciousReason = _isPageStateSuspicious(pageState)
         if isSuspicious:
             raise ReservationLookupError(
                 f"{suspiciousReason} at {stageBase}", sessionId
             )
 
-        pageSource = driver.getPageSource()
-        monthBookingList = bookingListExtractor.extractBookingList(pageSource)
+        if capturedBookingList is not None:
+            # Captured lists are never empty; empty months go through the DOM check.
+            monthBookingList, hasEmptyState = capturedBookingList, False
+        else:
+            pageSource = driver.getPageSource()
+            monthBookingList, hasEmptyState = _parseBookingMonth(pageSource, stageBase)
         log.info(f"length: {len(monthBookingList)}")
         log.info(monthBookingList)
+        metrics.bookingsPerMonth.observe(len(monthBookingList), mode="monthly")
         if len(monthBookingList) == 0:
-            if bookingListExtractor.hasBookingListEmptyState(pageSource):
+            if hasEmptyState:
                 log.info(f"No reservations found for {stageBase}; treating as empty month")
             else:
                 collectPageDiagnostics(driver, f"{stageBase}_empty", sessionId, True)
@@ -477,6 +761,16 @@ def getNaverReservation(driver: driver.Driver, monthSize: int) -> tuple:
                     '//button[contains(@class, "DatePeriodCalendar__next")]'
                 )
                 if btn.is_enabled():
+                    if captureEnabled:
+                        # 이전 달 요청의 늦은 응답이 다음 달로 집계되지 않도록 클릭 직전에 캡처를 다시 시작
+                        captureEnabled = bool(
+                            _safeDriverCall(
+                                lambda: driver.startNetworkCapture(
+                                    bookingCapture.bookingApiUrlPattern
+                                ),
+                                False,
+                            )
+                        )
                     driver.executeScript("arguments[0].click();", btn)
                     _safeDriverCall(lambda: driver.waitForDocumentReady(10), None)
                     randomRealSleep()
@@ -498,6 +792,183 @@ def getNaverReservation(driver: driver.Driver, monthSize: int) -> tuple:
                     sessionId,
                 ) from e
 
+    return _completeReservationLookup(bookingList)
+
+
+def getBookingRangeWindow(
+    monthSize: int, today: Optional[datetime.date] = None
+) -> Tuple[datetime.date, datetime.date]:
+    """월 단위 페이징과 같은 구간: 이번 달 1일 ~ (monthSize - 1)달 뒤 말일"""
+    if today is None:
+        kst = datetime.timezone(datetime.timedelta(hours=9), "Asia/Seoul")
+        today = datetime.datetime.now(kst).date()
+    startDate = today.replace(day=1)
+    lastMonthIndex = startDate.month - 1 + monthSize
+    nextMonthStart = datetime.date(
+        startDate.year + lastMonthIndex // 12, lastMonthIndex % 12 + 1, 1
+    )
+    return startDate, nextMonthStart - datetime.timedelta(days=1)
+
+
+def trimBookingsToMonthSize(result: tuple, monthSize: int) -> tuple:
+    """larger monthSize 조회 결과를 monthSize 개월 구간의 예약만 남도록 자름"""
+    _, windowEnd = getBookingRangeWindow(monthSize)
+    lastDate = windowEnd.strftime("%Y%m%d")
+    return tuple(
+        [booking for booking in bookingList if str(booking.get("startDate") or "") <= lastDate]
+        for bookingList in result
+    )
+
+
+def parsePeriodLabel(label: str) -> Optional[Tuple[datetime.date, datetime.date]]:
+    # '24. 8. 1. ~ 24. 9. 30.' 또는 끝 날짜의 연도가 생략된 '24. 8. 1. ~ 9. 30.'
+    parts = (label or "").split("~")
+    if len(parts) != 2:
+        return None
+    startMatch = periodFullDatePattern.search(parts[0])
+    if startMatch is None:
+        return None
+    startYear = int(startMatch.group(1))
+    startYear = startYear + 2000 if startYear < 100 else startYear
+    endMatch = periodFullDatePattern.search(parts[1])
+    try:
+        startDate = datetime.date(
+            startYear, int(startMatch.group(2)), int(startMatch.group(3))
+        )
+        if endMatch is not None:
+            endYear = int(endMatch.group(1))
+            endYear = endYear + 2000 if endYear < 100 else endYear
+            endDate = datetime.date(endYear, int(endMatch.group(2)), int(endMatch.group(3)))
+        else:
+            shortMatch = periodShortDatePattern.search(parts[1])
+            if shortMatch is None:
+                return None
+            endDate = datetime.date(
+                startYear, int(shortMatch.group(1)), int(shortMatch.group(2))
+            )
+            if endDate < startDate:
+                endDate = endDate.replace(year=startYear + 1)
+    except ValueError:
+        return None
+    return startDate, endDate
+
+
+def fetchBookingListRange(
+    driver: driver.Driver, sessionId: str, monthSize: int
+) -> Optional[list]:
+    """
+    Load the whole monthSize window through the booking list date-range query
+    and parse it in one pass. Returns None when the range view is unavailable
+    or shows a different period, so the caller can page month by month.
+    """
+    startDate, endDate = getBookingRangeWindow(monthSize)
+    rangeUrl = bookingListRangeUrlTemplate.format(
+        baseUrl=bookingListUrl,
+        startDate=startDate.isoformat(),
+        endDate=endDate.isoformat(),
+    )
+    stage = "booking_list_range"
+    log.info(f"예약자관리 기간 조회 이동: {startDate} ~ {endDate}")
+    goToPartnerPage(driver, rangeUrl)
+    randomSleep(driver)
+    if waitForBookingListDom(driver, sessionId, stage) is None:
+        log.info("Booking list range view did not become ready; falling back to monthly paging")
+        return None
+    pageState = collectPageDiagnostics(driver, stage, sessionId)
+    isSuspicious, suspiciousReason = _isPageStateSuspicious(pageState)
+    if isSuspicious:
+        raise ReservationLookupError(f"{suspiciousReason} at {stage}", sessionId)
+
+    pageSource = driver.getPageSource()
+    periodLabel = simpleManagementController.SimpleManagementController().extractDateInfoText(
+        pageSource
+    )
+    period = parsePeriodLabel(periodLabel)
+    if period is None or period[0] > startDate or period[1] < endDate:
+        log.info(
+            f"Booking list range view shows '{periodLabel}' instead of {startDate} ~ {endDate}; "
+            "falling back to monthly paging"
+        )
+        return None
+
+    bookingList, hasEmptyState = bookingListExtractor.parseBookingListPage(pageSource)
+    if not bookingList and not hasEmptyState:
+        log.info("Booking list range view parsed no items; falling back to monthly paging")
+        return None
+    # 화면 기간이 구간보다 넓을 수 있으므로 월 단위 조회와 같은 구간만 남김
+    parsedCount = len(bookingList)
+    bookingList = _filterBookingsInWindow(bookingList, startDate, endDate)
+    log.info(f"Booking list range fetched: {len(bookingList)} items ({parsedCount} parsed)")
+    _recordRangeBookingsPerMonth(bookingList, startDate, monthSize)
+    return bookingList
+
+
+def _filterBookingsInWindow(
+    bookingList: list, startDate: datetime.date, endDate: datetime.date
+) -> list:
+    firstDate = startDate.strftime("%Y%m%d")
+    lastDate = endDate.strftime("%Y%m%d")
+    return [
+        booking
+        for booking in bookingList
+        if firstDate <= str(booking.get("startDate") or "") <= lastDate
+    ]
+
+
+def _recordRangeBookingsPerMonth(bookingList: list, startDate: datetime.date, monthSize: int):
+    # 기간 조회는 한 페이지라 체크인 월 기준으로 나눠 월별 건수를 기록
+    monthCounts = {}
+    for i in range(monthSize):
+        monthIndex = startDate.month - 1 + i
+        monthCounts[f"{startDate.year + monthIndex // 12}{monthIndex % 12 + 1:02d}"] = 0
+    for booking in bookingList:
+        monthKey = str(booking.get("startDate") or "")[:6]
+        if monthKey in monthCounts:
+            monthCounts[monthKey] += 1
+    for count in monthCounts.values():
+        metrics.bookingsPerMonth.observe(count, mode="range")
+
+
+def _parseBookingMonth(pageSource: str, stage: str) -> tuple:
+    store = bookingSnapshotStore.snapshotStore
+    if not store.isEnabled():
+        return bookingListExtractor.parseBookingListPage(pageSource)
+
+    # 카드 마크업이 지난 조회와 같으면 저장된 결과를 그대로 사용
+    monthKey = simpleManagementController.SimpleManagementController().extractDateInfoText(
+        pageSource
+    )
+    fingerprint = bookingListExtractor.fingerprintBookingCards(pageSource)
+    try:
+        cachedBookingList = store.getMonthBookings(monthKey, fingerprint)
+    except Exception as e:
+        log.error(f"Booking snapshot month lookup failed [{stage}]", e)
+        cachedBookingList = None
+    if cachedBookingList is not None:
+        log.info(f"Booking list unchanged [{stage}]; reusing {len(cachedBookingList)} stored items")
+        return cachedBookingList, False
+
+    monthBookingList, hasEmptyState = bookingListExtractor.parseBookingListPage(pageSource)
+    if monthBookingList:
+        try:
+            store.saveMonthFingerprint(monthKey, fingerprint, monthBookingList)
+        except Exception as e:
+            log.error(f"Booking snapshot month save failed [{stage}]", e)
+    return monthBookingList, hasEmptyState
+
+
+def _completeReservationLookup(bookingList: list) -> tuple:
+    notCanceledBookingList, allBookingList = _filterUpcomingBookings(bookingList)
+    store = bookingSnapshotStore.snapshotStore
+    if store.isEnabled():
+        try:
+            store.recordBookings(allBookingList)
+        except Exception as e:
+            log.error("Booking snapshot update failed", e)
+    return notCanceledBookingList, allBookingList
+
+
+def _filterUpcomingBookings(bookingList: list) -> tuple:
     bookingList = list(
         {booking["reservationNumber"]: booking for booking in bookingList}.values()
     )
@@ -527,4 +998,7 @@ def getNaverReservation(driver: driver.Driver, monthSize: int) -> tuple:
     )
     log.info(f"취소 미포함 확정 예약 수 : {len(notCanceledBookingList)}")
     log.info(notCanceledBookingList)
+    log.info(
+        f"Pacing stats: {json.dumps(pacing.pacer.getStats(), ensure_ascii=False, default=str)}"
+    )
     return notCanceledBookingList, bookingList
@@ -0,0 +1,104 @@
+import pytest
+
+import bookingCapture
+from bookingCapture import extractBookingListFromResponses, mapApiBooking
+
+
+BOOKING_LIST_URL = "https://partner.booking.naver.com/api/businesses/1/bookings?page=0"
+
+API_BOOKING = {
+    "bookingId": 12345,
+    "name": "홍길동",
+    "phone": "010-1234-5678",
+    "startDate": "2024-08-19T15:00:00+09:00",
+    "endDate": "2024-08-20T11:00:00+09:00",
+    "bizItemName": "여유",
+    "options": [{"name": "바베큐"}, {"name": "조식"}],
+    "requestMessage": "늦게 도착",
+    "totalPrice": 150000,
+    "bookingStatusCode": "RC04",
+}
+
+
+class TestMapApiBooking:
+    def test_maps_api_record_to_booking_schema(self):
+        result = mapApiBooking(API_BOOKING)
+
+        assert result == {
+            "name": "홍길동",
+            "phone": "010-1234-5678",
+            "reservationNumber": "12345",
+            "startDate": "20240819",
+            "endDate": "20240820",
+            "room": "여유",
+            "option": "바베큐, 조식",
+            "comment": "늦게 도착",
+            "price": "150,000원",
+            "status": "취소",
+        }
+
+    def test_prefers_status_name_over_code(self):
+        record = dict(API_BOOKING, bookingStatusName="확정")
+        assert mapApiBooking(record)["status"] == "확정"
+
+
+class TestExtractBookingListFromResponses:
+    def test_finds_nested_booking_list(self):
+        responses = [{"url": BOOKING_LIST_URL, "status": 200, "body": {"result": {"bookings": [API_BOOKING]}}}]
+
+        result = extractBookingListFromResponses(responses)
+
+        assert [booking["reservationNumber"] for booking in result] == ["12345"]
+
+    def test_empty_list_is_a_valid_empty_month(self):
+        responses = [{"url": BOOKING_LIST_URL, "status": 200, "body": {"bookings": []}}]
+        assert extractBookingListFromResponses(responses) == []
+
+    def test_latest_matching_response_wins(self):
+        older = dict(API_BOOKING, bookingId=1)
+        newer = dict(API_BOOKING, bookingId=2)
+        responses = [
+            {"url": BOOKING_LIST_URL, "status": 200, "body": [older]},
+            {"url": BOOKING_LIST_URL, "status": 200, "body": [newer]},
+        ]
+
+        result = extractBookingListFromResponses(responses)
+
+        assert result[0]["reservationNumber"] == "2"
+
+    @pytest.mark.parametrize(
+        "responses",
+        [
+            [],
+            [{"url": "https://partner.booking.naver.com/api/businesses/1/booking-counts", "status": 200, "body": {"data": []}}],
+            [{"url": BOOKING_LIST_URL, "status": 200, "body": {"data": [{"count": 3}]}}],
+            [{"url": BOOKING_LIST_URL, "status": 500, "body": [API_BOOKING]}],
+            [{"url": BOOKING_LIST_URL, "status": 200, "body": {"count": 3}}],
+            [{"url": BOOKING_LIST_URL, "status": 200, "body": [{"bookingId": 1, "startDate": "soon"}]}],
+        ],
+    )
+    def test_returns_none_when_responses_are_unusable(self, responses):
+        assert extractBookingListFromResponses(responses) is None
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"bookings": [API_BOOKING], "totalCount": 25},
+            {"content": [API_BOOKING], "last": False},
+            {"result": {"bookings": [API_BOOKING], "hasNext": True}},
+            {"bookings": [API_BOOKING], "totalPages": 3},
+        ],
+    )
+    def test_returns_none_when_more_pages_exist(self, body):
+        responses = [{"url": BOOKING_LIST_URL, "status": 200, "body": body}]
+        assert extractBookingListFromResponses(responses) is None
+
+    def test_single_complete_page_is_used(self):
+        body = {"bookings": [API_BOOKING], "totalCount": 1, "last": True, "totalPages": 1}
+        responses = [{"url": BOOKING_LIST_URL, "status": 200, "body": body}]
+
+        assert len(extractBookingListFromResponses(responses)) == 1
+
+    def test_capture_is_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(bookingCapture, "captureMode", "dom")
+        assert bookingCapture.isEnabled() is False
@@ -1,10 +1,14 @@
 import pytest
+import bookingListExtractor
 from bookingListExtractor import (
     extractBookingInfo,
+    fingerprintBookingCards,
     getStartEndDate,
     hasBookingListEmptyState,
     hasBookingListEmptyText,
+    parseBookingListPage,
     parseDateInfo,
+    resolveParserBackend,
 )
 from bs4 import BeautifulSoup as bs
 
@@ -169,3 +173,99 @@ class TestHasBookingListEmptyState:
         """
 
         assert hasBookingListEmptyState(html) is False
+
+
+BOOKING_LIST_PAGE = """
+<html>
+    <body>
+        <div class="BookingListView__list">
+            <a class="BookingListView__contents-user__x1 active">
+                <div class="BookingListView__name__a1"><span>홍길동</span></div>
+                <div class="BookingListView__phone__a2"><span>010-1234-5678</span></div>
+                <div class="BookingListView__book-number__a3">12345678</div>
+                <div class="BookingListView__book-date__a4">24. 8. 19.(월)~24. 8. 21.(수)</div>
+                <div class="BookingListView__host__a5">여유</div>
+                <div class="BookingListView__option__a6">조식 <b>포함</b></div>
+                <div class="BookingListView__comment__a7">늦은 체크인 요청</div>
+                <div class="BookingListView__total-price__a8">150,000원</div>
+                <div class="BookingListView__state__a9"><span>예약확정</span></div>
+            </a>
+            <a class="BookingListView__contents-user__x1">
+                <div class="BookingListView__name__a1"><span>김철수</span></div>
+                <div class="BookingListView__book-number__a3">87654321</div>
+                <div class="BookingListView__book-date__a4">24. 9. 1.(일)~24. 9. 3.(화)</div>
+                <div class="BookingListView__state__a9"><span>취소</span></div>
+            </a>
+            <a class="OtherView__contents-user">무시</a>
+        </div>
+    </body>
+</html>
+"""
+
+
+def available_backends():
+    backends = [bookingListExtractor.PARSER_BACKEND_BS4]
+    if bookingListExtractor.lxmlHtml is not None:
+        backends.append(bookingListExtractor.PARSER_BACKEND_LXML)
+    if bookingListExtractor.LexborHTMLParser is not None:
+        backends.append(bookingListExtractor.PARSER_BACKEND_SELECTOLAX)
+    return backends
+
+
+class TestParseBookingListPage:
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_backends_match_bs4_extraction(self, backend):
+        expected = [
+            extractBookingInfo(card)
+            for card in bs(BOOKING_LIST_PAGE, "html.parser").select(
+                'a[class^="BookingListView__contents-user"]'
+            )
+        ]
+
+        bookingList, hasEmptyState = parseBookingListPage(BOOKING_LIST_PAGE, backend)
+
+        assert bookingList == expected
+        assert hasEmptyState is False
+        assert bookingList[0]["option"] == "조식포함"
+        assert bookingList[1]["phone"] is None
+        assert bookingList[1]["status"] == "취소"
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_backends_detect_empty_state_in_same_parse(self, backend):
+        html = """
+        <html><body>
+            <div>예약0건</div>
+            <div>조회된 예약내역이 없습니다.</div>
+        </body></html>
+        """
+
+        assert parseBookingListPage(html, backend) == ([], True)
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_backends_accept_empty_document(self, backend):
+        assert parseBookingListPage("", backend) == ([], False)
+
+    def test_unavailable_backend_falls_back_to_bs4(self, monkeypatch):
+        monkeypatch.setattr(bookingListExtractor, "lxmlHtml", None)
+
+        assert resolveParserBackend("lxml") == bookingListExtractor.PARSER_BACKEND_BS4
+
+
+class TestFingerprintBookingCards:
+    def test_fingerprint_is_stable_and_ignores_markup_outside_cards(self):
+        other_page = BOOKING_LIST_PAGE.replace("<body>", "<body><div>banner</div>", 1)
+
+        assert fingerprintBookingCards(BOOKING_LIST_PAGE)
+        assert fingerprintBookingCards(BOOKING_LIST_PAGE) == fingerprintBookingCards(
+            other_page
+        )
+
+    def test_fingerprint_changes_with_card_content(self):
+        changed_page = BOOKING_LIST_PAGE.replace("홍길동", "김철수")
+
+        assert fingerprintBookingCards(changed_page) != fingerprintBookingCards(
+            BOOKING_LIST_PAGE
+        )
+
+    def test_no_cards_yields_empty_fingerprint(self):
+        assert fingerprintBookingCards("<html><body></body></html>") == ""
@@ -0,0 +1,75 @@
+import pytest
+
+from bookingSnapshotStore import BookingSnapshotStore
+
+
+def make_booking(number, status="확정", **overrides):
+    booking = {
+        "name": "홍길동",
+        "reservationNumber": number,
+        "startDate": "20240819",
+        "status": status,
+    }
+    booking.update(overrides)
+    return booking
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BookingSnapshotStore(str(tmp_path / "snapshot" / "bookings.db"))
+
+
+class TestBookingSnapshotStore:
+    def test_disabled_without_path(self):
+        assert BookingSnapshotStore("").isEnabled() is False
+
+    def test_first_snapshot_reports_everything_as_added(self, store):
+        result = store.recordBookings([make_booking("1"), make_booking("2")])
+
+        assert result["changes"]["added"] == 2
+        changes = store.getChangesSince(0)
+        assert [booking["reservationNumber"] for booking in changes["added"]] == ["1", "2"]
+        assert changes["cursor"] == result["cursor"]
+
+    def test_unchanged_bookings_do_not_advance_cursor(self, store):
+        cursor = store.recordBookings([make_booking("1")])["cursor"]
+
+        result = store.recordBookings([make_booking("1")])
+
+        assert result["cursor"] == cursor
+        assert store.getChangesSince(cursor) == {
+            "cursor": cursor,
+            "added": [],
+            "modified": [],
+            "cancelled": [],
+        }
+
+    def test_reports_modified_and_cancelled_since_cursor(self, store):
+        cursor = store.recordBookings([make_booking("1"), make_booking("2")])["cursor"]
+
+        store.recordBookings(
+            [make_booking("1", comment="late"), make_booking("2", status="취소"), make_booking("3")]
+        )
+        changes = store.getChangesSince(cursor)
+
+        assert [b["reservationNumber"] for b in changes["modified"]] == ["1"]
+        assert [b["reservationNumber"] for b in changes["cancelled"]] == ["2"]
+        assert [b["reservationNumber"] for b in changes["added"]] == ["3"]
+        assert changes["modified"][0]["comment"] == "late"
+
+    def test_added_then_modified_collapses_to_added(self, store):
+        store.recordBookings([make_booking("1")])
+        store.recordBookings([make_booking("1", comment="late")])
+
+        changes = store.getChangesSince(0)
+
+        assert [b["comment"] for b in changes["added"]] == ["late"]
+        assert changes["modified"] == []
+
+    def test_month_fingerprint_round_trip(self, store):
+        bookings = [make_booking("1")]
+        store.saveMonthFingerprint("24. 8. 1. ~ 8. 31.", "abc", bookings)
+
+        assert store.getMonthBookings("24. 8. 1. ~ 8. 31.", "abc") == bookings
+        assert store.getMonthBookings("24. 8. 1. ~ 8. 31.", "changed") is None
+        assert store.getMonthBookings("", "abc") is None
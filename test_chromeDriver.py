@@ -1,9 +1,41 @@
+import fcntl
+import json
+import os
+import re
 import signal
+import subprocess
+import threading
+import time
 from unittest.mock import MagicMock, call, patch
 
 import pytest
-
-from chromeDriver import BrowserStartupError, ChromeDriver, FORCE_KILL_SIGNAL, _is_pid_alive
+from selenium.common.exceptions import TimeoutException
+
+import cookieStore
+import metrics
+from chromeDriver import (
+    BrowserPool,
+    BrowserReaper,
+    BrowserStartupError,
+    CgroupContainer,
+    ChromeDriver,
+    FDMonitor,
+    FORCE_KILL_SIGNAL,
+    MINIMAL_PROFILE_BLOCKED_URLS,
+    MemoryAdmissionController,
+    MemoryExhaustedError,
+    ProcessGroupContainer,
+    ProcessTable,
+    ProfileSlotAllocator,
+    _is_pid_alive,
+    _terminate_process_tree,
+    _wait_for_pids_exit,
+    create_browser,
+    create_process_container,
+    ensure_chromedriver_patched,
+    get_cached_chromedriver_path,
+    resolve_launch_profile,
+)
 
 
 class TestChromeDriverClose:
@@ -40,6 +72,28 @@ class TestChromeDriverClose:
         assert instance.driver is None
         assert instance._closed is True
 
+    def test_concurrent_close_quits_browser_once(self):
+        browser = MagicMock()
+        quit_started = threading.Event()
+        allow_quit = threading.Event()
+        browser.quit.side_effect = lambda: (quit_started.set(), allow_quit.wait(5))
+        instance = self._make_instance(driver=browser)
+
+        with patch.object(
+            instance, "_verify_and_force_terminate_processes", return_value=True
+        ), patch.object(instance, "_cleanup_linux_processes", return_value=True):
+            first = threading.Thread(target=instance.close)
+            first.start()
+            assert quit_started.wait(5)
+            second = threading.Thread(target=instance.close)
+            second.start()
+            allow_quit.set()
+            first.join(5)
+            second.join(5)
+
+        browser.quit.assert_called_once()
+        assert instance._closed is True
+
     def test_close_runs_fallback_when_quit_fails(self):
         browser = MagicMock()
         browser.quit.side_effect = RuntimeError("tab crashed")
@@ -114,7 +168,9 @@ class TestChromeDriverLinuxCleanup:
 
         with patch("chromeDriver.platform.system", return_value="Linux"), patch(
             "chromeDriver.os.kill"
-        ) as mock_kill, patch("chromeDriver.time.sleep"):
+        ) as mock_kill, patch("chromeDriver._is_pid_alive", return_value=True), patch(
+            "chromeDriver._wait_for_pids_exit", side_effect=lambda pids, timeout: list(pids)
+        ), patch("chromeDriver._reap_zombie"):
             assert instance._cleanup_linux_processes() is True
 
         mock_kill.assert_any_call(222, signal.SIGTERM)
@@ -122,7 +178,36 @@ class TestChromeDriverLinuxCleanup:
         mock_kill.assert_any_call(222, FORCE_KILL_SIGNAL)
         mock_kill.assert_any_call(111, FORCE_KILL_SIGNAL)
 
-    def test_cleanup_linux_processes_uses_pkill_patterns_without_pids(self):
+    def test_cleanup_linux_processes_matches_process_table_without_pids(self):
+        instance = self._make_instance(
+            {
+                "chromeProfilePath": "/tmp/profile",
+                "servicePort": 34967,
+                "servicePid": None,
+                "browserPid": None,
+            }
+        )
+        table = ProcessTable({
+            301: {"ppid": 1, "argv": ["chromedriver", "--port=34967"]},
+            302: {"ppid": 301, "argv": ["chrome", "--user-data-dir=/tmp/profile"]},
+            303: {"ppid": 1, "argv": ["chrome", "--user-data-dir=/tmp/profile-slots/profile-0"]},
+        })
+
+        with patch("chromeDriver.platform.system", return_value="Linux"), patch(
+            "chromeDriver.ProcessTable.read", return_value=table
+        ), patch("chromeDriver._is_pid_alive", return_value=False), patch(
+            "chromeDriver.os.kill"
+        ) as mock_kill, patch("chromeDriver.subprocess.run") as mock_run, patch(
+            "chromeDriver.time.sleep"
+        ):
+            assert instance._cleanup_linux_processes() is True
+
+        assert sorted(c.args for c in mock_kill.call_args_list) == [
+            (301, signal.SIGTERM), (302, signal.SIGTERM)
+        ]
+        mock_run.assert_not_called()
+
+    def test_cleanup_linux_processes_uses_pkill_patterns_without_proc(self):
         instance = self._make_instance(
             {
                 "chromeProfilePath": "/tmp/profile",
@@ -134,6 +219,8 @@ class TestChromeDriverLinuxCleanup:
 
         completed = MagicMock(returncode=0)
         with patch("chromeDriver.platform.system", return_value="Linux"), patch(
+            "chromeDriver.ProcessTable.read", return_value=None
+        ), patch(
             "chromeDriver.subprocess.run", return_value=completed
         ) as mock_run, patch("chromeDriver.time.sleep"):
             assert instance._cleanup_linux_processes() is True
@@ -209,6 +296,24 @@ class TestChromeDriverInitialization:
         mock_health_check.assert_called_once_with(browser)
         mock_apply.assert_called_once_with(browser)
         mock_force_kill.assert_not_called()
+        instance._closed = True
+
+    def test_get_driver_blocks_heavy_resources_for_minimal_profile(self):
+        instance = self._make_instance()
+        instance.launch_profile = "minimal"
+        browser = MagicMock()
+
+        with patch.object(instance, "_startBrowser", return_value=browser), patch.object(
+            instance, "_capture_cleanup_metadata", return_value={}
+        ), patch.object(
+            instance, "_perform_startup_health_check", return_value=True
+        ), patch.object(instance, "_applyLanguageOverrides"):
+            assert instance.getDriver(MagicMock()) is browser
+
+        browser.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": MINIMAL_PROFILE_BLOCKED_URLS}
+        )
+        instance._closed = True
 
     def test_start_browser_safe_treats_timeout_exceedance_as_failure(self):
         instance = self._make_instance()
@@ -399,7 +504,9 @@ class TestChromeDriverRuntimeFlags:
         instance.user_multi_procs = True
         options = MagicMock()
 
-        with patch("chromeDriver.uc.Chrome", return_value=MagicMock()) as mock_uc_chrome:
+        with patch("chromeDriver.get_cached_chromedriver_path", return_value=None), patch(
+            "chromeDriver.uc.Chrome", return_value=MagicMock()
+        ) as mock_uc_chrome:
             instance._startBrowser(options)
 
         mock_uc_chrome.assert_called_once_with(
@@ -409,6 +516,371 @@ class TestChromeDriverRuntimeFlags:
             version_main=146,
         )
 
+    def test_start_browser_launches_cached_chromedriver_directly(self):
+        instance = self._make_instance()
+        instance.user_multi_procs = True
+        options = MagicMock()
+
+        with patch(
+            "chromeDriver.get_cached_chromedriver_path", return_value="/cache/146/chromedriver"
+        ), patch("chromeDriver.uc.Chrome", return_value=MagicMock()) as mock_uc_chrome:
+            instance._startBrowser(options)
+
+        mock_uc_chrome.assert_called_once_with(
+            options=options,
+            driver_executable_path="/cache/146/chromedriver",
+            use_subprocess=False,
+            version_main=146,
+        )
+
+
+class TestBrowserPhaseTimings:
+    def test_terminate_process_tree_records_phase(self):
+        with metrics.collectTimings() as timing, patch(
+            "chromeDriver._is_pid_alive", return_value=False
+        ):
+            assert _terminate_process_tree(12345) is True
+
+        assert "terminate_process_tree" in timing.toDict()["phases"]
+
+    def test_get_driver_records_startup_phases(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.debug_mode = False
+        instance.has_display_server = False
+        instance.run_headless = True
+        instance.chrome_profile_path = None
+        instance.active_chrome_profile_path = None
+        instance.use_subprocess = False
+        instance.user_multi_procs = False
+        instance._partial_browser = None
+        browser = MagicMock()
+
+        with metrics.collectTimings() as timing, patch.object(
+            instance, "_startBrowserSafe", return_value=browser
+        ), patch.object(instance, "_capture_cleanup_metadata", return_value={}), patch.object(
+            instance, "_perform_startup_health_check", return_value=True
+        ), patch.object(instance, "_applyLanguageOverrides"):
+            assert instance.getDriver(MagicMock()) is browser
+
+        assert set(timing.toDict()["phases"]) == {"uc_launch", "health_check", "language_overrides"}
+        instance._closed = True
+
+
+    def test_create_browser_records_slot_wait(self):
+        before = metrics.browserSlotWaitSeconds.getSnapshot().get(("acquired",), {"count": 0})
+
+        with patch("chromeDriver.BROWSER_POOL_ENABLED", False), patch(
+            "chromeDriver.ChromeDriver", return_value=MagicMock()
+        ), patch("chromeDriver.log_fd_status"):
+            with create_browser():
+                pass
+
+        after = metrics.browserSlotWaitSeconds.getSnapshot()[("acquired",)]
+        assert after["count"] == before["count"] + 1
+
+
+class TestChromedriverCache:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("chromeDriver.CHROMEDRIVER_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr("chromeDriver._cached_chromedriver_paths", {})
+        monkeypatch.setattr("chromeDriver._patcher_initialized", False)
+        return tmp_path
+
+    def _patched_binary(self, tmp_path):
+        source = tmp_path / "undetected_chromedriver"
+        source.write_bytes(b"binary undetected chromedriver 1337")
+        return str(source)
+
+    def test_patches_once_and_stores_binary_with_checksum(self, tmp_path):
+        patcher = MagicMock(executable_path=self._patched_binary(tmp_path))
+
+        with patch("chromeDriver.uc.Patcher", return_value=patcher) as mock_patcher:
+            assert ensure_chromedriver_patched(version_main=146) is True
+
+        mock_patcher.assert_called_once_with(version_main=146)
+        cached_path = get_cached_chromedriver_path(146)
+        assert cached_path == str(tmp_path / "cache" / "146" / "chromedriver")
+        with open(cached_path, "rb") as f:
+            assert f.read() == b"binary undetected chromedriver 1337"
+
+    def test_reuses_verified_cache_without_patching(self, tmp_path, monkeypatch):
+        patcher = MagicMock(executable_path=self._patched_binary(tmp_path))
+        with patch("chromeDriver.uc.Patcher", return_value=patcher):
+            ensure_chromedriver_patched(version_main=146)
+        # Simulate a new process: memo and init flag are gone, the disk cache is not.
+        monkeypatch.setattr("chromeDriver._cached_chromedriver_paths", {})
+        monkeypatch.setattr("chromeDriver._patcher_initialized", False)
+
+        with patch("chromeDriver.uc.Patcher") as mock_patcher:
+            assert ensure_chromedriver_patched(version_main=146) is True
+
+        mock_patcher.assert_not_called()
+
+    def test_checksum_mismatch_invalidates_cache(self, tmp_path, monkeypatch):
+        patcher = MagicMock(executable_path=self._patched_binary(tmp_path))
+        with patch("chromeDriver.uc.Patcher", return_value=patcher):
+            ensure_chromedriver_patched(version_main=146)
+        cached_path = get_cached_chromedriver_path(146)
+        with open(cached_path, "ab") as f:
+            f.write(b"corrupted")
+        monkeypatch.setattr("chromeDriver._cached_chromedriver_paths", {})
+
+        assert get_cached_chromedriver_path(146) is None
+
+    def test_disabled_cache_dir_returns_none(self, monkeypatch):
+        monkeypatch.setattr("chromeDriver.CHROMEDRIVER_CACHE_DIR", "")
+
+        assert get_cached_chromedriver_path(146) is None
+
+
+class TestChromeDriverBrowserInfo:
+    def test_browser_info_is_cached_per_instance(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.options = MagicMock(arguments=["--headless=new"])
+        instance.driver = MagicMock()
+        instance.driver.capabilities = {
+            "browserName": "chrome",
+            "browserVersion": "146.0",
+            "chrome": {"chromedriverVersion": "146.0.1 (abc)"},
+        }
+        instance.driver.execute_script.return_value = {
+            "language": "ko-KR",
+            "languages": ["ko-KR"],
+            "intlLocale": "ko-KR",
+        }
+
+        first = instance.getBrowserInfo()
+        second = instance.getBrowserInfo()
+
+        assert first == second
+        assert first["chromedriverVersion"] == "146.0.1"
+        assert first["headless"] is True
+        assert first["language"] == "ko-KR"
+        instance.driver.execute_script.assert_called_once()
+
+
+class TestChromeDriverDomObservers:
+    def _make_instance(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        return instance
+
+    def test_wait_for_dom_match_runs_single_async_script(self):
+        instance = self._make_instance()
+        instance.driver.execute_async_script.return_value = {
+            "selector": "table",
+            "count": 1,
+        }
+
+        instance.driver.timeouts.script = 30
+
+        result = instance.waitForDomMatch(["table"], ["empty"], timeout=4)
+
+        assert result == {"selector": "table", "count": 1}
+        assert instance.driver.set_script_timeout.call_args_list == [call(9), call(30)]
+        args = instance.driver.execute_async_script.call_args.args
+        assert "MutationObserver" in args[0]
+        assert args[1:] == (["table"], ["empty"], 4000)
+
+    def test_wait_for_text_change_reports_timeout(self):
+        instance = self._make_instance()
+        instance.driver.execute_async_script.side_effect = TimeoutException("slow")
+
+        instance.driver.timeouts.script = 30
+
+        result = instance.waitForTextChange("a.date", "old", timeout=1)
+
+        assert result == {"timedOut": True}
+        instance.driver.set_script_timeout.assert_called_with(30)
+
+
+class TestChromeDriverNavigation:
+    def _make_instance(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        return instance
+
+    def test_go_to_sleeps_fixed_delay_by_default(self):
+        instance = self._make_instance()
+
+        with patch("chromeDriver.time.sleep") as mock_sleep:
+            instance.goTo("https://example.com")
+
+        instance.driver.get.assert_called_once_with("https://example.com")
+        mock_sleep.assert_called_once_with(3)
+
+    def test_go_to_only_waits_for_ready_state_in_ready_mode(self):
+        instance = self._make_instance()
+        instance.driver.execute_script.return_value = "complete"
+
+        with patch("chromeDriver.NAVIGATION_WAIT_MODE", "ready"), patch(
+            "chromeDriver.time.sleep"
+        ) as mock_sleep:
+            instance.goTo("https://example.com")
+
+        mock_sleep.assert_not_called()
+        instance.driver.execute_script.assert_called_with("return document.readyState")
+
+
+class TestChromeDriverNetworkCapture:
+    def _make_instance(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        return instance
+
+    def _log_entry(self, method, params):
+        return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+    def test_collects_matching_json_responses(self):
+        instance = self._make_instance()
+        instance.driver.get_log.side_effect = [
+            [],
+            [
+                self._log_entry(
+                    "Network.requestWillBeSent",
+                    {"requestId": "1", "request": {"url": "https://x/api/bookings"}},
+                ),
+                self._log_entry(
+                    "Network.responseReceived",
+                    {
+                        "requestId": "1",
+                        "response": {"url": "https://x/api/bookings", "status": 200},
+                    },
+                ),
+                self._log_entry(
+                    "Network.responseReceived",
+                    {
+                        "requestId": "2",
+                        "response": {"url": "https://x/static/app.js", "status": 200},
+                    },
+                ),
+                self._log_entry("Network.loadingFinished", {"requestId": "2"}),
+                self._log_entry("Network.loadingFinished", {"requestId": "1"}),
+            ],
+        ]
+        instance.driver.execute_cdp_cmd.return_value = {
+            "body": '{"bookings": []}',
+            "base64Encoded": False,
+        }
+
+        with patch("chromeDriver.NETWORK_CAPTURE_ENABLED", True):
+            assert instance.startNetworkCapture(r"/api/bookings") is True
+            responses = instance.collectNetworkResponses(timeout=1)
+
+        assert responses == [
+            {"url": "https://x/api/bookings", "status": 200, "body": {"bookings": []}}
+        ]
+        instance.driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.getResponseBody", {"requestId": "1"}
+        )
+
+    def test_ignores_late_response_to_request_sent_before_capture_restart(self):
+        instance = self._make_instance()
+        instance.driver.get_log.side_effect = [
+            [],
+            [
+                self._log_entry(
+                    "Network.requestWillBeSent",
+                    {"requestId": "2", "request": {"url": "https://x/api/bookings?month=9"}},
+                ),
+                self._log_entry(
+                    "Network.responseReceived",
+                    {
+                        "requestId": "1",
+                        "response": {"url": "https://x/api/bookings?month=8", "status": 200},
+                    },
+                ),
+                self._log_entry("Network.loadingFinished", {"requestId": "1"}),
+                self._log_entry(
+                    "Network.responseReceived",
+                    {
+                        "requestId": "2",
+                        "response": {"url": "https://x/api/bookings?month=9", "status": 200},
+                    },
+                ),
+                self._log_entry("Network.loadingFinished", {"requestId": "2"}),
+            ],
+        ]
+        instance.driver.execute_cdp_cmd.return_value = {
+            "body": '{"bookings": []}',
+            "base64Encoded": False,
+        }
+
+        with patch("chromeDriver.NETWORK_CAPTURE_ENABLED", True):
+            assert instance.startNetworkCapture(r"/api/bookings") is True
+            responses = instance.collectNetworkResponses(timeout=1)
+
+        assert [response["url"] for response in responses] == [
+            "https://x/api/bookings?month=9"
+        ]
+        instance.driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.getResponseBody", {"requestId": "2"}
+        )
+
+    def test_capture_is_noop_when_disabled(self):
+        instance = self._make_instance()
+
+        with patch("chromeDriver.NETWORK_CAPTURE_ENABLED", False):
+            assert instance.startNetworkCapture(r"/api") is False
+
+        assert instance.collectNetworkResponses(timeout=0) == []
+        instance.driver.get_log.assert_not_called()
+
+
+class TestChromeDriverCookies:
+    def test_get_cookies_uses_cdp(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        instance.driver.execute_cdp_cmd.return_value = {"cookies": [{"name": "NID_AUT"}]}
+
+        cookies = instance.getCookies(["https://nid.naver.com"])
+
+        assert cookies == [{"name": "NID_AUT"}]
+        instance.driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.getCookies", {"urls": ["https://nid.naver.com"]}
+        )
+
+    def test_get_cookies_returns_none_when_cdp_fails(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        instance.driver.execute_cdp_cmd.side_effect = RuntimeError("no cdp")
+
+        assert instance.getCookies(["https://nid.naver.com"]) is None
+
+
+    def test_import_cookies_maps_to_cookie_params(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+
+        imported = instance.importCookies(
+            [
+                {"name": "NID_AUT", "value": "a", "domain": ".naver.com", "path": "/",
+                 "expires": 1900000000, "size": 10, "session": False},
+                {"name": "NID_SES", "value": "s", "domain": ".naver.com", "expires": -1},
+            ]
+        )
+
+        assert imported is True
+        instance.driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.setCookies",
+            {
+                "cookies": [
+                    {"name": "NID_AUT", "value": "a", "domain": ".naver.com", "path": "/",
+                     "expires": 1900000000},
+                    {"name": "NID_SES", "value": "s", "domain": ".naver.com"},
+                ]
+            },
+        )
+
+    def test_export_cookies_uses_get_all_cookies(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        instance.driver.execute_cdp_cmd.return_value = {"cookies": [{"name": "NID_AUT"}]}
+
+        assert instance.exportCookies() == [{"name": "NID_AUT"}]
+        instance.driver.execute_cdp_cmd.assert_called_once_with("Network.getAllCookies", {})
+
 
 class TestChromeDriverOptions:
     def _make_instance(self):
@@ -428,6 +900,31 @@ class TestChromeDriverOptions:
         assert f"--lang={ChromeDriver.STARTUP_LANGUAGE}" in options.arguments
         assert "prefs" not in options.experimental_options
 
+    def test_default_profile_adds_no_launch_profile_flags(self):
+        instance = self._make_instance()
+
+        options = instance._buildOptions(include_profile=False)
+
+        assert not any(argument.startswith("--renderer-process-limit") for argument in options.arguments)
+        assert "--force-device-scale-factor=1" not in options.arguments
+
+    def test_minimal_profile_disables_background_services_without_prefs(self):
+        instance = self._make_instance()
+        instance.launch_profile = "minimal"
+
+        options = instance._buildOptions(include_profile=False)
+
+        assert "--blink-settings=imagesEnabled=false" in options.arguments
+        assert "--disable-background-networking" in options.arguments
+        assert "--renderer-process-limit=2" in options.arguments
+        assert "prefs" not in options.experimental_options
+
+    def test_diagnostics_switch_minimal_profile_to_full_rendering(self):
+        assert resolve_launch_profile("minimal", diagnostics_enabled=True) == "diagnostic"
+        assert resolve_launch_profile("minimal", diagnostics_enabled=False) == "minimal"
+        assert resolve_launch_profile("default", diagnostics_enabled=True) == "default"
+        assert resolve_launch_profile("turbo", diagnostics_enabled=False) == "default"
+
 
 class TestChromeDriverProfiles:
     def _make_instance(self):
@@ -497,3 +994,675 @@ class TestChromeDriverCleanupGuards:
         assert _is_pid_alive(-1) is False
         assert _is_pid_alive("123") is False
         assert _is_pid_alive(MagicMock()) is False
+
+
+class TestBrowserPool:
+    def _make_driver(self, healthy=True):
+        driver_instance = MagicMock()
+        driver_instance._closed = False
+        driver_instance.isHealthy.return_value = healthy
+        return driver_instance
+
+    def test_lease_reuses_returned_driver(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=2, max_uses=5, idle_ttl=300)
+        driver_instance = self._make_driver()
+
+        with patch("chromeDriver.ChromeDriver", return_value=driver_instance) as mock_chrome:
+            first = pool.lease()
+            pool.release(first)
+            second = pool.lease()
+
+        assert first is second
+        assert second._pool_use_count == 2
+        mock_chrome.assert_called_once()
+        driver_instance.close.assert_not_called()
+
+    def test_release_recycles_after_max_uses(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=2, max_uses=1, idle_ttl=300)
+        driver_instance = self._make_driver()
+
+        with patch("chromeDriver.ChromeDriver", return_value=driver_instance):
+            leased = pool.lease()
+            pool.release(leased)
+
+        driver_instance.close.assert_called_once()
+        assert pool.idle_count() == 0
+        assert pool.live_count() == 0
+
+    def test_release_recycles_driver_when_lease_failed(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=2, max_uses=5, idle_ttl=300)
+        driver_instance = self._make_driver()
+
+        with patch("chromeDriver.ChromeDriver", return_value=driver_instance):
+            leased = pool.lease()
+            pool.release(leased, reusable=False)
+
+        driver_instance.close.assert_called_once()
+        assert pool.idle_count() == 0
+
+    def test_lease_replaces_unhealthy_idle_driver(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=1, max_uses=5, idle_ttl=300)
+        stale = self._make_driver(healthy=False)
+        fresh = self._make_driver()
+
+        with patch("chromeDriver.ChromeDriver", side_effect=[stale, fresh]):
+            pool.release(pool.lease())
+            leased = pool.lease()
+
+        assert leased is fresh
+        stale.close.assert_called_once()
+        assert pool.live_count() == 1
+
+    def test_lease_evicts_drivers_idle_longer_than_ttl(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=1, max_uses=5, idle_ttl=0)
+        expired = self._make_driver()
+        fresh = self._make_driver()
+
+        with patch("chromeDriver.ChromeDriver", side_effect=[expired, fresh]):
+            pool.release(pool.lease())
+            leased = pool.lease()
+
+        assert leased is fresh
+        expired.close.assert_called_once()
+        expired.isHealthy.assert_not_called()
+
+    def test_release_resets_per_lease_state(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=1, max_uses=5, idle_ttl=300)
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        instance._closed = False
+        instance._pool_use_count = 1
+        instance._network_capture_pattern = re.compile("/api/bookings")
+        instance._network_capture_pending = {"1": {"url": "https://x/api/bookings"}}
+        instance._network_capture_requests = {"1"}
+        instance._browser_info_cache = {"headless": True}
+
+        with patch("chromeDriver.NETWORK_CAPTURE_ENABLED", True):
+            pool.release(instance)
+
+        assert pool.idle_count() == 1
+        assert instance._network_capture_pattern is None
+        assert instance._network_capture_pending == {}
+        assert instance._network_capture_requests == set()
+        assert instance._browser_info_cache is None
+        instance.driver.get_log.assert_called_once_with("performance")
+        assert instance.collectNetworkResponses(timeout=0) == []
+
+    def test_release_evicts_other_expired_idle_drivers(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=2, max_uses=5, idle_ttl=300)
+        expired = self._make_driver()
+        returned = self._make_driver()
+        returned._pool_use_count = 1
+        pool._idle = [(expired, time.time() - 301)]
+        pool._live_count = 2
+
+        with patch("chromeDriver._browser_reaper", BrowserReaper(enabled=False)):
+            pool.release(returned)
+
+        expired.close.assert_called_once()
+        returned.close.assert_not_called()
+        assert pool.idle_count() == 1
+        assert pool.live_count() == 1
+
+    def test_shutdown_closes_idle_drivers(self, monkeypatch):
+        monkeypatch.delenv("CHROME_PROFILE_PATH", raising=False)
+        pool = BrowserPool(max_size=2, max_uses=5, idle_ttl=300)
+        driver_instance = self._make_driver()
+
+        with patch("chromeDriver.ChromeDriver", return_value=driver_instance), patch(
+            "chromeDriver._browser_reaper", BrowserReaper(enabled=False)
+        ):
+            pool.release(pool.lease())
+            pool.shutdown()
+
+        driver_instance.close.assert_called_once()
+        assert pool.idle_count() == 0
+        assert pool.live_count() == 0
+
+    def test_lease_times_out_when_shared_profile_driver_is_busy(self, monkeypatch):
+        monkeypatch.setenv("CHROME_PROFILE_PATH", "/tmp/profile")
+        pool = BrowserPool(max_size=3, max_uses=5, idle_ttl=300)
+
+        with patch("chromeDriver.ChromeDriver", return_value=self._make_driver()):
+            pool.lease()
+            with pytest.raises(TimeoutError, match="Could not lease pooled browser"):
+                pool.lease(timeout=0.05)
+
+    def test_lease_allows_one_driver_per_profile_slot(self, monkeypatch):
+        monkeypatch.setenv("CHROME_PROFILE_PATH", "/tmp/profile")
+        pool = BrowserPool(max_size=3, max_uses=5, idle_ttl=300)
+
+        with patch(
+            "chromeDriver._profile_slot_allocator", ProfileSlotAllocator("/tmp/profile", 2)
+        ), patch.object(cookieStore.cookieStore, "isEnabled", return_value=True), patch(
+            "chromeDriver.ChromeDriver", side_effect=[self._make_driver(), self._make_driver()]
+        ):
+            first = pool.lease()
+            second = pool.lease()
+            with pytest.raises(TimeoutError, match="Live pooled browsers: 2/2"):
+                pool.lease(timeout=0.05)
+
+        assert first is not second
+
+
+class TestProfileSlotAllocator:
+    def test_concurrent_acquires_get_distinct_slots(self, tmp_path):
+        allocator = ProfileSlotAllocator(str(tmp_path / "profile"), 2)
+
+        first = allocator.acquire(timeout=0)
+        second = allocator.acquire(timeout=0)
+
+        try:
+            assert {first, second} == {allocator.slot_path(0), allocator.slot_path(1)}
+            assert os.path.isdir(first)
+            assert allocator.acquire(timeout=0) is None
+        finally:
+            allocator.release(first)
+            allocator.release(second)
+
+    def test_release_wakes_waiting_acquire(self, tmp_path):
+        allocator = ProfileSlotAllocator(str(tmp_path / "profile"), 2)
+        held = [allocator.acquire(timeout=0), allocator.acquire(timeout=0)]
+        result = {}
+
+        waiter = threading.Thread(target=lambda: result.setdefault("path", allocator.acquire(timeout=5)))
+        waiter.start()
+        allocator.release(held[1])
+        waiter.join(timeout=5)
+
+        try:
+            assert result["path"] == held[1]
+        finally:
+            allocator.release(held[0])
+            allocator.release(result["path"])
+
+    def test_skips_slot_locked_by_another_process(self, tmp_path):
+        allocator = ProfileSlotAllocator(str(tmp_path / "profile"), 2)
+        locked_path = allocator.slot_path(0)
+        os.makedirs(locked_path)
+        # A separate open file description conflicts just like another process would.
+        foreign = open(os.path.join(locked_path, ".profile.lock"), "w")
+        fcntl.flock(foreign.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        try:
+            path = allocator.acquire(timeout=0)
+            assert path == allocator.slot_path(1)
+            assert allocator.in_use_count() == 1
+            allocator.release(path)
+        finally:
+            foreign.close()
+
+    def test_disabled_without_base_path_or_with_single_slot(self):
+        with patch.object(cookieStore.cookieStore, "isEnabled", return_value=True):
+            assert ProfileSlotAllocator(None, 3).is_enabled() is False
+            assert ProfileSlotAllocator("/tmp/profile", 1).is_enabled() is False
+            assert ProfileSlotAllocator("/tmp/profile", 2).is_enabled() is True
+
+    def test_disabled_without_cookie_store_so_slots_do_not_log_in_separately(self, monkeypatch):
+        monkeypatch.setenv("CHROME_PROFILE_PATH", "/tmp/profile")
+        allocator = ProfileSlotAllocator("/tmp/profile", 3)
+
+        with patch.object(cookieStore.cookieStore, "isEnabled", return_value=False), patch(
+            "chromeDriver.logger"
+        ) as mock_logger, patch("chromeDriver._profile_slot_allocator", allocator):
+            assert allocator.is_enabled() is False
+            assert allocator.is_enabled() is False
+            # Falls back to one live browser on the shared, logged-in profile.
+            assert BrowserPool(max_size=3)._effective_max_size() == 1
+
+        mock_logger.error.assert_called_once()
+
+    def test_driver_close_returns_slot_to_allocator(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = None
+        instance._closed = False
+        instance.chrome_profile_path = "/tmp/profile-slots/profile-0"
+        instance._profile_lock_acquired = True
+        instance._profile_slot_acquired = True
+        allocator = MagicMock()
+
+        with patch("chromeDriver._profile_slot_allocator", allocator), patch(
+            "chromeDriver._release_profile_lock"
+        ) as mock_release:
+            instance.close()
+
+        allocator.release.assert_called_once_with("/tmp/profile-slots/profile-0")
+        mock_release.assert_not_called()
+        assert instance._profile_lock_acquired is False
+
+
+class TestFDMonitor:
+    def _fd_dir(self, tmp_path):
+        fd_dir = tmp_path / "fd"
+        fd_dir.mkdir()
+        for name, target in (
+            ("0", "/dev/null"),
+            ("1", "pipe:[101]"),
+            ("2", "socket:[202]"),
+            ("3", "socket:[203]"),
+            ("4", "anon_inode:[eventpoll]"),
+        ):
+            os.symlink(target, fd_dir / name)
+        return fd_dir
+
+    def test_sample_records_count_breakdown_and_high_water_mark(self, tmp_path):
+        fd_dir = self._fd_dir(tmp_path)
+        monitor = FDMonitor(interval=60)
+        monitor.FD_DIR = str(fd_dir)
+
+        assert monitor.sample() == 5
+        os.remove(fd_dir / "3")
+        assert monitor.sample() == 4
+
+        assert monitor.breakdown() == {"socket": 1, "pipe": 1, "anon_inode": 1, "file": 1}
+        assert monitor.high_water_mark() == 5
+
+    def test_count_reads_cached_sample(self, tmp_path):
+        monitor = FDMonitor(interval=60)
+        monitor.FD_DIR = str(self._fd_dir(tmp_path))
+
+        try:
+            assert monitor.count() == 5
+            with patch("chromeDriver.os.listdir") as mock_listdir:
+                assert monitor.count() == 5
+            mock_listdir.assert_not_called()
+        finally:
+            monitor.stop()
+
+    def test_concurrent_count_never_sees_placeholder(self, tmp_path):
+        monitor = FDMonitor(interval=60)
+        monitor.FD_DIR = str(self._fd_dir(tmp_path))
+        start = threading.Barrier(8)
+        counts = []
+
+        def read_count():
+            start.wait()
+            counts.append(monitor.count())
+
+        try:
+            threads = [threading.Thread(target=read_count) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+        finally:
+            monitor.stop()
+
+        assert counts == [5] * 8
+
+    def test_disabled_monitor_lists_directory_on_every_call(self, tmp_path):
+        fd_dir = self._fd_dir(tmp_path)
+        monitor = FDMonitor(interval=0)
+        monitor.FD_DIR = str(fd_dir)
+
+        assert monitor.count() == 5
+        os.remove(fd_dir / "4")
+        assert monitor.count() == 4
+        assert monitor._thread is None
+
+
+class TestProcessTable:
+    def _write_process(self, proc_dir, pid, comm, ppid, argv):
+        process_dir = proc_dir / str(pid)
+        process_dir.mkdir()
+        (process_dir / "stat").write_text(f"{pid} ({comm}) S {ppid} {pid} {pid} 0 -1")
+        (process_dir / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv) + b"\0")
+
+    def test_read_indexes_children_and_profiles(self, tmp_path):
+        self._write_process(tmp_path, 10, "chromedriver", 1, ["chromedriver", "--port=9515"])
+        self._write_process(tmp_path, 11, "chrome", 10, ["chrome", "--user-data-dir=/tmp/profile"])
+        self._write_process(tmp_path, 12, "Chrome (renderer)", 11, ["chrome", "--type=renderer"])
+        self._write_process(tmp_path, 13, "zygote", 12, [])
+        (tmp_path / "self").mkdir()
+
+        with patch("chromeDriver.platform.system", return_value="Linux"):
+            table = ProcessTable.read(str(tmp_path))
+
+        assert table.children(10) == [11]
+        assert table.descendants(10) == [11, 12, 13]
+        assert table.pids_with_arg("--port=9515") == [10]
+        assert [p["pid"] for p in table.processes_using_profile("/tmp/profile")] == [11]
+        assert table.processes_using_profile("/tmp/prof") == []
+
+    def test_read_is_unavailable_outside_linux(self):
+        with patch("chromeDriver.platform.system", return_value="Darwin"):
+            assert ProcessTable.read() is None
+
+    def test_terminate_process_tree_uses_one_snapshot(self):
+        table = ProcessTable({
+            20: {"ppid": 1, "argv": ["chromedriver"]},
+            21: {"ppid": 20, "argv": ["chrome"]},
+            22: {"ppid": 21, "argv": ["chrome", "--type=gpu-process"]},
+            23: {"ppid": 22, "argv": ["chrome", "--type=renderer"]},
+        })
+        alive = {20, 21, 22, 23}
+
+        def kill(pid, sig):
+            alive.discard(pid)
+
+        with patch("chromeDriver.platform.system", return_value="Linux"), patch(
+            "chromeDriver.ProcessTable.read", return_value=table
+        ) as mock_read, patch(
+            "chromeDriver._is_pid_alive", side_effect=lambda pid: pid in alive
+        ), patch("chromeDriver.os.kill", side_effect=kill), patch(
+            "chromeDriver.subprocess.run"
+        ) as mock_run, patch("chromeDriver.time.sleep"):
+            assert _terminate_process_tree(20) is True
+
+        assert alive == set()
+        mock_read.assert_called_once()
+        mock_run.assert_not_called()
+
+
+class TestWaitForPidsExit:
+    def _spawn_sleeper(self):
+        return subprocess.Popen(["sleep", "30"])
+
+    def test_returns_as_soon_as_processes_exit(self):
+        processes = [self._spawn_sleeper(), self._spawn_sleeper()]
+        killer = threading.Timer(0.2, lambda: [p.kill() for p in processes])
+        killer.start()
+        try:
+            started = time.monotonic()
+            assert _wait_for_pids_exit([p.pid for p in processes], timeout=10) == []
+            assert time.monotonic() - started < 5
+        finally:
+            killer.cancel()
+            for process in processes:
+                process.kill()
+                process.wait()
+
+    def test_returns_pids_still_alive_at_timeout(self):
+        process = self._spawn_sleeper()
+        try:
+            assert _wait_for_pids_exit([process.pid], timeout=0.1) == [process.pid]
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_polls_when_pidfd_is_unavailable(self):
+        process = self._spawn_sleeper()
+        killer = threading.Timer(0.2, process.kill)
+        killer.start()
+        try:
+            with patch("chromeDriver._pidfd_supported", return_value=False):
+                assert _wait_for_pids_exit([process.pid], timeout=10) == []
+        finally:
+            killer.cancel()
+            process.kill()
+            process.wait()
+
+
+class TestBrowserReaper:
+    def test_async_submit_returns_before_close_finishes(self):
+        reaper = BrowserReaper(enabled=True)
+        close_started = threading.Event()
+        allow_close = threading.Event()
+        driver_instance = MagicMock()
+        driver_instance.close.side_effect = lambda: (close_started.set(), allow_close.wait(5))
+        on_done = MagicMock()
+
+        reaper.submit(driver_instance, on_done=on_done)
+
+        assert close_started.wait(5)
+        on_done.assert_not_called()
+        assert reaper.pending_count() == 1
+
+        allow_close.set()
+        assert reaper.drain(timeout=5) is True
+        on_done.assert_called_once_with()
+
+    def test_drain_waits_for_teardowns_submitted_while_draining(self):
+        reaper = BrowserReaper(enabled=True)
+        late_close_done = threading.Event()
+        late_driver = MagicMock()
+        late_driver.close.side_effect = lambda: (time.sleep(0.05), late_close_done.set())
+        first_driver = MagicMock()
+        first_driver.close.side_effect = lambda: reaper.submit(late_driver)
+
+        reaper.submit(first_driver)
+
+        assert reaper.drain(timeout=5) is True
+        assert late_close_done.is_set()
+
+    def test_disabled_reaper_closes_inline_and_survives_close_errors(self):
+        reaper = BrowserReaper(enabled=False)
+        driver_instance = MagicMock()
+        driver_instance.close.side_effect = RuntimeError("quit failed")
+        on_done = MagicMock()
+
+        reaper.submit(driver_instance, on_done=on_done)
+
+        driver_instance.close.assert_called_once_with()
+        on_done.assert_called_once_with()
+        assert reaper.pending_count() == 0
+
+    def test_create_browser_releases_slot_after_background_close(self):
+        semaphore = threading.Semaphore(1)
+        reaper = BrowserReaper(enabled=True)
+        allow_close = threading.Event()
+        driver_instance = MagicMock()
+        driver_instance.close.side_effect = lambda: allow_close.wait(5)
+
+        with patch("chromeDriver.BROWSER_POOL_ENABLED", False), patch(
+            "chromeDriver._browser_semaphore", semaphore
+        ), patch("chromeDriver._browser_reaper", reaper), patch(
+            "chromeDriver.ChromeDriver", return_value=driver_instance
+        ), patch("chromeDriver.log_fd_status"):
+            with create_browser() as leased:
+                assert leased is driver_instance
+
+            assert semaphore.acquire(blocking=False) is False
+            allow_close.set()
+            assert reaper.drain(timeout=5) is True
+
+        assert semaphore.acquire(blocking=False) is True
+
+
+class TestProcessContainment:
+    def test_process_group_terminate_reaches_whole_session(self):
+        process = subprocess.Popen(["sh", "-c", "sleep 30 & sleep 30 & wait"], start_new_session=True)
+        try:
+            container = ProcessGroupContainer(os.getpgid(process.pid))
+            assert container.is_populated() is True
+
+            assert container.terminate(grace=2, timeout=5) is True
+            process.wait(timeout=5)
+            assert container.is_populated() is False
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+    def test_session_mode_skips_browsers_in_server_process_group(self):
+        with patch("chromeDriver.platform.system", return_value="Linux"):
+            assert create_process_container(os.getpid(), None, mode="session") is None
+            assert create_process_container(os.getpid(), None, mode="none") is None
+
+    def test_cgroup_container_writes_limits_and_uses_cgroup_kill(self, tmp_path):
+        container = CgroupContainer(str(tmp_path / "chrome-1"), memory_max="1536M", cpu_max="100000 100000")
+        container.create()
+        (tmp_path / "chrome-1" / "cgroup.events").write_text("populated 1\nfrozen 0\n")
+        (tmp_path / "chrome-1" / "cgroup.kill").write_text("")
+
+        assert (tmp_path / "chrome-1" / "memory.max").read_text() == "1536M"
+        assert (tmp_path / "chrome-1" / "cpu.max").read_text() == "100000 100000"
+        assert container.is_populated() is True
+
+        container.kill()
+        assert (tmp_path / "chrome-1" / "cgroup.kill").read_text() == "1"
+
+    def test_cgroup_mode_moves_browser_tree_into_cgroup(self, tmp_path):
+        table = ProcessTable({
+            40: {"ppid": 1, "argv": ["chromedriver"]},
+            41: {"ppid": 1, "argv": ["chrome"]},
+            42: {"ppid": 41, "argv": ["chrome", "--type=zygote"]},
+        })
+
+        with patch("chromeDriver.platform.system", return_value="Linux"), patch(
+            "chromeDriver.CHROME_CGROUP_ROOT", str(tmp_path)
+        ), patch("chromeDriver.ProcessTable.read", return_value=table), patch.object(
+            CgroupContainer, "attach"
+        ) as mock_attach:
+            container = create_process_container(41, 40, mode="cgroup")
+
+        assert isinstance(container, CgroupContainer)
+        assert os.path.dirname(container.path) == str(tmp_path)
+        assert sorted(mock_attach.call_args.args[0]) == [40, 41, 42]
+
+    def test_close_tears_down_process_container(self):
+        instance = ChromeDriver.__new__(ChromeDriver)
+        instance.driver = MagicMock()
+        instance._closed = False
+        instance._cleanup_metadata = {}
+        container = MagicMock()
+        container.terminate.return_value = True
+        instance._process_container = container
+
+        with patch("chromeDriver.log_fd_status"):
+            instance.close()
+
+        container.terminate.assert_called_once()
+        container.release.assert_called_once_with()
+        assert instance._process_container is None
+
+
+class TestMemoryAdmissionController:
+    MB = 1024 * 1024
+
+    def test_disabled_controller_admits_everything(self):
+        controller = MemoryAdmissionController(budget_mb=0)
+
+        with patch.object(controller, "measure_browsers") as mock_measure:
+            controller.admit(timeout=0)
+
+        mock_measure.assert_not_called()
+
+    def test_rejects_with_reason_when_budget_is_exhausted(self):
+        controller = MemoryAdmissionController(budget_mb=1000, estimate_mb=400, reserve_mb=0)
+        before = metrics.browserAdmissionRejectionsTotal.getValue(
+            reason="browser memory budget exhausted"
+        )
+
+        with patch.object(controller, "measure_browsers", return_value=[600 * self.MB]), patch(
+            "chromeDriver._read_host_available_memory", return_value=None
+        ):
+            with pytest.raises(MemoryExhaustedError, match="browser memory budget exhausted"):
+                controller.admit(timeout=0)
+
+        assert metrics.browserAdmissionRejectionsTotal.getValue(
+            reason="browser memory budget exhausted"
+        ) == before + 1
+
+    def test_rejects_when_host_memory_is_saturated(self):
+        controller = MemoryAdmissionController(budget_mb=4000, estimate_mb=400, reserve_mb=256)
+
+        with patch.object(controller, "measure_browsers", return_value=[]), patch(
+            "chromeDriver._read_host_available_memory", return_value=500 * self.MB
+        ):
+            assert "host memory saturated" in controller.check()
+
+    def test_admit_wakes_when_a_browser_closes(self):
+        controller = MemoryAdmissionController(budget_mb=1000, estimate_mb=400, reserve_mb=0)
+        queued = threading.Event()
+        usages = [[600 * self.MB]]
+
+        def measure():
+            queued.set()
+            return usages[-1]
+
+        with patch.object(controller, "measure_browsers", side_effect=measure), patch(
+            "chromeDriver._read_host_available_memory", return_value=None
+        ), patch("chromeDriver.MEMORY_ADMISSION_RECHECK_INTERVAL", 30):
+            waiter = threading.Thread(target=controller.admit, kwargs={"timeout": 30})
+            started = time.monotonic()
+            waiter.start()
+            assert queued.wait(5)
+            usages.append([])
+            controller.notify_released()
+            waiter.join(5)
+
+        assert not waiter.is_alive()
+        assert time.monotonic() - started < 5
+        assert controller.reserved_bytes() == 400 * self.MB
+
+    def test_admit_rechecks_after_bounded_wait_without_release(self):
+        controller = MemoryAdmissionController(budget_mb=1000, estimate_mb=400, reserve_mb=0)
+
+        with patch.object(
+            controller, "measure_browsers", side_effect=[[600 * self.MB], []]
+        ), patch("chromeDriver._read_host_available_memory", return_value=None), patch(
+            "chromeDriver.MEMORY_ADMISSION_RECHECK_INTERVAL", 0.01
+        ):
+            assert controller.admit(timeout=5) == 400 * self.MB
+
+    def test_concurrent_admits_reserve_launching_browsers(self):
+        controller = MemoryAdmissionController(budget_mb=500, estimate_mb=400, reserve_mb=0)
+        start = threading.Barrier(3)
+        admitted, rejected = [], []
+
+        def admit():
+            start.wait()
+            try:
+                admitted.append(controller.admit(timeout=0))
+            except MemoryExhaustedError:
+                rejected.append(True)
+
+        with patch.object(controller, "measure_browsers", return_value=[]), patch(
+            "chromeDriver._read_host_available_memory", return_value=None
+        ):
+            threads = [threading.Thread(target=admit) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+            assert len(admitted) == 1
+            assert len(rejected) == 2
+            assert controller.reserved_bytes() == 400 * self.MB
+
+            controller.release(admitted[0])
+            assert controller.reserved_bytes() == 0
+            assert controller.check() is None
+
+    def test_reserve_releases_when_browser_startup_fails(self):
+        controller = MemoryAdmissionController(budget_mb=500, estimate_mb=400, reserve_mb=0)
+
+        with patch.object(controller, "measure_browsers", return_value=[]), patch(
+            "chromeDriver._read_host_available_memory", return_value=None
+        ):
+            with pytest.raises(RuntimeError):
+                with controller.reserve(timeout=0):
+                    raise RuntimeError("chrome failed to start")
+
+        assert controller.reserved_bytes() == 0
+
+    def test_effective_limit_follows_measured_browser_size(self):
+        controller = MemoryAdmissionController(budget_mb=1000, estimate_mb=400)
+
+        assert controller.effective_limit([]) == 2
+        assert controller.effective_limit([200 * self.MB, 300 * self.MB]) == 3
+        assert controller.effective_limit([900 * self.MB]) == 1
+
+    def test_measure_browsers_sums_each_process_tree(self):
+        controller = MemoryAdmissionController(budget_mb=1000)
+        driver_instance = MagicMock()
+        driver_instance._cleanup_metadata = {"browserPid": 51, "servicePid": 50}
+        table = ProcessTable({
+            50: {"ppid": 1, "argv": ["chromedriver"]},
+            51: {"ppid": 1, "argv": ["chrome"]},
+            52: {"ppid": 51, "argv": ["chrome", "--type=renderer"]},
+            60: {"ppid": 1, "argv": ["unrelated"]},
+        })
+
+        with patch("chromeDriver._active_drivers", {driver_instance}), patch(
+            "chromeDriver.ProcessTable.read", return_value=table
+        ), patch("chromeDriver._read_process_memory", side_effect=lambda pid: pid * self.MB):
+            assert controller.measure_browsers() == [(50 + 51 + 52) * self.MB]
@@ -0,0 +1,75 @@
+import os
+import time
+
+import pytest
+
+cryptography = pytest.importorskip("cryptography")
+from cryptography.fernet import Fernet
+
+from cookieStore import CookieStore, isNaverCookie
+
+
+def naver_cookie(name, expires=-1, domain=".naver.com"):
+    return {"name": name, "value": f"{name}-value", "domain": domain, "expires": expires}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CookieStore(str(tmp_path / "cookies.bin"), Fernet.generate_key().decode())
+
+
+class TestIsNaverCookie:
+    def test_matches_naver_domains_only(self):
+        assert isNaverCookie(naver_cookie("NID_AUT")) is True
+        assert isNaverCookie(naver_cookie("x", domain="partner.booking.naver.com")) is True
+        assert isNaverCookie(naver_cookie("x", domain="notnaver.com")) is False
+        assert isNaverCookie(naver_cookie("x", domain="google.com")) is False
+
+
+class TestCookieStore:
+    def test_round_trip_keeps_naver_cookies(self, store):
+        saved = store.save(
+            [naver_cookie("NID_AUT"), naver_cookie("NID_SES"), naver_cookie("x", domain="google.com")]
+        )
+
+        assert saved == 2
+        assert [cookie["name"] for cookie in store.load()] == ["NID_AUT", "NID_SES"]
+
+    def test_file_is_encrypted_and_private(self, store):
+        store.save([naver_cookie("NID_AUT")])
+
+        with open(store.path, "rb") as file:
+            content = file.read()
+        assert b"NID_AUT" not in content
+        assert os.stat(store.path).st_mode & 0o777 == 0o600
+
+    def test_expired_cookies_are_dropped(self, store):
+        store.save([naver_cookie("NID_AUT", expires=time.time() - 5)])
+
+        assert store.load() is None
+
+    def test_wrong_key_cannot_read(self, store):
+        store.save([naver_cookie("NID_AUT")])
+        other = CookieStore(store.path, Fernet.generate_key().decode())
+
+        assert other.load() is None
+
+    def test_missing_file_returns_none(self, store):
+        assert store.load() is None
+
+    def test_clear_removes_file(self, store):
+        store.save([naver_cookie("NID_AUT")])
+        store.clear()
+
+        assert not os.path.exists(store.path)
+
+    def test_refuses_plaintext_without_key(self, tmp_path):
+        path = str(tmp_path / "cookies.bin")
+        plain = CookieStore(path, "")
+
+        assert plain.isEnabled() is False
+        assert plain.save([naver_cookie("NID_AUT")]) == 0
+        assert not os.path.exists(path)
+
+    def test_invalid_key_disables_store(self, tmp_path):
+        assert CookieStore(str(tmp_path / "cookies.bin"), "not-a-key").isEnabled() is False
@@ -2,7 +2,9 @@ import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
 from flaskServer import app, checkActivationKey
+import metrics
 import os
+import time
 
 
 @pytest.fixture
@@ -516,3 +518,241 @@ class TestGetNaverReservation:
         assert response.status_code == 500
         result = response.get_json()
         assert result["message"] == "Get Naver Reservation Failed: driver init failed"
+
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_sync_out_memory_exhausted_returns_503(self, mock_chrome_driver, client, valid_activation_key):
+        from chromeDriver import MemoryExhaustedError
+
+        mock_chrome_driver.side_effect = MemoryExhaustedError("host memory saturated")
+
+        with patch('flaskServer.syncOutCoalescer.enabled', False):
+            response = client.post(
+                '/sync/out',
+                data=json.dumps({"activationKey": valid_activation_key, "monthSize": 1}),
+                content_type='application/json'
+            )
+
+        assert response.status_code == 503
+        assert response.get_json()["message"] == "Server memory exhausted: host memory saturated"
+
+
+class TestSyncOutDelta:
+    @patch('flaskServer.syncManager.getNaverReservation')
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_delta_returns_changes_since_cursor(
+        self, mock_chrome_driver, mock_get_reservation, client, valid_activation_key, tmp_path
+    ):
+        from bookingSnapshotStore import BookingSnapshotStore
+
+        store = BookingSnapshotStore(str(tmp_path / "bookings.db"))
+        first = {"reservationNumber": "1", "startDate": "20990101", "status": "확정"}
+        cursor = store.recordBookings([first])["cursor"]
+        store.recordBookings([dict(first, status="취소")])
+        mock_get_reservation.return_value = ([], [])
+
+        with patch('flaskServer.snapshotStore', store):
+            response = client.post(
+                '/sync/out',
+                data=json.dumps({
+                    "activationKey": valid_activation_key,
+                    "delta": True,
+                    "cursor": cursor,
+                }),
+                content_type='application/json'
+            )
+
+        assert response.status_code == 200
+        result = response.get_json()
+        assert result["message"] == "Sync Naver Reservation Changes"
+        assert result["cursor"] > cursor
+        assert [b["reservationNumber"] for b in result["cancelled"]] == ["1"]
+        assert result["added"] == []
+
+    @patch('flaskServer.syncManager.getNaverReservation')
+    def test_delta_requires_snapshot_store(self, mock_get_reservation, client, valid_activation_key):
+        from bookingSnapshotStore import BookingSnapshotStore
+
+        with patch('flaskServer.snapshotStore', BookingSnapshotStore("")):
+            response = client.post(
+                '/sync/out',
+                data=json.dumps({"activationKey": valid_activation_key, "delta": True}),
+                content_type='application/json'
+            )
+
+        assert response.status_code == 400
+        mock_get_reservation.assert_not_called()
+
+
+class TestSyncOutCoalescing:
+    @patch('flaskServer.syncManager.SyncNaver', return_value=["2024-08-19"])
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_sync_in_invalidates_sync_out_cache(
+        self, mock_chrome_driver, mock_sync_naver, client, valid_activation_key
+    ):
+        with patch('flaskServer.syncOutCoalescer') as mock_coalescer:
+            client.post(
+                '/sync/in',
+                data=json.dumps({
+                    "activationKey": valid_activation_key,
+                    "targetDatesStr": "2024-08-19",
+                    "targetRoom": "Yeoyu",
+                }),
+                content_type='application/json'
+            )
+
+        mock_coalescer.invalidate.assert_called_once()
+
+
+class TestSyncJobs:
+    def _wait_for_job(self, client, job_id, valid_activation_key, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            response = client.get(
+                f'/sync/jobs/{job_id}',
+                headers={"X-Activation-Key": valid_activation_key},
+            )
+            job = response.get_json()["job"]
+            if job["status"] in ("succeeded", "failed"):
+                return job
+            time.sleep(0.01)
+        raise AssertionError(f"job {job_id} did not finish")
+
+    @patch('flaskServer.syncManager.getNaverReservation')
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_sync_out_async_returns_job_id_and_result(
+        self, mock_chrome_driver, mock_get_reservation, client, valid_activation_key
+    ):
+        mock_driver_instance = MagicMock()
+        mock_chrome_driver.return_value = mock_driver_instance
+        mock_get_reservation.return_value = ([], [])
+
+        response = client.post(
+            '/sync/out',
+            data=json.dumps({"activationKey": valid_activation_key, "monthSize": 2, "async": True}),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 202
+        result = response.get_json()
+        assert result["message"] == "Sync Job Accepted"
+        assert result["statusUrl"] == f"/sync/jobs/{result['jobId']}"
+
+        job = self._wait_for_job(client, result["jobId"], valid_activation_key)
+        assert job["status"] == "succeeded"
+        assert job["statusCode"] == 200
+        assert job["result"]["notCanceledBookingList"] == []
+        mock_get_reservation.assert_called_once_with(mock_driver_instance, 2)
+
+    @patch('flaskServer.syncManager.SyncNaver')
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_sync_in_async_reports_failure_in_job(
+        self, mock_chrome_driver, mock_sync_naver, client, valid_activation_key
+    ):
+        mock_chrome_driver.return_value = MagicMock()
+        mock_sync_naver.side_effect = Exception("Test error")
+
+        response = client.post(
+            '/sync/in',
+            data=json.dumps({
+                "activationKey": valid_activation_key,
+                "targetDatesStr": "2024-09-02",
+                "targetRoom": "Yeoyu",
+                "async": True
+            }),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 202
+        job = self._wait_for_job(client, response.get_json()["jobId"], valid_activation_key)
+        assert job["status"] == "failed"
+        assert job["statusCode"] == 500
+        assert job["result"]["message"] == "Sync Naver Reservation Failed"
+
+    def test_get_unknown_job(self, client, valid_activation_key):
+        response = client.get(f'/sync/jobs/missing?activationKey={valid_activation_key}')
+
+        assert response.status_code == 404
+        assert response.get_json()["message"] == "Sync Job Not Found"
+
+    def test_get_job_queue_requires_activation_key(self, client):
+        response = client.get('/sync/jobs?activationKey=wrong_key')
+
+        assert response.status_code == 401
+
+
+class TestMetricsEndpoint:
+    def test_metrics_requires_activation_key(self, client):
+        response = client.get('/metrics')
+
+        assert response.status_code == 401
+
+    def test_metrics_renders_prometheus_text(self, client, valid_activation_key):
+        metrics.recordPhase("uc_launch", 1.2)
+
+        response = client.get('/metrics', headers={"X-Activation-Key": valid_activation_key})
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        body = response.get_data(as_text=True)
+        assert "# TYPE scraper_browser_phase_seconds histogram" in body
+        assert 'scraper_browser_phase_seconds_count{phase="uc_launch"}' in body
+
+    def test_metrics_include_request_and_resource_series(self, client, valid_activation_key):
+        headers = {"X-Activation-Key": valid_activation_key}
+        before = metrics.httpRequestsTotal.getValue(endpoint="/metrics", method="GET", status=200)
+
+        client.get('/metrics', headers=headers)
+        response = client.get('/metrics', headers=headers)
+
+        body = response.get_data(as_text=True)
+        assert metrics.httpRequestsTotal.getValue(endpoint="/metrics", method="GET", status=200) == before + 2
+        assert 'scraper_http_request_duration_seconds_count{endpoint="/metrics",method="GET"}' in body
+        for name in ("scraper_active_browsers", "scraper_pooled_browsers", "scraper_open_fds", "scraper_fd_limit"):
+            assert f"# TYPE {name} gauge" in body
+
+    @patch('flaskServer.syncManager.getNaverReservation')
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_lookup_error_reason_is_counted(
+        self, mock_chrome_driver, mock_get_reservation, client, valid_activation_key
+    ):
+        from syncManager import ReservationLookupError
+
+        mock_get_reservation.side_effect = ReservationLookupError(
+            "booking list DOM wait timed out at booking_list_month_1", "sid"
+        )
+        before = metrics.reservationLookupErrorsTotal.getValue(reason="dom_timeout")
+
+        with patch('flaskServer.syncOutCoalescer.enabled', False):
+            response = client.post(
+                '/sync/out',
+                data=json.dumps({"activationKey": valid_activation_key, "monthSize": 1}),
+                content_type='application/json'
+            )
+
+        assert response.status_code == 500
+        assert metrics.reservationLookupErrorsTotal.getValue(reason="dom_timeout") == before + 1
+
+    @patch('flaskServer.syncManager.SyncNaver')
+    @patch('flaskServer.chromeDriver.ChromeDriver')
+    def test_sync_response_includes_timing_block(
+        self, mock_chrome_driver, mock_sync_naver, client, valid_activation_key
+    ):
+        def sync_naver(*args):
+            metrics.recordPhase("uc_launch", 2.0)
+            return ["2024-08-19"]
+
+        mock_sync_naver.side_effect = sync_naver
+
+        response = client.post(
+            '/sync/in',
+            data=json.dumps({
+                "activationKey": valid_activation_key,
+                "targetDatesStr": "2024-08-19",
+                "targetRoom": "Yeoyu",
+            }),
+            content_type='application/json'
+        )
+
+        timing = response.get_json()["timing"]
+        assert timing["phases"] == {"uc_launch": 2.0}
+        assert timing["totalSeconds"] >= 0
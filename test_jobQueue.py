@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from jobQueue import (
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_SUCCEEDED,
+    JobQueue,
+    JobQueueFullError,
+)
+
+
+def wait_for_status(queue, job_id, statuses, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not reach {statuses}")
+
+
+class TestJobQueue:
+    def test_job_result_is_available_after_completion(self):
+        queue = JobQueue(workers=1, maxPending=5, resultTtl=60)
+
+        job = queue.submit("sync_out", lambda: ({"message": "ok"}, 200))
+        finished = wait_for_status(queue, job["jobId"], {JOB_STATUS_SUCCEEDED})
+
+        assert finished["result"] == {"message": "ok"}
+        assert finished["statusCode"] == 200
+        assert finished["runSeconds"] is not None
+        assert queue.getStats()["completed"] == 1
+
+    def test_error_status_code_marks_job_failed(self):
+        queue = JobQueue(workers=1, maxPending=5, resultTtl=60)
+
+        job = queue.submit("sync_in", lambda: ({"message": "busy"}, 503))
+        finished = wait_for_status(queue, job["jobId"], {JOB_STATUS_FAILED})
+
+        assert finished["statusCode"] == 503
+
+    def test_exception_is_reported_as_failed_job(self):
+        queue = JobQueue(workers=1, maxPending=5, resultTtl=60)
+
+        def crash():
+            raise RuntimeError("boom")
+
+        job = queue.submit("sync_in", crash)
+        finished = wait_for_status(queue, job["jobId"], {JOB_STATUS_FAILED})
+
+        assert finished["statusCode"] == 500
+        assert "boom" in finished["result"]["message"]
+
+    def test_submit_rejects_when_pending_limit_reached(self):
+        queue = JobQueue(workers=1, maxPending=1, resultTtl=60)
+        release = threading.Event()
+
+        running = queue.submit("sync_out", lambda: (release.wait(2), ({}, 200))[1])
+        wait_for_status(queue, running["jobId"], {"running"})
+        queued = queue.submit("sync_out", lambda: ({}, 200))
+
+        assert queued["status"] == JOB_STATUS_QUEUED
+        assert queued["queuePosition"] == 1
+        with pytest.raises(JobQueueFullError):
+            queue.submit("sync_out", lambda: ({}, 200))
+
+        release.set()
+        wait_for_status(queue, queued["jobId"], {JOB_STATUS_SUCCEEDED})
+
+    def test_unknown_job_returns_none(self):
+        queue = JobQueue(workers=1, maxPending=1, resultTtl=60)
+
+        assert queue.get("missing") is None
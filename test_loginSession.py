@@ -0,0 +1,99 @@
+import time
+from unittest.mock import MagicMock
+
+from loginSession import LoginSessionManager, hasValidAuthCookies, isLoginRedirect
+
+
+def auth_cookies(expires=-1):
+    return [
+        {"name": "NID_AUT", "value": "aut", "expires": expires},
+        {"name": "NID_SES", "value": "ses", "expires": expires},
+    ]
+
+
+def make_driver(cookies, profile_path="/tmp/profile-a"):
+    mock_driver = MagicMock()
+    mock_driver.active_chrome_profile_path = profile_path
+    mock_driver.getCookies.return_value = cookies
+    return mock_driver
+
+
+class TestHasValidAuthCookies:
+    def test_session_cookies_are_valid(self):
+        assert hasValidAuthCookies(auth_cookies()) is True
+
+    def test_missing_cookie_is_invalid(self):
+        assert hasValidAuthCookies(auth_cookies()[:1]) is False
+
+    def test_expired_cookie_is_invalid(self):
+        assert hasValidAuthCookies(auth_cookies(expires=time.time() - 10)) is False
+
+    def test_empty_value_is_invalid(self):
+        cookies = auth_cookies()
+        cookies[1]["value"] = ""
+        assert hasValidAuthCookies(cookies) is False
+
+
+class TestIsLoginRedirect:
+    def test_detects_nid_host(self):
+        assert isLoginRedirect("https://nid.naver.com/nidlogin.login?url=x") is True
+
+    def test_ignores_partner_host_and_non_strings(self):
+        assert isLoginRedirect("https://partner.booking.naver.com/bizes/1") is False
+        assert isLoginRedirect(None) is False
+        assert isLoginRedirect(MagicMock()) is False
+
+
+class TestLoginSessionManager:
+    def test_valid_cookies_are_cached_per_profile(self):
+        manager = LoginSessionManager(ttl=600)
+        first = make_driver(auth_cookies())
+        second = make_driver([])
+
+        assert manager.check(first) is True
+        # Same profile in a new browser reuses the verified state without CDP.
+        assert manager.check(second) is True
+        second.getCookies.assert_not_called()
+
+    def test_expired_cache_reads_cookies_again(self):
+        manager = LoginSessionManager(ttl=0)
+        mock_driver = make_driver(auth_cookies())
+
+        manager.check(mock_driver)
+        manager.check(mock_driver)
+
+        assert mock_driver.getCookies.call_count == 2
+
+    def test_missing_cookies_require_login(self):
+        manager = LoginSessionManager(ttl=600)
+
+        assert manager.check(make_driver([])) is False
+
+    def test_unreadable_cookies_return_none(self):
+        manager = LoginSessionManager(ttl=600)
+
+        assert manager.check(make_driver(None)) is None
+
+        failing = make_driver(None)
+        failing.getCookies.side_effect = RuntimeError("cdp down")
+        assert manager.check(failing) is None
+
+    def test_invalidate_drops_cached_state(self):
+        manager = LoginSessionManager(ttl=600)
+        mock_driver = make_driver(auth_cookies())
+        manager.check(mock_driver)
+        mock_driver.getCookies.return_value = []
+
+        manager.invalidate(mock_driver)
+
+        assert manager.check(mock_driver) is False
+
+    def test_driver_without_profile_caches_on_instance(self):
+        manager = LoginSessionManager(ttl=600)
+        mock_driver = make_driver([], profile_path=None)
+        other_driver = make_driver([], profile_path=None)
+
+        manager.markLoggedIn(mock_driver)
+
+        assert manager.check(mock_driver) is True
+        assert manager.check(other_driver) is False
@@ -0,0 +1,98 @@
+import threading
+
+import metrics
+from metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    def test_render_uses_cumulative_buckets(self):
+        histogram = Histogram("demo_seconds", "Demo.", ("phase",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, phase="quit")
+        histogram.observe(0.5, phase="quit")
+        histogram.observe(3.0, phase="quit")
+
+        lines = histogram.render()
+        assert "# TYPE demo_seconds histogram" in lines
+        assert 'demo_seconds_bucket{phase="quit",le="0.1"} 1' in lines
+        assert 'demo_seconds_bucket{phase="quit",le="1"} 2' in lines
+        assert 'demo_seconds_bucket{phase="quit",le="+Inf"} 3' in lines
+        assert 'demo_seconds_sum{phase="quit"} 3.55' in lines
+        assert 'demo_seconds_count{phase="quit"} 3' in lines
+
+    def test_label_values_are_escaped(self):
+        histogram = Histogram("demo_seconds", "Demo.", ("phase",), buckets=(1.0,))
+
+        histogram.observe(0.5, phase='a"b')
+
+        assert 'demo_seconds_count{phase="a\\"b"} 1' in histogram.render()
+
+
+class TestCounterAndGauge:
+    def test_counter_accumulates_per_label_set(self):
+        counter = Counter("demo_total", "Demo.", ("status",))
+
+        counter.inc(status=200)
+        counter.inc(2, status=200)
+        counter.inc(status=500)
+
+        assert counter.getValue(status=200) == 3
+        assert counter.render()[-2:] == [
+            'demo_total{status="200"} 3',
+            'demo_total{status="500"} 1',
+        ]
+
+    def test_callback_gauge_reads_value_at_render_time(self):
+        values = iter([3, 5])
+        gauge = Gauge("demo_value", "Demo.", callback=lambda: next(values))
+
+        assert gauge.render()[-1] == "demo_value 3"
+        assert gauge.render()[-1] == "demo_value 5"
+
+    def test_failing_callback_renders_no_sample(self):
+        gauge = Gauge("demo_value", "Demo.", callback=lambda: 1 / 0)
+
+        assert gauge.render() == ["# HELP demo_value Demo.", "# TYPE demo_value gauge"]
+
+
+class TestMetricsRegistry:
+    def test_histogram_is_registered_once(self):
+        registry = MetricsRegistry()
+
+        first = registry.histogram("demo_seconds", "Demo.")
+        second = registry.histogram("demo_seconds", "Demo.")
+
+        assert first is second
+        assert registry.render().startswith("# HELP demo_seconds Demo.\n")
+
+
+class TestTimingCollection:
+    def test_phases_are_collected_per_thread(self):
+        other_thread_collector = {}
+
+        def record_elsewhere():
+            other_thread_collector["value"] = metrics.getTimingCollector()
+            metrics.recordPhase("uc_launch", 5.0)
+
+        with metrics.collectTimings() as timing:
+            metrics.recordPhase("uc_launch", 1.0)
+            metrics.recordPhase("uc_launch", 0.5)
+            with metrics.timePhase("health_check"):
+                pass
+            thread = threading.Thread(target=record_elsewhere)
+            thread.start()
+            thread.join()
+
+        result = timing.toDict()
+        assert result["phases"]["uc_launch"] == 1.5
+        assert "health_check" in result["phases"]
+        assert other_thread_collector["value"] is None
+        assert metrics.getTimingCollector() is None
+
+    def test_phases_feed_the_shared_histogram(self):
+        before = metrics.browserPhaseSeconds.getSnapshot().get(("test_phase",), {"count": 0})
+
+        metrics.recordPhase("test_phase", 0.2)
+
+        after = metrics.browserPhaseSeconds.getSnapshot()[("test_phase",)]
+        assert after["count"] == before["count"] + 1
@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock, patch
+
+import pacing
+from pacing import Pacer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_pacer(**kwargs):
+    clock = FakeClock()
+    options = {
+        "ratePerMinute": 60,
+        "burst": 2,
+        "minInterval": 0,
+        "jitter": 0,
+        "clock": clock,
+        "sleeper": clock.sleep,
+    }
+    options.update(kwargs)
+    return Pacer(**options), clock
+
+
+class TestPacer:
+    def test_does_not_wait_within_burst(self):
+        pacer, _ = make_pacer()
+
+        assert pacer.pace("partner.booking.naver.com") == 0
+        assert pacer.pace("partner.booking.naver.com") == 0
+        assert pacer.getStats()["waits"] == 0
+
+    def test_waits_once_budget_is_exhausted(self):
+        pacer, clock = make_pacer()
+        pacer.pace("host")
+        pacer.pace("host")
+
+        waited = pacer.pace("host")
+
+        assert waited == 1.0
+        assert clock.now == 1001.0
+        assert pacer.getStats()["totalWaitSeconds"] == 1.0
+
+    def test_hosts_have_independent_budgets(self):
+        pacer, _ = make_pacer(burst=1)
+        pacer.pace("a")
+
+        assert pacer.pace("b") == 0
+
+    def test_min_interval_spaces_actions(self):
+        pacer, clock = make_pacer(burst=10, minInterval=0.5)
+        pacer.pace("host")
+
+        assert pacer.pace("host") == 0.5
+
+    def test_security_keywords_raise_penalty_and_clean_pages_decay_it(self):
+        pacer, _ = make_pacer()
+
+        assert pacer.recordSignal("host", ["캡차"]) == 2.0
+        assert pacer.recordSignal("host", ["캡차"]) == 4.0
+        assert pacer.recordSignal("host", [], loadSeconds=1) == 3.2
+
+    def test_slow_page_raises_penalty_up_to_cap(self):
+        pacer, _ = make_pacer(slowPageSeconds=5, maxPenalty=2)
+
+        pacer.recordSignal("host", loadSeconds=6)
+        pacer.recordSignal("host", loadSeconds=6)
+
+        assert pacer.getStats()["hosts"]["host"]["penalty"] == 2.0
+
+    def test_penalty_slows_refill(self):
+        pacer, _ = make_pacer(burst=1)
+        pacer.recordSignal("host", ["차단"])
+        pacer.pace("host")
+
+        assert pacer.pace("host") == 2.0
+
+    def test_record_wait_counts_fixed_sleeps(self):
+        pacer, _ = make_pacer()
+
+        pacer.recordWait("host", 2.5)
+
+        stats = pacer.getStats()
+        assert stats["totalWaitSeconds"] == 2.5
+        assert stats["hosts"]["host"]["waitSeconds"] == 2.5
+
+
+class TestSyncManagerPacing:
+    def test_random_sleep_uses_pacer_in_adaptive_mode(self):
+        import syncManager
+
+        mock_driver = MagicMock()
+        with patch("syncManager.pacing.PACING_MODE", "adaptive"), patch.object(
+            pacing.pacer, "pace", return_value=0
+        ) as mock_pace:
+            syncManager.randomSleep(mock_driver)
+
+        mock_pace.assert_called_once_with(syncManager.partnerBookingHost)
+        mock_driver.wait.assert_not_called()
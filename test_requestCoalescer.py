@@ -0,0 +1,152 @@
+import threading
+import time
+
+from requestCoalescer import (
+    SOURCE_CACHE,
+    SOURCE_INFLIGHT,
+    SOURCE_SCRAPE,
+    SyncOutCoalescer,
+)
+
+
+def trim(result, monthSize):
+    return tuple(bookings[:monthSize] for bookings in result)
+
+
+def make_result(monthSize):
+    bookings = [{"reservationNumber": str(i)} for i in range(monthSize)]
+    return bookings, list(bookings)
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, "condition not met in time"
+        time.sleep(0.001)
+
+
+def run_in_thread(coalescer, monthSize, scrape, results):
+    def target():
+        results.append(coalescer.run(monthSize, scrape))
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread
+
+
+class TestSyncOutCoalescer:
+    def test_concurrent_requests_share_one_scrape(self):
+        coalescer = SyncOutCoalescer(trim, cacheTtl=0)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def scrape():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return make_result(3)
+
+        results = []
+        owner = run_in_thread(coalescer, 3, scrape, results)
+        started.wait(2)
+        follower = run_in_thread(coalescer, 2, scrape, results)
+        wait_until(lambda: coalescer._flights and coalescer._flights[0].waiters)
+        release.set()
+        owner.join(2)
+        follower.join(2)
+
+        assert len(calls) == 1
+        by_source = {source: result for result, source in results}
+        assert len(by_source[SOURCE_SCRAPE][1]) == 3
+        assert len(by_source[SOURCE_INFLIGHT][1]) == 2
+
+    def test_larger_request_does_not_attach_to_smaller_scrape(self):
+        coalescer = SyncOutCoalescer(trim, cacheTtl=0)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def scrape():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return make_result(1)
+
+        results = []
+        first = run_in_thread(coalescer, 1, scrape, results)
+        started.wait(2)
+        second = run_in_thread(coalescer, 2, lambda: (calls.append(2), make_result(2))[1], results)
+        second.join(2)
+        release.set()
+        first.join(2)
+
+        assert calls.count(2) == 1
+        assert [source for _, source in results] == [SOURCE_SCRAPE, SOURCE_SCRAPE]
+
+    def test_errors_propagate_to_attached_requests(self):
+        coalescer = SyncOutCoalescer(trim, cacheTtl=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def scrape():
+            started.set()
+            release.wait(2)
+            raise RuntimeError("boom")
+
+        errors = []
+
+        def attach():
+            try:
+                coalescer.run(1, scrape)
+            except RuntimeError as e:
+                errors.append(e)
+
+        owner = threading.Thread(target=attach)
+        owner.start()
+        started.wait(2)
+        follower = threading.Thread(target=attach)
+        follower.start()
+        wait_until(lambda: coalescer._flights and coalescer._flights[0].waiters)
+        release.set()
+        owner.join(2)
+        follower.join(2)
+
+        assert len(errors) == 2
+
+    def test_cache_serves_smaller_requests_until_invalidated(self):
+        coalescer = SyncOutCoalescer(trim, cacheTtl=60)
+        calls = []
+
+        def scrape():
+            calls.append(1)
+            return make_result(3)
+
+        assert coalescer.run(3, scrape)[1] == SOURCE_SCRAPE
+        result, source = coalescer.run(1, scrape)
+        assert source == SOURCE_CACHE
+        assert len(result[0]) == 1
+
+        coalescer.invalidate()
+
+        assert coalescer.run(1, scrape)[1] == SOURCE_SCRAPE
+        assert len(calls) == 2
+
+    def test_cache_is_disabled_by_default_ttl(self):
+        coalescer = SyncOutCoalescer(trim, cacheTtl=0)
+        calls = []
+
+        def scrape():
+            calls.append(1)
+            return make_result(1)
+
+        coalescer.run(1, scrape)
+        coalescer.run(1, scrape)
+
+        assert len(calls) == 2
+
+    def test_disabled_coalescer_always_scrapes(self):
+        coalescer = SyncOutCoalescer(trim, enabled=False, cacheTtl=60)
+
+        assert coalescer.run(1, lambda: make_result(1))[1] == SOURCE_SCRAPE
+        assert coalescer.run(1, lambda: make_result(1))[1] == SOURCE_SCRAPE
@@ -137,3 +137,245 @@ class TestFindTargetBtn:
 
         assert "roomIndex=0" in str(exc_info.value)
         assert "dateIndex=0" in str(exc_info.value)
+
+    def test_rejects_negative_date_index(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+
+        with pytest.raises(NoSuchElementException, match="dateIndex=-7"):
+            controller.findTargetBtn(mock_driver, -7, 1)
+
+        mock_driver.executeScript.assert_not_called()
+        mock_driver.findByXpath.assert_not_called()
+
+
+class TestFindTargetPage:
+    def _page(self, period):
+        return (
+            '<div><a class="DatePeriodCalendar__date-info__abc" href="#">'
+            f"{period}</a></div>"
+        )
+
+    def test_waits_for_period_text_change_instead_of_sleeping(self, monkeypatch):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.getPageSource.side_effect = [
+            self._page("24. 8. 12. ~ 8. 18."),
+            self._page("24. 8. 19. ~ 8. 25."),
+        ]
+        mock_driver.waitForTextChange.return_value = {"text": "24. 8. 19. ~ 8. 25."}
+        mock_sleep = MagicMock()
+        monkeypatch.setattr("simpleManagementController.sleep", mock_sleep)
+
+        result = controller.findTargetPage(mock_driver, datetime.date(2024, 8, 21))
+
+        assert result == 2
+        mock_driver.waitForTextChange.assert_called_once_with(
+            'a[class^="DatePeriodCalendar__date-info"]', "24. 8. 12. ~ 8. 18.", 5
+        )
+        mock_sleep.assert_not_called()
+
+    def test_falls_back_to_sleep_when_driver_cannot_observe(self, monkeypatch):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.getPageSource.side_effect = [
+            self._page("24. 8. 12. ~ 8. 18."),
+            self._page("24. 8. 19. ~ 8. 25."),
+        ]
+        mock_driver.waitForTextChange.side_effect = RuntimeError("unsupported")
+        mock_sleep = MagicMock()
+        monkeypatch.setattr("simpleManagementController.sleep", mock_sleep)
+
+        result = controller.findTargetPage(mock_driver, datetime.date(2024, 8, 21))
+
+        assert result == 2
+        mock_sleep.assert_called_once_with(1)
+
+    def test_extract_date_info_text(self):
+        controller = SimpleManagementController()
+        assert (
+            controller.extractDateInfoText(self._page("24. 8. 12. ~ 8. 18."))
+            == "24. 8. 12. ~ 8. 18."
+        )
+        assert controller.extractDateInfoText("<div></div>") == ""
+
+
+class TestManagementGridSnapshot:
+    def test_find_target_btn_reads_grid_once_per_page(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        labels = [[MagicMock(), None, MagicMock()], [MagicMock(), MagicMock(), MagicMock()]]
+        mock_driver.executeScript.return_value = labels
+
+        assert controller.findTargetBtn(mock_driver, 0, 1) is labels[1][0]
+        assert controller.findTargetBtn(mock_driver, 2, 0) is labels[0][2]
+
+        mock_driver.executeScript.assert_called_once()
+        mock_driver.findByXpath.assert_not_called()
+
+    def test_missing_label_in_snapshot_falls_back_to_xpath(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeScript.return_value = [[None]]
+        cell = MagicMock()
+        mock_driver.findChildElementsByXpath.side_effect = [[MagicMock()], [cell], []]
+
+        with pytest.raises(NoSuchElementException):
+            controller.findTargetBtn(mock_driver, 0, 0)
+
+        mock_driver.findByXpath.assert_called_once()
+
+    def test_period_change_invalidates_snapshot(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeScript.return_value = [[MagicMock()]]
+        controller.findTargetBtn(mock_driver, 0, 0)
+
+        controller.findTargetPeriod(
+            datetime.date(2024, 9, 1),
+            '<a class="DatePeriodCalendar__date-info">24. 8. 12. ~ 8. 18.</a>',
+            mock_driver,
+        )
+
+        assert controller.getCurrentPeriod() is None
+        controller.findTargetBtn(mock_driver, 0, 0)
+        assert mock_driver.executeScript.call_count == 3
+
+    def test_find_target_page_reuses_displayed_period(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.getPageSource.return_value = (
+            '<a class="DatePeriodCalendar__date-info">24. 8. 12. ~ 8. 18.</a>'
+        )
+
+        assert controller.findTargetPage(mock_driver, datetime.date(2024, 8, 13)) == 1
+        assert controller.findTargetPage(mock_driver, datetime.date(2024, 8, 18)) == 6
+
+        mock_driver.getPageSource.assert_called_once()
+        assert controller.getCurrentPeriod() == (
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        )
+
+
+class TestSeekPeriod:
+    def test_jumps_forward_in_single_async_call(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeAsyncScript.return_value = {"clicked": 5, "label": "..."}
+
+        moved = controller.seekPeriod(
+            mock_driver,
+            datetime.date(2024, 9, 20),
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        )
+
+        assert moved == 5
+        args = mock_driver.executeAsyncScript.call_args.args
+        assert args[1] == 'button[class*="DatePeriodCalendar__next"]'
+        assert args[3] == 5
+        mock_driver.findByXpath.assert_not_called()
+
+    def test_seeks_backwards_for_dates_before_current_period(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeAsyncScript.return_value = {"clicked": 2, "label": "..."}
+
+        controller.seekPeriod(
+            mock_driver,
+            datetime.date(2024, 7, 30),
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        )
+
+        args = mock_driver.executeAsyncScript.call_args.args
+        assert args[1] == 'button[class*="DatePeriodCalendar__prev"]'
+        assert args[3] == 2
+
+    def test_falls_back_to_single_click_when_async_script_is_unsupported(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeAsyncScript.side_effect = RuntimeError("unsupported")
+
+        moved = controller.seekPeriod(
+            mock_driver,
+            datetime.date(2024, 9, 20),
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        )
+
+        assert moved == 1
+        mock_driver.findByXpath.assert_called_once_with(
+            '//button[contains(@class, "DatePeriodCalendar__next")]'
+        )
+
+    def test_find_target_page_stops_when_period_button_is_blocked(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.getPageSource.return_value = (
+            '<a class="DatePeriodCalendar__date-info">24. 8. 12. ~ 8. 18.</a>'
+        )
+        mock_driver.executeAsyncScript.return_value = {"clicked": 0, "blocked": True}
+
+        result = controller.findTargetPage(mock_driver, datetime.date(2024, 7, 1))
+
+        assert result == -1
+        mock_driver.getPageSource.assert_called_once()
+
+    def test_period_across_new_year_seeks_forward(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeAsyncScript.return_value = {"clicked": 1, "label": "..."}
+
+        result = controller.findTargetPeriod(
+            datetime.date(2026, 1, 10),
+            '<a class="DatePeriodCalendar__date-info">25. 12. 29. ~ 1. 4.</a>',
+            mock_driver,
+        )
+
+        assert result == -1
+        assert controller.seekBlocked is False
+        args = mock_driver.executeAsyncScript.call_args.args
+        assert args[1] == 'button[class*="DatePeriodCalendar__next"]'
+        assert args[3] == 1
+
+    def test_period_across_new_year_contains_january_dates(self):
+        controller = SimpleManagementController()
+
+        result = controller.findTargetPeriod(
+            datetime.date(2026, 1, 2),
+            '<a class="DatePeriodCalendar__date-info">25. 12. 29. ~ 1. 4.</a>',
+            MagicMock(),
+        )
+
+        assert result == 4
+        assert controller.currentPeriod == (datetime.date(2025, 12, 29), datetime.date(2026, 1, 4))
+
+    def test_stalled_seek_without_clicks_is_not_blocked(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeAsyncScript.return_value = {"clicked": 0, "stalled": True}
+
+        controller.seekPeriod(
+            mock_driver,
+            datetime.date(2024, 9, 20),
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        )
+
+        assert controller.seekBlocked is False
+
+    def test_missing_period_button_blocks_seek(self):
+        controller = SimpleManagementController()
+        mock_driver = MagicMock()
+        mock_driver.executeAsyncScript.side_effect = RuntimeError("unsupported")
+        mock_driver.findByXpath.side_effect = NoSuchElementException("missing")
+
+        assert controller.seekPeriod(
+            mock_driver,
+            datetime.date(2024, 9, 20),
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        ) == 0
+        assert controller.seekBlocked is True
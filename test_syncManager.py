@@ -1,6 +1,7 @@
 import pytest
 import datetime
 from unittest.mock import Mock, MagicMock, patch
+from selenium.common.exceptions import StaleElementReferenceException
 import bookingListExtractor
 from syncManager import (
     makeTargetDateList,
@@ -10,6 +11,16 @@ from syncManager import (
     ReservationLookupError,
     RoomType,
     waitForBookingListDom,
+    _getPageState,
+    pageStateSelectors,
+    bookingListReadySelectors,
+    getBookingRangeWindow,
+    parsePeriodLabel,
+    trimBookingsToMonthSize,
+    ensureLoginSession,
+    goToPartnerPage,
+    performLogin,
+    _recordRangeBookingsPerMonth,
 )
 
 
@@ -77,6 +88,10 @@ class TestMakeTargetDateList:
         result = makeTargetDateList("2024-08-19,2024-08-19,2024-08-20")
         assert len(result) == 3
 
+    def test_unpadded_dates_sort_chronologically(self):
+        result = makeTargetDateList("2024-9-10,2024-9-2")
+        assert result == [datetime.date(2024, 9, 2), datetime.date(2024, 9, 10)]
+
 
 class TestSyncNaver:
     @patch("syncManager.id", "test_id")
@@ -186,12 +201,138 @@ class TestSyncNaver:
         assert "2024-08-20" not in result
 
 
+class TestSyncNaverBatching:
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    def test_dates_in_displayed_period_share_one_page_lookup(
+        self, mock_real_sleep, mock_sleep
+    ):
+        mock_driver = MagicMock()
+        mock_controller = MagicMock()
+        periods = iter(
+            [
+                (datetime.date(2024, 8, 12), datetime.date(2024, 8, 18)),
+                (datetime.date(2024, 8, 19), datetime.date(2024, 8, 25)),
+            ]
+        )
+        mock_controller.findTargetPage.side_effect = [1, 2]
+        mock_controller.getCurrentPeriod.side_effect = lambda: next(periods)
+
+        with patch(
+            "syncManager.simpleManagementController.SimpleManagementController",
+            return_value=mock_controller,
+        ):
+            result = SyncNaver(
+                mock_driver, "2024-08-13,2024-08-15,2024-08-21,2024-08-18", "Yeohang"
+            )
+
+        assert result == ["2024-08-13", "2024-08-15", "2024-08-18", "2024-08-21"]
+        assert mock_controller.findTargetPage.call_count == 2
+        btn_calls = [call.args[1:] for call in mock_controller.findTargetBtn.call_args_list]
+        assert btn_calls == [(1, 1), (3, 1), (6, 1), (2, 1)]
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    @patch("syncManager.pacing.pacer.recordSignal")
+    def test_page_loads_feed_pacing_signals(
+        self, mock_record_signal, mock_real_sleep, mock_sleep
+    ):
+        mock_driver = MagicMock()
+        mock_driver.executeScript.return_value = {
+            "currentUrl": "https://partner.booking.naver.com/bizes/1/simple-management",
+            "detectedKeywords": ["captcha"],
+        }
+        mock_controller = MagicMock()
+        mock_controller.findTargetPage.return_value = 1
+        mock_controller.getCurrentPeriod.return_value = (
+            datetime.date(2024, 8, 12),
+            datetime.date(2024, 8, 18),
+        )
+
+        with patch(
+            "syncManager.simpleManagementController.SimpleManagementController",
+            return_value=mock_controller,
+        ):
+            SyncNaver(mock_driver, "2024-08-13", "Yeohang")
+
+        # 첫 페이지 로드와 기간 이동 각각 한 번씩 기록
+        assert mock_record_signal.call_count == 2
+        host, keywords, loadSeconds = mock_record_signal.call_args.args
+        assert host == "partner.booking.naver.com"
+        assert keywords == ["captcha"]
+        assert loadSeconds >= 0
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    def test_dates_outside_displayed_period_wait_for_their_own_page(
+        self, mock_real_sleep, mock_sleep
+    ):
+        mock_driver = MagicMock()
+        mock_controller = MagicMock()
+        periods = iter(
+            [
+                (datetime.date(2024, 8, 26), datetime.date(2024, 9, 8)),
+                (datetime.date(2024, 9, 9), datetime.date(2024, 9, 22)),
+            ]
+        )
+        mock_controller.findTargetPage.side_effect = [7, 1]
+        mock_controller.getCurrentPeriod.side_effect = lambda: next(periods)
+
+        with patch(
+            "syncManager.simpleManagementController.SimpleManagementController",
+            return_value=mock_controller,
+        ):
+            result = SyncNaver(mock_driver, "2024-9-10,2024-9-2", "Yeohang")
+
+        assert result == ["2024-09-02", "2024-09-10"]
+        btn_calls = [call.args[1:] for call in mock_controller.findTargetBtn.call_args_list]
+        assert btn_calls == [(7, 1), (1, 1)]
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    def test_stale_label_refreshes_snapshot_and_retries(
+        self, mock_real_sleep, mock_sleep
+    ):
+        mock_driver = MagicMock()
+        mock_controller = MagicMock()
+        mock_controller.findTargetPage.return_value = 0
+        mock_controller.getCurrentPeriod.return_value = None
+        clicks = []
+
+        def execute_script(script, *args):
+            if "arguments[0].click();" in script and args:
+                clicks.append(args[0])
+                if len(clicks) == 1:
+                    raise StaleElementReferenceException("stale")
+            return None
+
+        mock_driver.executeScript.side_effect = execute_script
+
+        with patch(
+            "syncManager.simpleManagementController.SimpleManagementController",
+            return_value=mock_controller,
+        ):
+            result = SyncNaver(mock_driver, "2024-08-19", "Yeoyu")
+
+        assert result == ["2024-08-19"]
+        mock_controller.invalidateGrid.assert_called_once()
+        assert len(clicks) == 2
+
+
 class TestGetNaverReservation:
     @patch("syncManager.id", "test_id")
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_single_month(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -206,13 +347,13 @@ class TestGetNaverReservation:
         ) + datetime.timedelta(days=7)
         future_date_str = future_date.strftime("%Y%m%d")
 
-        mock_extract.return_value = [
+        mock_extract.return_value = ([
             {
                 "reservationNumber": "12345",
                 "startDate": future_date_str,
                 "status": "confirmed",
             }
-        ]
+        ], False)
 
         result = getNaverReservation(mock_driver, 1)
 
@@ -227,7 +368,7 @@ class TestGetNaverReservation:
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_multiple_months(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -242,14 +383,14 @@ class TestGetNaverReservation:
         ) + datetime.timedelta(days=7)
         future_date_str = future_date.strftime("%Y%m%d")
 
-        mock_extract.return_value = [
+        mock_extract.return_value = ([
             {
                 "reservationNumber": f"1234{i}",
                 "startDate": future_date_str,
                 "status": "confirmed",
             }
             for i in range(3)
-        ]
+        ], False)
 
         result = getNaverReservation(mock_driver, 3)
 
@@ -261,7 +402,7 @@ class TestGetNaverReservation:
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_allows_empty_month(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -281,14 +422,14 @@ class TestGetNaverReservation:
         future_date_str = future_date.strftime("%Y%m%d")
 
         mock_extract.side_effect = [
-            [
+            ([
                 {
                     "reservationNumber": "12345",
                     "startDate": future_date_str,
                     "status": "confirmed",
                 }
-            ],
-            [],
+            ], False),
+            ([], True),
         ]
 
         not_canceled, all_bookings = getNaverReservation(mock_driver, 2)
@@ -301,7 +442,7 @@ class TestGetNaverReservation:
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_filters_canceled(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -316,7 +457,7 @@ class TestGetNaverReservation:
         ) + datetime.timedelta(days=7)
         future_date_str = future_date.strftime("%Y%m%d")
 
-        mock_extract.return_value = [
+        mock_extract.return_value = ([
             {
                 "reservationNumber": "12345",
                 "startDate": future_date_str,
@@ -327,7 +468,7 @@ class TestGetNaverReservation:
                 "startDate": future_date_str,
                 "status": "취소",
             },
-        ]
+        ], False)
 
         result = getNaverReservation(mock_driver, 1)
 
@@ -340,7 +481,7 @@ class TestGetNaverReservation:
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_removes_duplicates(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -356,14 +497,14 @@ class TestGetNaverReservation:
         future_date_str = future_date.strftime("%Y%m%d")
 
         mock_extract.side_effect = [
-            [
+            ([
                 {
                     "reservationNumber": "12345",
                     "startDate": future_date_str,
                 "status": "confirmed",
                 }
-            ],
-            [
+            ], False),
+            ([
                 {
                     "reservationNumber": "12345",
                     "startDate": future_date_str,
@@ -374,7 +515,7 @@ class TestGetNaverReservation:
                     "startDate": future_date_str,
                 "status": "confirmed",
                 },
-            ],
+            ], False),
         ]
 
         result = getNaverReservation(mock_driver, 2)
@@ -389,7 +530,7 @@ class TestGetNaverReservation:
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_filters_past_dates(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -405,7 +546,7 @@ class TestGetNaverReservation:
         past_date = (now - datetime.timedelta(days=7)).strftime("%Y%m%d")
         future_date = (now + datetime.timedelta(days=7)).strftime("%Y%m%d")
 
-        mock_extract.return_value = [
+        mock_extract.return_value = ([
             {
                 "reservationNumber": "12345",
                 "startDate": past_date,
@@ -416,7 +557,7 @@ class TestGetNaverReservation:
                 "startDate": future_date,
                 "status": "confirmed",
             },
-        ]
+        ], False)
 
         result = getNaverReservation(mock_driver, 1)
 
@@ -430,7 +571,7 @@ class TestGetNaverReservation:
     @patch("syncManager.randomRealSleep")
     @patch("syncManager.collectPageDiagnostics")
     @patch("syncManager.waitForBookingListDom")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_raises_when_dom_is_empty(
         self,
         mock_extract,
@@ -443,7 +584,7 @@ class TestGetNaverReservation:
         mock_driver.findBySelector.return_value.click = MagicMock()
         mock_driver.getPageSource.return_value = "<html></html>"
         mock_driver.getBrowserInfo.return_value = {}
-        mock_extract.return_value = []
+        mock_extract.return_value = ([], False)
         mock_collect_diagnostics.side_effect = [
             {"selectorCounts": {"calendarNextButton": 0}},
             {"selectorCounts": {"calendarNextButton": 0}},
@@ -463,6 +604,258 @@ class TestGetNaverReservation:
         assert "booking_list_initial" in wait_stages
 
 
+class TestBookingCapture:
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    @patch("syncManager.bookingCapture.captureMode", "network")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
+    def test_uses_captured_api_bookings_and_falls_back_per_month(
+        self, mock_extract, mock_real_sleep, mock_sleep
+    ):
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {}
+        mock_driver.startNetworkCapture.return_value = True
+        future_date = (
+            datetime.datetime.now(
+                datetime.timezone(datetime.timedelta(hours=9), "Asia/Seoul")
+            )
+            + datetime.timedelta(days=7)
+        ).strftime("%Y-%m-%d")
+        mock_driver.collectNetworkResponses.side_effect = [
+            [
+                {
+                    "url": "https://partner.booking.naver.com/api/bookings",
+                    "status": 200,
+                    "body": {"bookings": [{"bookingId": 1, "startDate": future_date}]},
+                }
+            ],
+            [],
+        ]
+        mock_extract.return_value = (
+            [{"reservationNumber": "2", "startDate": future_date.replace("-", "")}],
+            False,
+        )
+
+        not_canceled, all_bookings = getNaverReservation(mock_driver, 2)
+
+        assert sorted(b["reservationNumber"] for b in all_bookings) == ["1", "2"]
+        assert mock_extract.call_count == 1
+        assert mock_driver.getPageSource.call_count == 1
+        # 다음 달로 넘어가기 전에 캡처를 다시 시작해 이전 달 응답을 버림
+        assert mock_driver.startNetworkCapture.call_count == 2
+
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    @patch("syncManager.bookingCapture.captureMode", "network")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
+    @patch("syncManager.waitForBookingListDom", return_value={"selector": "li", "count": 1})
+    @patch("syncManager._waitForFontRendering", return_value={})
+    def test_empty_captured_list_is_confirmed_with_dom(
+        self, mock_font, mock_wait_for_dom, mock_extract, mock_real_sleep, mock_sleep
+    ):
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {}
+        mock_driver.startNetworkCapture.return_value = True
+        mock_driver.collectNetworkResponses.return_value = [
+            {
+                "url": "https://partner.booking.naver.com/api/bookings",
+                "status": 200,
+                "body": {"data": []},
+            }
+        ]
+        mock_extract.return_value = ([], False)
+
+        with pytest.raises(ReservationLookupError):
+            getNaverReservation(mock_driver, 1)
+
+        mock_extract.assert_called_once()
+
+
+class TestBookingListRange:
+    def test_range_window_spans_month_size_calendar_months(self):
+        assert getBookingRangeWindow(1, datetime.date(2024, 8, 19)) == (
+            datetime.date(2024, 8, 1),
+            datetime.date(2024, 8, 31),
+        )
+        assert getBookingRangeWindow(6, datetime.date(2024, 8, 19)) == (
+            datetime.date(2024, 8, 1),
+            datetime.date(2025, 1, 31),
+        )
+
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("24. 8. 1. ~ 24. 9. 30.", (datetime.date(2024, 8, 1), datetime.date(2024, 9, 30))),
+            ("24. 12. 1. ~ 1. 31.", (datetime.date(2024, 12, 1), datetime.date(2025, 1, 31))),
+            ("2024. 8. 1.(목) ~ 8. 31.(토)", (datetime.date(2024, 8, 1), datetime.date(2024, 8, 31))),
+            ("", None),
+            ("24. 8. 1.", None),
+        ],
+    )
+    def test_parse_period_label(self, label, expected):
+        assert parsePeriodLabel(label) == expected
+
+    @patch("syncManager.getBookingRangeWindow")
+    def test_trim_bookings_to_month_size(self, mock_window):
+        mock_window.return_value = (datetime.date(2024, 8, 1), datetime.date(2024, 8, 31))
+        bookings = [
+            {"reservationNumber": "1", "startDate": "20240831"},
+            {"reservationNumber": "2", "startDate": "20240901"},
+        ]
+
+        notCanceled, allBookings = trimBookingsToMonthSize((bookings, bookings), 1)
+
+        assert [b["reservationNumber"] for b in notCanceled] == ["1"]
+        assert [b["reservationNumber"] for b in allBookings] == ["1"]
+        mock_window.assert_called_once_with(1)
+
+    def _range_page(self, label, body=""):
+        return (
+            f'<html><body><a class="DatePeriodCalendar__date-info" href="#">{label}</a>'
+            f"{body}</body></html>"
+        )
+
+    def test_range_bookings_are_recorded_per_calendar_month(self):
+        bookings = [
+            {"startDate": "20241215"},
+            {"startDate": "20241220"},
+            {"startDate": "20250105"},
+        ]
+
+        with patch("syncManager.metrics.bookingsPerMonth") as mock_histogram:
+            _recordRangeBookingsPerMonth(bookings, datetime.date(2024, 12, 1), 3)
+
+        assert [call.args[0] for call in mock_histogram.observe.call_args_list] == [2, 1, 0]
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    @patch("syncManager.bookingListFetchMode", "range")
+    @patch("syncManager.getBookingRangeWindow")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
+    def test_range_mode_parses_whole_window_once(
+        self, mock_extract, mock_window, mock_real_sleep, mock_sleep
+    ):
+        startDate = datetime.date.today().replace(day=1)
+        endDate = startDate + datetime.timedelta(days=59)
+        mock_window.return_value = (startDate, endDate)
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {}
+        mock_driver.getPageSource.return_value = self._range_page(
+            f"{self._label_date(startDate)} ~ {self._label_date(endDate)}"
+        )
+        future_date = (datetime.date.today() + datetime.timedelta(days=7)).strftime("%Y%m%d")
+        mock_extract.return_value = (
+            [{"reservationNumber": "1", "startDate": future_date}],
+            False,
+        )
+
+        not_canceled, all_bookings = getNaverReservation(mock_driver, 2)
+
+        assert len(all_bookings) == 1
+        mock_extract.assert_called_once()
+        visited = [call.args[0] for call in mock_driver.goTo.call_args_list]
+        assert any(f"startDateTime={startDate.isoformat()}" in url for url in visited)
+        mock_driver.findByXpath.assert_not_called()
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    @patch("syncManager.bookingListFetchMode", "range")
+    @patch("syncManager.getBookingRangeWindow")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
+    def test_range_mode_trims_wider_displayed_period_to_window(
+        self, mock_extract, mock_window, mock_real_sleep, mock_sleep
+    ):
+        startDate = datetime.date.today().replace(day=1)
+        endDate = startDate + datetime.timedelta(days=59)
+        mock_window.return_value = (startDate, endDate)
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {}
+        # 화면에는 구간보다 한 달 넓은 기간이 표시됨
+        mock_driver.getPageSource.return_value = self._range_page(
+            f"{self._label_date(startDate)} ~ {self._label_date(endDate + datetime.timedelta(days=31))}"
+        )
+        inWindow = (datetime.date.today() + datetime.timedelta(days=7)).strftime("%Y%m%d")
+        afterWindow = (endDate + datetime.timedelta(days=10)).strftime("%Y%m%d")
+        mock_extract.return_value = (
+            [
+                {"reservationNumber": "1", "startDate": inWindow},
+                {"reservationNumber": "2", "startDate": afterWindow},
+            ],
+            False,
+        )
+
+        not_canceled, all_bookings = getNaverReservation(mock_driver, 2)
+
+        assert [booking["reservationNumber"] for booking in all_bookings] == ["1"]
+        mock_extract.assert_called_once()
+
+    @staticmethod
+    def _label_date(date: datetime.date) -> str:
+        return f"{date.year % 100}. {date.month}. {date.day}."
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    @patch("syncManager.bookingListFetchMode", "range")
+    @patch("syncManager.getBookingRangeWindow")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
+    def test_range_mode_falls_back_when_period_is_not_applied(
+        self, mock_extract, mock_window, mock_real_sleep, mock_sleep
+    ):
+        mock_window.return_value = (datetime.date(2024, 8, 1), datetime.date(2024, 9, 30))
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {}
+        mock_driver.getPageSource.return_value = self._range_page("24. 8. 1. ~ 8. 31.")
+        future_date = (datetime.date.today() + datetime.timedelta(days=7)).strftime("%Y%m%d")
+        mock_extract.return_value = (
+            [{"reservationNumber": "1", "startDate": future_date}],
+            False,
+        )
+
+        getNaverReservation(mock_driver, 2)
+
+        assert mock_extract.call_count == 2
+        visited = [call.args[0] for call in mock_driver.goTo.call_args_list]
+        assert visited[-1] == "https://partner.booking.naver.com/bizes/899762/booking-list-view"
+
+
+class TestBookingMonthSnapshot:
+    PAGE = (
+        '<a class="DatePeriodCalendar__date-info">24. 8. 1. ~ 8. 31.</a>'
+        '<a class="BookingListView__contents-user"><div>card</div></a>'
+    )
+
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
+    def test_unchanged_month_reuses_stored_bookings(self, mock_parse, tmp_path):
+        from bookingSnapshotStore import BookingSnapshotStore
+        from syncManager import _parseBookingMonth
+
+        store = BookingSnapshotStore(str(tmp_path / "bookings.db"))
+        mock_parse.return_value = ([{"reservationNumber": "1"}], False)
+
+        with patch("syncManager.bookingSnapshotStore.snapshotStore", store):
+            first = _parseBookingMonth(self.PAGE, "booking_list_month_1")
+            second = _parseBookingMonth(self.PAGE, "booking_list_month_1")
+            changed = _parseBookingMonth(
+                self.PAGE.replace("card", "new card"), "booking_list_month_1"
+            )
+
+        assert first == ([{"reservationNumber": "1"}], False)
+        assert second == ([{"reservationNumber": "1"}], False)
+        assert changed == ([{"reservationNumber": "1"}], False)
+        assert mock_parse.call_count == 2
+
+
 class TestWaitForBookingListDom:
     def test_accepts_empty_state_without_ready_selectors(self):
         mock_driver = MagicMock()
@@ -485,6 +878,201 @@ class TestWaitForBookingListDom:
 
         assert result == {"emptyState": True}
 
+    def test_returns_observer_match_without_polling(self):
+        mock_driver = MagicMock()
+        mock_driver.waitForDomMatch.return_value = {
+            "selector": bookingListReadySelectors[0],
+            "count": 3,
+        }
+
+        result = waitForBookingListDom(
+            mock_driver, "test_session", "booking_list_month_1", timeout=1
+        )
+
+        assert result == {"selector": bookingListReadySelectors[0], "count": 3}
+        mock_driver.executeScript.assert_not_called()
+
+    def test_observer_empty_state_text_match(self):
+        mock_driver = MagicMock()
+        mock_driver.waitForDomMatch.return_value = {
+            "text": bookingListExtractor.EMPTY_BOOKING_LIST_MARKERS[0]
+        }
+
+        result = waitForBookingListDom(
+            mock_driver, "test_session", "booking_list_month_1", timeout=1
+        )
+
+        assert result == {"emptyState": True}
+
+    @patch("syncManager.collectPageDiagnostics")
+    def test_observer_timeout_collects_diagnostics(self, mock_collect):
+        mock_driver = MagicMock()
+        mock_driver.waitForDomMatch.return_value = {"timedOut": True}
+
+        result = waitForBookingListDom(
+            mock_driver, "test_session", "booking_list_month_1", timeout=1
+        )
+
+        assert result is None
+        mock_collect.assert_called_once()
+        mock_driver.executeScript.assert_not_called()
+
+
+class TestGetPageState:
+    def test_collects_page_state_in_single_round_trip(self):
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {"browserName": "chrome"}
+        mock_driver.executeScript.return_value = {
+            "currentUrl": "https://partner.booking.naver.com/",
+            "title": "Booking",
+            "readyState": "complete",
+            "fontStatus": "loaded",
+            "userAgent": "UA",
+            "bodyTextPreview": "hello",
+            "hasBookingListEmptyState": False,
+            "selectorCounts": {"bookingListTable": 2},
+            "detectedKeywords": ["captcha"],
+        }
+
+        result = _getPageState(mock_driver)
+
+        mock_driver.executeScript.assert_called_once()
+        mock_driver.getCurrentUrl.assert_not_called()
+        assert result["currentUrl"] == "https://partner.booking.naver.com/"
+        assert result["detectedKeywords"] == ["captcha"]
+        assert set(result["selectorCounts"]) == set(pageStateSelectors)
+        assert result["browserInfo"] == {"browserName": "chrome"}
+
+    def test_falls_back_to_per_field_calls_when_probe_is_unsupported(self):
+        mock_driver = MagicMock()
+        mock_driver.getBrowserInfo.return_value = {}
+        mock_driver.getCurrentUrl.return_value = "https://example.com"
+        mock_driver.getTitle.return_value = "Example"
+
+        def execute_script(script, *args):
+            if "document.querySelectorAll(arguments[0])" in script:
+                return 1
+            if "document.body ? document.body.innerText" in script:
+                return "본인확인 필요"
+            return None
+
+        mock_driver.executeScript.side_effect = execute_script
+
+        result = _getPageState(mock_driver)
+
+        assert result["currentUrl"] == "https://example.com"
+        assert result["detectedKeywords"] == ["본인확인"]
+        assert all(count == 1 for count in result["selectorCounts"].values())
+
+
+class TestLoginSession:
+    @patch("syncManager.performLogin")
+    @patch("syncManager.checkLoginSession")
+    def test_cached_session_skips_naver_main(self, mock_check_session, mock_login):
+        mock_driver = MagicMock()
+
+        with patch("syncManager.loginSession.loginSessionManager") as mock_manager:
+            mock_manager.check.return_value = True
+            ensureLoginSession(mock_driver)
+
+        mock_check_session.assert_not_called()
+        mock_login.assert_not_called()
+        mock_driver.goTo.assert_not_called()
+
+    @patch("syncManager.performLogin")
+    @patch("syncManager.checkLoginSession", return_value=False)
+    def test_unreadable_cookies_fall_back_to_page_check(self, mock_check_session, mock_login):
+        mock_driver = MagicMock()
+
+        with patch("syncManager.loginSession.loginSessionManager") as mock_manager:
+            mock_manager.check.return_value = None
+            ensureLoginSession(mock_driver)
+
+        mock_check_session.assert_called_once_with(mock_driver)
+        mock_login.assert_called_once_with(mock_driver)
+
+    @patch("syncManager.performLogin")
+    @patch("syncManager.checkLoginSession")
+    def test_shared_cookies_avoid_second_login(self, mock_check_session, mock_login):
+        mock_driver = MagicMock()
+        mock_driver.importCookies.return_value = True
+        cookies = [{"name": "NID_AUT", "value": "a", "domain": ".naver.com"}]
+
+        with patch("syncManager.loginSession.loginSessionManager") as mock_manager, patch(
+            "syncManager.cookieStore.cookieStore"
+        ) as mock_store:
+            mock_manager.check.side_effect = [False, True]
+            mock_store.isEnabled.return_value = True
+            mock_store.load.return_value = cookies
+            ensureLoginSession(mock_driver)
+
+        mock_driver.importCookies.assert_called_once_with(cookies)
+        mock_login.assert_not_called()
+
+    @patch("syncManager.performLogin")
+    def test_disabled_cookie_store_logs_in(self, mock_login):
+        mock_driver = MagicMock()
+
+        with patch("syncManager.loginSession.loginSessionManager") as mock_manager, patch(
+            "syncManager.cookieStore.cookieStore"
+        ) as mock_store:
+            mock_manager.check.return_value = False
+            mock_store.isEnabled.return_value = False
+            ensureLoginSession(mock_driver)
+
+        mock_driver.importCookies.assert_not_called()
+        mock_login.assert_called_once_with(mock_driver)
+
+    @patch("syncManager.id", "test_id")
+    @patch("syncManager.pw", "test_pw")
+    @patch("syncManager.randomSleep")
+    @patch("syncManager.randomRealSleep")
+    def test_login_exports_cookies(self, mock_real_sleep, mock_sleep):
+        mock_driver = MagicMock()
+        mock_driver.exportCookies.return_value = [{"name": "NID_AUT"}]
+
+        with patch("syncManager.cookieStore.cookieStore") as mock_store:
+            mock_store.isEnabled.return_value = True
+            performLogin(mock_driver)
+
+        mock_store.save.assert_called_once_with([{"name": "NID_AUT"}])
+
+    @patch("syncManager.performLogin")
+    def test_login_redirect_triggers_relogin(self, mock_login):
+        mock_driver = MagicMock()
+        mock_driver.getCurrentUrl.return_value = "https://nid.naver.com/nidlogin.login"
+
+        with patch("syncManager.loginSession.loginSessionManager") as mock_manager:
+            goToPartnerPage(mock_driver, "https://partner.booking.naver.com/x")
+
+        mock_manager.invalidate.assert_called_once_with(mock_driver)
+        mock_login.assert_called_once_with(mock_driver)
+        assert mock_driver.goTo.call_count == 2
+
+    @patch("syncManager.performLogin")
+    def test_partner_page_without_redirect(self, mock_login):
+        mock_driver = MagicMock()
+        mock_driver.getCurrentUrl.return_value = "https://partner.booking.naver.com/x"
+
+        goToPartnerPage(mock_driver, "https://partner.booking.naver.com/x")
+
+        mock_login.assert_not_called()
+        mock_driver.goTo.assert_called_once()
+
+
+class TestReservationLookupErrorType:
+    @pytest.mark.parametrize(
+        "reason,expected",
+        [
+            ("security or verification page detected: 보안", "security_check"),
+            ("booking list DOM wait timed out at booking_list_month_2", "dom_timeout"),
+            ("next calendar button is disabled at booking_list_month_1", "calendar_button"),
+            ("something unexpected", "other"),
+        ],
+    )
+    def test_error_type_from_reason(self, reason, expected):
+        assert ReservationLookupError(reason, "sid").errorType == expected
+
 
 class TestRoomType:
     def test_room_type_enum_values(self):
@@ -504,7 +1092,7 @@ class TestDriverOwnership:
     @patch("syncManager.pw", "test_pw")
     @patch("syncManager.randomSleep")
     @patch("syncManager.randomRealSleep")
-    @patch("syncManager.bookingListExtractor.extractBookingList")
+    @patch("syncManager.bookingListExtractor.parseBookingListPage")
     def test_get_naver_reservation_does_not_close_driver_on_success(
         self, mock_extract, mock_real_sleep, mock_sleep
     ):
@@ -518,13 +1106,13 @@ class TestDriverOwnership:
             datetime.timezone(datetime.timedelta(hours=9), "Asia/Seoul")
         ) + datetime.timedelta(days=7)
         future_date_str = future_date.strftime("%Y%m%d")
-        mock_extract.return_value = [
+        mock_extract.return_value = ([
             {
                 "reservationNumber": "12345",
                 "startDate": future_date_str,
                 "status": "confirmed",
             }
-        ]
+        ], False)
 
         getNaverReservation(mock_driver, 1)
 